@@ -0,0 +1,133 @@
+"""
+Per-horizon (24 pipelines) vs global (one booster per horizon group / one overall) LightGBM benchmark.
+Same selector hyperparameters on both sides (no Optuna search) : training time, bundle size,
+inference latency and test RMSE (MWh) per mode.
+
+Usage :
+    python benchmark_global_engine.py
+"""
+#%%
+# Libraries
+import os
+import time
+from pathlib import Path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+os.chdir(PROJECT_ROOT)
+from src.pipelines.training_pipeline import SolarTrainingOrchestrator
+from src.pipelines.global_training_pipeline import SolarGlobalTrainingOrchestrator
+from src.etl import processors, horizons
+from src.models import model_wrappers
+from src.utils import metrics
+from src.utils.config import settings
+from src.utils.logger import setup_logging
+import cloudpickle
+import joblib
+import numpy as np
+import pandas as pd
+
+SELECTOR_PARAMETERS = {
+    "lgbm_params": {
+        'num_leaves': 61,
+        'max_depth': -1,
+        'learning_rate': 0.01,
+        'n_estimators': 500,
+        'min_child_samples': 20,
+        'verbosity': -1,
+        'random_state': 42,
+        'importance_type': 'gain',
+        'n_jobs': -1,
+    },
+    "threshold": 0.95,
+}
+
+def denormalized_predictions(meta_model, X: pd.DataFrame) -> pd.DataFrame:
+    """Wrapper outputs (normalized) back to MWh with the processor of each horizon"""
+
+    predictions = meta_model.predict(X)
+    if isinstance(meta_model, model_wrappers.GlobalMultiHorizonLGBMWrapper):
+        processors_by_key = {f'+{h}h': group.processor for group in meta_model.group_models for h in group.horizons}
+    else:
+        processors_by_key = {key: pipe.named_steps['processor'] for key, pipe in meta_model.models_dict.items()}
+
+    return pd.DataFrame(
+        {key: processors_by_key[key].inverse_transform_y(predictions[key].to_numpy(), X.index) for key in predictions},
+        index=X.index
+    )
+
+def test_rmse(meta_model, X_test: pd.DataFrame, y_test: pd.Series, n_horizons: int) -> float:
+    """Mean RMSE (MWh) over the horizons on the test set"""
+
+    predictions = denormalized_predictions(meta_model, X_test)
+    target_matrix = horizons.horizon_target_matrix(y_test, n_horizons)
+    scores = []
+    for horizon in range(1, n_horizons + 1):
+        X_h, y_h = horizons.align_horizon(X_test, y_test, horizon, target_matrix=target_matrix)
+        scores.append(metrics.rmse(y_h, predictions.loc[X_h.index, f'+{horizon}h']))
+
+    return float(np.mean(scores))
+
+def latency_ms(meta_model, X: pd.DataFrame, n_runs: int = 50) -> float:
+    """Median latency of a single-row prediction (production call)"""
+
+    timings = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        meta_model.predict(X.iloc[-1:])
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return float(np.median(timings))
+
+def benchmark(name: str, train, build_meta_model, X_test, y_test, n_horizons) -> dict:
+    start = time.perf_counter()
+    train()
+    fit_seconds = time.perf_counter() - start
+    meta_model = build_meta_model()
+
+    return {
+        "mode": name,
+        "fit_seconds": fit_seconds,
+        "bundle_mb": len(cloudpickle.dumps(meta_model)) / 1e6,
+        "latency_ms": latency_ms(meta_model, X_test),
+        "test_rmse": test_rmse(meta_model, X_test, y_test, n_horizons),
+    }
+
+if __name__ == "__main__":
+    setup_logging()
+    meteo_features = joblib.load(PROJECT_ROOT / "data/processed/features/meteo_features.pkl")
+
+    instance_artifact = processors.LGBMDataloader(
+        url=settings.supabase_url.get_secret_value(),
+        key=settings.supabase_key.get_secret_value(),
+        )
+    X_train, X_test, y_train, y_test = instance_artifact.run(
+        bucket_name=settings.training_bucket_name.get_secret_value(),
+        file_path="latest_dataset.parquet")
+
+    common = dict(
+        config=settings,
+        meteo_features=meteo_features,
+        selector_parameters=SELECTOR_PARAMETERS,
+        experiment_name="LGBM_Global_Benchmark",
+        async_logging=False,
+    )
+    per_horizon = SolarTrainingOrchestrator(**common)
+    global_groups = SolarGlobalTrainingOrchestrator(**common, group_mode="groups")
+    global_single = SolarGlobalTrainingOrchestrator(**common, group_mode="single")
+
+    def train_per_horizon():
+        # Selector hyperparameters for every horizon (no search, as the global mode)
+        params = {**per_horizon._cast_search_params(SELECTOR_PARAMETERS["lgbm_params"]), "n_estimators": 500}
+        for horizon in range(1, per_horizon.n_horizons + 1):
+            X_h, y_h = per_horizon._prepare_horizon_data(X_train, y_train, horizon)
+            set_name, selector_parameters = per_horizon._selector_parameters_for(horizon)
+            result = per_horizon._fit_final_pipeline(X_h, y_h, horizon, set_name, selector_parameters, np.nan, params)
+            per_horizon.models_dict[f'+{horizon}h'] = result.model
+
+    results = pd.DataFrame([
+        benchmark("per_horizon", train_per_horizon, per_horizon._build_meta_model, X_test, y_test, per_horizon.n_horizons),
+        benchmark("global_groups", lambda: global_groups.run_training_pipeline(X_train, y_train), global_groups._build_meta_model, X_test, y_test, global_groups.n_horizons),
+        benchmark("global_single", lambda: global_single.run_training_pipeline(X_train, y_train), global_single._build_meta_model, X_test, y_test, global_single.n_horizons),
+    ])
+    print(results.to_string(index=False))
+    results.to_csv(PROJECT_ROOT / "data/benchmark_global_engine.csv", index=False)
+# %%
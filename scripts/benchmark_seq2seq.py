@@ -0,0 +1,100 @@
+"""
+Seq2seq encoder/decoder benchmark on CPU : LSTM vs GRU vs dilated TCN.
+Synthetic windows (speed does not depend on the values) : training epochs/sec and samples/sec,
+median single-window inference latency, parameter count.
+
+Usage :
+    python benchmark_seq2seq.py --seq-length 168 --threads 4
+"""
+#%%
+# Libraries
+import os
+import time
+import argparse
+from pathlib import Path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+os.chdir(PROJECT_ROOT)
+from src.models import architectures
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+
+def train_epoch_seconds(model: nn.Module, X_past: torch.Tensor, X_future: torch.Tensor, Y: torch.Tensor, batch_size: int) -> float:
+    """One training epoch (forward, backward, Adam step) over the synthetic windows"""
+
+    criterion = nn.MSELoss()
+    optimizer = torch.optim.Adam(model.parameters(), lr=1e-3)
+    model.train()
+
+    start = time.perf_counter()
+    for i in range(0, len(X_past), batch_size):
+        optimizer.zero_grad(set_to_none=True)
+        loss = criterion(model(X_past[i:i + batch_size], X_future[i:i + batch_size]), Y[i:i + batch_size])
+        loss.backward()
+        optimizer.step()
+
+    return time.perf_counter() - start
+
+def latency_ms(model: nn.Module, X_past: torch.Tensor, X_future: torch.Tensor, n_runs: int = 200) -> float:
+    """Median latency of one window (production call)"""
+
+    model.eval()
+    timings = []
+    with torch.inference_mode():
+        for _ in range(n_runs):
+            start = time.perf_counter()
+            model(X_past[:1], X_future[:1])
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return float(np.median(timings))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seq-length", type=int, default=168)
+    parser.add_argument("--output-len", type=int, default=24)
+    parser.add_argument("--n-windows", type=int, default=4096)
+    parser.add_argument("--encoder-features", type=int, default=20)
+    parser.add_argument("--decoder-features", type=int, default=15)
+    parser.add_argument("--hidden-size", type=int, default=64)
+    parser.add_argument("--num-layers", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(42)
+
+    X_past = torch.randn(args.n_windows, args.seq_length, args.encoder_features + 1)
+    X_future = torch.randn(args.n_windows, args.output_len, args.decoder_features)
+    Y = torch.randn(args.n_windows, args.output_len, 1)
+
+    rows = []
+    for architecture in architectures.ARCHITECTURES:
+        model = architectures.Seq2seq(
+            past_features_length=args.encoder_features + 1,
+            future_features_length=args.decoder_features,
+            hidden_size=args.hidden_size,
+            num_layers=args.num_layers,
+            output_len=args.output_len,
+            dropout=0.1,
+            architecture=architecture,
+        )
+        epoch_seconds = np.median([
+            train_epoch_seconds(model, X_past, X_future, Y, args.batch_size) for _ in range(args.epochs)
+        ])
+        rows.append({
+            "architecture": architecture,
+            "n_parameters": sum(p.numel() for p in model.parameters()),
+            "epochs_per_sec": 1 / epoch_seconds,
+            "samples_per_sec": args.n_windows / epoch_seconds,
+            "latency_ms": latency_ms(model, X_past, X_future),
+        })
+
+    results = pd.DataFrame(rows)
+    print(f"{torch.get_num_threads()} threads, seq_length={args.seq_length}, {args.n_windows} windows")
+    print(results.to_string(index=False))
+    results.to_csv(PROJECT_ROOT / "data/benchmark_seq2seq.csv", index=False)
+# %%
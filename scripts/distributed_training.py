@@ -0,0 +1,101 @@
+"""
+Distributed 24h training : workers share an Optuna journal on a network filesystem,
+a coordinator collects the pipelines and logs the meta model.
+
+Usage (one fresh workspace directory per training run) :
+    python distributed_training.py worker --workspace /mnt/shared/run_2026_10_19
+    python distributed_training.py coordinator --workspace /mnt/shared/run_2026_10_19
+    python distributed_training.py local --workspace /tmp/run --n-workers 3   # nodes simulated by processes
+"""
+#%%
+# Libraries
+import os
+import argparse
+import multiprocessing as mp
+from pathlib import Path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent # Stable when re-imported by spawned workers
+os.chdir(PROJECT_ROOT)
+from src.pipelines.training_pipeline import SolarTrainingOrchestrator
+from src.etl import processors
+from src.utils.config import settings
+from src.utils.logger import setup_logging
+import joblib
+
+SELECTOR_PARAMETERS = {
+    "lgbm_params": {
+        'num_leaves': 61,
+        'max_depth': -1,
+        'learning_rate': 0.01,
+        'n_estimators': 500,
+        'min_child_samples': 20,
+        'verbosity': -1,
+        'random_state': 42,
+        'importance_type': 'gain',
+        'n_jobs': -1,
+    },
+    "threshold": 0.95,
+}
+
+def build_orchestrator(workers_per_node: int | None = None) -> SolarTrainingOrchestrator:
+    orchestrator = SolarTrainingOrchestrator(
+        config=settings,
+        selector_parameters=SELECTOR_PARAMETERS,
+        meteo_features=joblib.load(PROJECT_ROOT / "data/processed/features/meteo_features.pkl"),
+        experiment_name="LGBM_Model_1.7-founder_edition",
+        num_trials=25,
+        dataset_cache_dir=str(PROJECT_ROOT / "data/cache/lgbm_datasets"),
+    )
+    if workers_per_node is not None:
+        orchestrator.use_threads(orchestrator.thread_budget.allocate("distributed", n_workers=workers_per_node))
+
+    return orchestrator
+
+def load_training_data():
+    instance_artifact = processors.LGBMDataloader(
+        url=settings.supabase_url.get_secret_value(),
+        key=settings.supabase_key.get_secret_value(),
+        )
+    return instance_artifact.run(
+        bucket_name=settings.training_bucket_name.get_secret_value(),
+        file_path="latest_dataset.parquet")
+
+def worker_main(workspace: str, workers_per_node: int) -> None:
+    setup_logging()
+    X_train, _, y_train, _ = load_training_data()
+    build_orchestrator(workers_per_node=workers_per_node).run_worker(X_train=X_train, y_train=y_train, workspace_dir=workspace)
+
+def coordinator_main(workspace: str, poll_interval: float) -> None:
+    X_train, _, _, _ = load_training_data()
+    build_orchestrator().run_coordinator(workspace_dir=workspace, X_sample=X_train.iloc[:3], poll_interval=poll_interval)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("role", choices=["worker", "coordinator", "local"])
+    parser.add_argument("--workspace", required=True)
+    parser.add_argument("--n-workers", type=int, default=2)
+    parser.add_argument("--workers-per-node", type=int, default=1) # Thread budget share of each worker
+    parser.add_argument("--poll-interval", type=float, default=30)
+    args = parser.parse_args()
+
+    if args.role == "worker":
+        worker_main(args.workspace, args.workers_per_node)
+
+    elif args.role == "coordinator":
+        setup_logging()
+        coordinator_main(args.workspace, args.poll_interval)
+
+    else:
+        # Local test : worker processes stand in for nodes, coordinator in the main process
+        setup_logging()
+        ctx = mp.get_context("spawn")
+        workers = [
+            ctx.Process(target=worker_main, args=(args.workspace, args.n_workers))
+            for _ in range(args.n_workers)
+        ]
+        for process in workers:
+            process.start()
+
+        coordinator_main(args.workspace, poll_interval=5)
+        for process in workers:
+            process.join()
+# %%
@@ -0,0 +1,69 @@
+"""
+Out-of-core 24h training : the training artifact is read as parquet partitions (one file per period,
+row groups streamed into LightGBM) instead of one in-memory DataFrame.
+
+Usage :
+    python out_of_core_training.py --prefix partitions/latest
+"""
+#%%
+# Libraries
+import os
+import argparse
+from pathlib import Path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+os.chdir(PROJECT_ROOT)
+from src.pipelines.training_pipeline import SolarTrainingOrchestrator
+from src.etl import processors
+from src.training.out_of_core import ParquetPartitions
+from src.utils.config import settings
+from src.utils.logger import setup_logging
+import joblib
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prefix", default="partitions/latest")
+    parser.add_argument("--sample-rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    setup_logging()
+
+    # 1 - Partitions to local disk (no concatenation)
+    instance_artifact = processors.LGBMDataloader(
+        url=settings.supabase_url.get_secret_value(),
+        key=settings.supabase_key.get_secret_value(),
+        )
+    partition_paths = instance_artifact.download_parquet_partitions(
+        bucket_name=settings.training_bucket_name.get_secret_value(),
+        prefix=args.prefix,
+        local_dir=str(PROJECT_ROOT / "data/cache/partitions"))
+
+    # 2 - Training
+    training_orchestrator_instance = SolarTrainingOrchestrator(
+        config=settings,
+        selector_parameters={
+            "lgbm_params": {
+                'num_leaves': 61,
+                'max_depth': -1,
+                'learning_rate': 0.01,
+                'n_estimators': 500,
+                'min_child_samples': 20,
+                'verbosity': -1,
+                'random_state': 42,
+                'importance_type': 'gain',
+                'n_jobs': -1,
+            },
+            "threshold": 0.95,
+        },
+        meteo_features=joblib.load(PROJECT_ROOT / "data/processed/features/meteo_features.pkl"),
+        experiment_name="LGBM_Model_1.7-founder_edition",
+    )
+    training_orchestrator_instance.run_out_of_core_training_pipeline(
+        partition_paths=partition_paths, 
+        sample_rows=args.sample_rows
+    )
+
+    # 3 - Final meta-model packaging
+    partitions = ParquetPartitions(partition_paths)
+    X_sample = partitions.read_rows(0, 3, partitions.feature_columns)
+    training_orchestrator_instance.package_and_log_meta_model(X_sample=X_sample)
+# %%
@@ -1,6 +1,7 @@
 #%%
 # Libraries
 import os
+import sys
 from pathlib import Path
 PROJECT_ROOT = Path().resolve().parent
 os.chdir(PROJECT_ROOT)
@@ -9,6 +10,7 @@ from src.etl import processors
 from src.utils.config import settings
 from src.utils.logger import setup_logging
 import joblib
+import pandas as pd
 
 if __name__ == "__main__":
     meteo_features = joblib.load(PROJECT_ROOT / "data/processed/features/meteo_features.pkl")
@@ -42,11 +44,43 @@ if __name__ == "__main__":
         },
         meteo_features=meteo_features,
         experiment_name="LGBM_Model_1.7-founder_edition",
-        num_trials=25
+        num_trials=25,
+        warm_num_trials=10,
+        dataset_cache_dir=str(PROJECT_ROOT / "data/cache/lgbm_datasets"),
+        checkpoint_dir=str(PROJECT_ROOT / "data/checkpoints/lgbm_training"),
+        daylight_only="--daylight" in sys.argv, # Night targets dropped, predicted as 0
     )
 
-    # 3 - 24h training
-    training_orchestrator_instance.run_training_pipeline(X_train=X_train, y_train=y_train)
+    # 3bis - Fast refresh : continue the champion boosters on the appended rows, gated on the test set
+    if "--refit" in sys.argv:
+        training_orchestrator_instance.run_refit_pipeline(
+            X_train=X_train, 
+            y_train=y_train,
+            X_holdout=X_test,
+            y_holdout=y_test,
+        )
+        sys.exit(0)
+
+    # 3ter - Drift-gated retraining : only the horizons drifting on the test period are retrained (on all rows)
+    if "--drift-retrain" in sys.argv:
+        training_orchestrator_instance.run_drift_retrain_pipeline(
+            X_train=pd.concat([X_train, X_test]), 
+            y_train=pd.concat([y_train, y_test]),
+            X_recent=X_test,
+            y_recent=y_test,
+        )
+        sys.exit(0)
+
+    # 3 - 24h training (--fast : champion hyperparameters, search only on degraded horizons)
+    if "--fast" in sys.argv:
+        training_orchestrator_instance.run_fast_retrain_pipeline(X_train=X_train, y_train=y_train)
+
+    else:
+        training_orchestrator_instance.run_training_pipeline(
+            X_train=X_train, 
+            y_train=y_train,
+            resume="--resume" in sys.argv, # Restart a crashed run from its last finished horizon
+        )
 
     # 4 - Final meta-model packaging
     training_orchestrator_instance.package_and_log_meta_model(X_sample=X_train.iloc[:3])
@@ -2,20 +2,21 @@
 import pandas as pd
 import numpy as np
 import torch
-from torch.utils.data import DataLoader, TensorDataset
-from src.etl import processors
+from torch.utils.data import DataLoader, Dataset, BatchSampler, SequentialSampler
+from src.etl import processors, horizons
 
 # Utils
-from typing import Tuple, List, Any
+from typing import Tuple, List, Any, Optional
 
-def prepare_horizon_data(X: pd.DataFrame, y: pd.Series, horizon: int) -> Tuple[pd.DataFrame, pd.Series]:
-    """Return shift + alignment for a given horizon"""
-    
-    # Init
-    y_shifted = y.shift(-horizon).dropna()
-    X_aligned = X.loc[y_shifted.index]
+def prepare_horizon_data(
+        X: pd.DataFrame, 
+        y: pd.Series, 
+        horizon: int, 
+        target_matrix: Optional[np.ndarray] = None
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+    """Return shift + alignment for a given horizon (positional views, target_matrix shared across horizons)"""
 
-    return X_aligned, y_shifted
+    return horizons.align_horizon(X, y, horizon, target_matrix=target_matrix)
 
 def prepare_lstm_data(
     X: pd.DataFrame,
@@ -60,8 +61,7 @@ def prepare_lstm_data(
     y_train, y_val = y.iloc[:split_idx], y.iloc[split_idx:]
  
     # Preprocessing
-    all_lstm_features = list(set(encoder_features) | set(decoder_features))
-    processor = processors.SolarDataProcessor(meteo_features=meteo_features, selected_features=all_lstm_features)  
+    processor = processors.SolarDataProcessor(meteo_features=meteo_features)  
     processor.fit(X_train, y_train)
     
     # Scaling
@@ -99,6 +99,65 @@ def prepare_lstm_data(
  
     return train_dl, val_dl, processor, X_example, y_past_example
 
+class SlidingWindowDataset(Dataset):
+    """
+    Lazy seq2seq windows over one contiguous float32 tensor (features + target, built once).
+    Indexed by a list of window ids (one call per batch, see to_dataloader) : the (batch x length x features)
+    encoder / decoder / target tensors are gathered on demand, memory stays at the size of the data.
+    """
+
+    def __init__(
+            self,
+            features: pd.DataFrame,
+            target: pd.Series,
+            encoder_features: List[str],
+            decoder_features: List[str],
+            seq_length: int,
+            seq_future_length: int,
+            stride: int = 1,
+        ):
+        columns = list(dict.fromkeys([*encoder_features, *decoder_features]))
+        missing = [col for col in columns if col not in features.columns]
+        if missing:
+            raise ValueError(f"Encoder/decoder features {missing} missing from the training frame.")
+        if len(target) != len(features):
+            raise ValueError(f"Target and features must be row aligned ({len(target)} != {len(features)} rows)")
+
+        values = np.empty((len(features), len(columns) + 1), dtype=np.float32)
+        values[:, :-1] = features[columns].to_numpy(dtype=np.float32)
+        values[:, -1] = np.asarray(target, dtype=np.float32)
+        self.values = torch.from_numpy(values)
+
+        # encoder : features autorégressives + cycliques + y / decoder : prévisions + encodages cycliques
+        target_col = len(columns)
+        self.past_cols = torch.tensor([columns.index(f) for f in encoder_features] + [target_col])
+        self.future_cols = torch.tensor([columns.index(f) for f in decoder_features])
+        self.target_col = target_col
+
+        self.past_offsets = torch.arange(seq_length)
+        self.future_offsets = torch.arange(seq_length, seq_length + seq_future_length)
+        self.starts = torch.arange(0, max(len(features) - seq_length - seq_future_length + 1, 0), stride)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, idx) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """idx : window id (single sample) or list of window ids (batch)"""
+
+        starts = self.starts[torch.as_tensor(idx)]
+        single = starts.dim() == 0
+        starts = starts.reshape(-1, 1)
+
+        rows_past = (starts + self.past_offsets).unsqueeze(-1)
+        rows_future = (starts + self.future_offsets).unsqueeze(-1)
+        X_past = self.values[rows_past, self.past_cols]
+        X_future = self.values[rows_future, self.future_cols]
+        y_target = self.values[rows_future, self.target_col] # (batch x output_len x 1)
+
+        if single:
+            return X_past[0], X_future[0], y_target[0]
+        return X_past, X_future, y_target
+
 def to_dataloader(
         training_dataset: pd.DataFrame, 
         encoder_features: List[str],
@@ -124,44 +183,22 @@ def to_dataloader(
         stride: sequence step
 
     Returns:
-        Dataloader: Inference Tensor
+        Dataloader: batches (X_past, X_future, y_target) built lazily by SlidingWindowDataset
   
    """
 
-    #Init
-    L_total = training_dataset.shape[0]
-    total_window_length = seq_length + seq_future_length
-    indices = np.arange(0, L_total-total_window_length+1, stride, dtype=int)
-
-    # Découpage des indices
-    indices_past = indices[:, None] + np.arange(seq_length) 
-    indices_future = indices[:, None] + np.arange(seq_length, (seq_length+seq_future_length)) 
-    
-    # encoder: (features autorégressives + cycliques + y)
-    partial_encoder = training_dataset[encoder_features]
-    encoder_dataset = pd.concat([partial_encoder, target], axis=1)
-    X_past = torch.tensor(
-        encoder_dataset.values[indices_past], dtype=torch.float32
-    )
-
-    # eecoder: futur (prévisions + encodages cycliques)
-    X_future = torch.tensor(
-        training_dataset[decoder_features].values[indices_future], dtype=torch.float32
+    dataset = SlidingWindowDataset(
+        features=training_dataset,
+        target=target,
+        encoder_features=encoder_features,
+        decoder_features=decoder_features,
+        seq_length=seq_length,
+        seq_future_length=seq_future_length,
+        stride=stride,
     )
 
-    # target
-    y_target = torch.tensor(
-        target.values[indices_future], dtype=torch.float32
-    ).unsqueeze(-1)
-
-    # Tensor final
-    final_dataset = TensorDataset(X_past, X_future, y_target)
-    dataloader = DataLoader(final_dataset, batch_size=batch_size, shuffle=False)
-    
-    # Asserts
-    assert X_past.shape[2]   == len(encoder_features) + 1, \
-        f"Encoder shape mismatch: {X_past.shape[2]} - {len(encoder_features) + 1}"
-    assert X_future.shape[2] == len(decoder_features), \
-        f"Decoder shape mismatch: {X_future.shape[2]} - {len(decoder_features)}"
+    # Un appel au dataset par batch (fenêtres construites à la demande)
+    batch_sampler = BatchSampler(SequentialSampler(dataset), batch_size=batch_size, drop_last=False)
+    dataloader = DataLoader(dataset, sampler=batch_sampler, batch_size=None)
     
-    return dataloader
\ No newline at end of file
+    return dataloader
@@ -0,0 +1,50 @@
+# Direct multi-horizon alignment
+# Targets of every horizon are strided views of one padded array, features are positional slices of X
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Utils
+from typing import Optional, Tuple
+
+def horizon_target_matrix(y: pd.Series, n_horizons: int) -> np.ndarray:
+    """
+    Return the (n, n_horizons) read-only matrix M[t, h-1] = y[t+h] (NaN past the end).
+    Built once : a strided view on y padded with n_horizons NaN, no per-horizon copy.
+    """
+
+    padded = np.concatenate([y.to_numpy(dtype=np.float64), np.full(n_horizons, np.nan)])
+
+    return sliding_window_view(padded, n_horizons + 1)[:len(y), 1:]
+
+def align_horizon(
+        X: pd.DataFrame,
+        y: pd.Series,
+        horizon: int,
+        target_matrix: Optional[np.ndarray] = None,
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Positional equivalent of y.shift(-horizon).dropna() / X.loc[...] : rows t with a known y[t+h].
+    Without missing targets, X is a leading row slice (view) and y a column view of the target matrix.
+    Missing targets fall back to a boolean mask (copy).
+    """
+
+    if len(X) != len(y):
+        raise ValueError(f"X and y must be row aligned ({len(X)} != {len(y)} rows)")
+
+    if target_matrix is None or target_matrix.shape[1] < horizon:
+        target_matrix = horizon_target_matrix(y, horizon)
+
+    n_aligned = max(len(y) - horizon, 0)
+    targets = target_matrix[:n_aligned, horizon - 1]
+    known = ~np.isnan(targets)
+
+    if known.all():
+        X_aligned = X.iloc[:n_aligned]
+        y_aligned = pd.Series(targets, index=X_aligned.index, name=y.name, copy=False)
+    else:
+        X_aligned = X.iloc[:n_aligned][known]
+        y_aligned = pd.Series(targets[known], index=X_aligned.index, name=y.name)
+
+    return X_aligned, y_aligned
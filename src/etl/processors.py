@@ -7,9 +7,11 @@ import numpy as np
 import lightgbm as lgb
 import logging
 import io
+import os
 from supabase import create_client, Client
 
 # utils
+from src.etl import horizons
 from typing import List, Optional, Dict, Any, Tuple
 
 class SolarDataProcessor(BaseEstimator, TransformerMixin):
@@ -25,11 +27,13 @@ class SolarDataProcessor(BaseEstimator, TransformerMixin):
             window_days: float = 90, 
             quantile: float = 0.99,
             annot: str = "solaire", 
+            time_window: bool = False,
             ):
         
         self.meteo_features = meteo_features
         self.window_days = window_days
         self.quantile = quantile
+        self.time_window = time_window # Rows with gaps (daylight only) : window of window_days, not window_days*24 rows
         self.meteo_scaler = MinMaxScaler()
         self.annot = annot
 
@@ -38,16 +42,25 @@ class SolarDataProcessor(BaseEstimator, TransformerMixin):
             y: pd.Series) -> pd.Series:
         
         """Return the 99th rolling quantile on window days"""
-        
-        window_hours = int(self.window_days * 24)
+
+        window = pd.Timedelta(days=self.window_days) if self.time_window else int(self.window_days * 24)
 
         return ( y
-                .rolling(window=window_hours, min_periods=24)
+                .rolling(window=window, min_periods=24)
                 .quantile(self.quantile)
                 .bfill()
                 .astype(np.float32)
         )
         
+    def _fit_denominators(self, y: pd.Series):
+        """Rolling quantile denominators of the target history and last denominator (prod)"""
+
+        full_denominators = self._rolling_quantile(y)
+        self.denominator_series_ = full_denominators[~full_denominators.index.duplicated(keep='last')] # Eviter les doubles index
+        self.last_denominator_ = float(full_denominators.iloc[-1])
+
+        return self
+
     def fit(self, X: pd.DataFrame, y: pd.Series):
         
         # Meteo features fit
@@ -57,12 +70,28 @@ class SolarDataProcessor(BaseEstimator, TransformerMixin):
 
         if y is not None:   
             # Quantile fit
-            full_denominators = self._rolling_quantile(y)
-            self.denominator_series_ = full_denominators[~full_denominators.index.duplicated(keep='last')] # Eviter les doubles index
-            self.last_denominator_ = float(full_denominators.iloc[-1])
+            self._fit_denominators(y)
 
         return self
     
+    def partial_fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
+        """
+        Incremental MinMax fit on a chunk of rows (out-of-core training). 
+        Target denominators are set separately with update_target_scaling
+        """
+        self.effective_meteo_features_ = [f for f in self.meteo_features if f in X.columns]
+        if self.effective_meteo_features_:
+            self.meteo_scaler.partial_fit(X[self.effective_meteo_features_])
+
+        return self
+
+    def update_target_scaling(self, y: pd.Series):
+        """
+        Recompute the rolling quantile denominators on an extended target history, 
+        the meteo scaler is kept (incremental refits continue boosters trained on its scale)
+        """
+        return self._fit_denominators(y)
+    
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
 
         X_res = X.copy()
@@ -136,12 +165,12 @@ class LGBMFeatureSelector(BaseEstimator, TransformerMixin):
         """Train a LGBM model for each horizon to memorize best features set respectively"""
 
         all_selected_set = set()
+        target_matrix = horizons.horizon_target_matrix(y, max(self.horizons))
 
         for horizon in self.horizons:
             
-            # Temporal alignment
-            y_shifted = y.shift(-horizon).dropna()
-            X_aligned = X.loc[y_shifted.index]
+            # Temporal alignment (positional views of X and of the target matrix)
+            X_aligned, y_shifted = horizons.align_horizon(X, y, horizon, target_matrix=target_matrix)
 
             # Training
             model = lgb.LGBMRegressor(**self.lgbm_params)
@@ -220,6 +249,39 @@ class LGBMDataloader:
             logging.error(f"[ERROR] Fail downloading artifact from Supabase : {str(e)}")
             raise RuntimeError(f"Cannot proceed to artifact recuperation  : {e}")
     
+    def download_parquet_partitions(
+        self,
+        bucket_name: str,
+        prefix: str,
+        local_dir: str,
+        ) -> List[str]:
+        """
+        Download the parquet partitions under a bucket prefix to local files, one partition at a time
+        (never concatenated in memory). Return the local paths in chronological (name) order.
+        """
+
+        os.makedirs(local_dir, exist_ok=True)
+        try:
+            entries = self.client.storage.from_(bucket_name).list(prefix)
+            names = sorted(e["name"] for e in entries if e["name"].endswith(".parquet"))
+            logging.info(f"Downloading {len(names)} partitions from Supabase...")
+
+            paths = []
+            for name in names:
+                local_path = os.path.join(local_dir, name)
+                if not os.path.exists(local_path): # Immutable partitions : downloaded once
+                    response_bytes = self.client.storage.from_(bucket_name).download(path=f"{prefix}/{name}")
+                    with open(local_path, "wb") as f:
+                        f.write(response_bytes)
+                paths.append(local_path)
+
+            logging.info(f"[SUCCESS] Partitions available in {local_dir}")
+            return paths
+
+        except Exception as e:
+            logging.error(f"[ERROR] Fail downloading partitions from Supabase : {str(e)}")
+            raise RuntimeError(f"Cannot proceed to partitions recuperation  : {e}")
+
     def split_dataframe(
             self,
         training_dataset: pd.DataFrame,
@@ -1,9 +1,13 @@
 ### LSTM Seq2Seq Architecture
+# Encoder / decoder blocks selectable by Seq2seq(architecture=...) : "lstm" (default), "gru", "tcn" (recurrence-free)
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 from typing import Tuple
 
+ARCHITECTURES = ("lstm", "gru", "tcn")
+
 class Encoder(nn.Module):
     
     def __init__(self, input_size: int, hidden_size: int, num_layers: int, dropout: float):
@@ -61,6 +65,104 @@ class Decoder(nn.Module):
 
         return predictions
     
+class GRUEncoder(nn.Module):
+
+    def __init__(self, input_size: int, hidden_size: int, num_layers: int, dropout: float):
+
+        super(GRUEncoder, self).__init__()
+        self.encoder = nn.GRU(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            num_layers=num_layers,
+            batch_first=True,
+            dropout=dropout
+        )
+        self.layer_norm = nn.LayerNorm(normalized_shape=hidden_size)
+
+    def forward(self, x_past: torch.Tensor) -> torch.Tensor:
+        _, h_n = self.encoder(x_past)
+
+        return self.layer_norm(h_n)
+
+class GRUDecoder(nn.Module):
+
+    def __init__(self, input_size: int, hidden_size: int, num_layers: int, output_len: int, dropout: float):
+
+        super(GRUDecoder, self).__init__()
+        self.output_len = output_len
+        self.decoder = nn.GRU(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            num_layers=num_layers,
+            batch_first=True,
+            dropout=dropout
+        )
+        self.fc_out = nn.Linear(hidden_size, 1)
+
+    def forward(self, x_future: torch.Tensor, h_init_norm: torch.Tensor) -> torch.Tensor:
+        output, _ = self.decoder(x_future, h_init_norm)
+
+        return self.fc_out(output)
+
+class CausalConvBlock(nn.Module):
+    """Residual block of two dilated causal convolutions (left padding : no look-ahead)"""
+
+    def __init__(self, in_channels: int, out_channels: int, kernel_size: int, dilation: int, dropout: float):
+
+        super(CausalConvBlock, self).__init__()
+        self.left_padding = (kernel_size - 1) * dilation
+        self.conv1 = nn.Conv1d(in_channels, out_channels, kernel_size, dilation=dilation)
+        self.conv2 = nn.Conv1d(out_channels, out_channels, kernel_size, dilation=dilation)
+        self.dropout = nn.Dropout(dropout)
+        self.downsample = nn.Conv1d(in_channels, out_channels, 1) if in_channels != out_channels else nn.Identity()
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        #x de la forme (batch_number, channels, seq_length)
+        out = self.dropout(F.relu(self.conv1(F.pad(x, (self.left_padding, 0)))))
+        out = self.dropout(F.relu(self.conv2(F.pad(out, (self.left_padding, 0)))))
+
+        return F.relu(out + self.downsample(x))
+
+class TCNEncoder(nn.Module):
+    """
+    Dilated temporal convolutions (dilation 2^i per level), all time steps in parallel.
+    Receptive field 1 + 2 (kernel_size - 1) (2^num_levels - 1) : 253 hours with the defaults.
+    """
+
+    def __init__(self, input_size: int, hidden_size: int, num_levels: int, kernel_size: int, dropout: float):
+
+        super(TCNEncoder, self).__init__()
+        self.network = nn.Sequential(*[
+            CausalConvBlock(input_size if i == 0 else hidden_size, hidden_size, kernel_size, 2 ** i, dropout)
+            for i in range(num_levels)
+        ])
+        self.layer_norm = nn.LayerNorm(normalized_shape=hidden_size)
+
+    def forward(self, x_past: torch.Tensor) -> torch.Tensor:
+        #x de la forme (batch_number, seq_length, all_features) -> contexte au dernier pas (batch_number, hidden_size)
+        features = self.network(x_past.transpose(1, 2))
+
+        return self.layer_norm(features[:, :, -1])
+
+class TCNDecoder(nn.Module):
+    """Recurrence-free decoder : encoder context broadcast on every future step, pointwise MLP per horizon"""
+
+    def __init__(self, input_size: int, hidden_size: int, num_layers: int, output_len: int, dropout: float):
+
+        super(TCNDecoder, self).__init__()
+        self.output_len = output_len
+        layers = []
+        for i in range(num_layers):
+            layers += [nn.Linear(input_size + hidden_size if i == 0 else hidden_size, hidden_size), nn.ReLU(), nn.Dropout(dropout)]
+        self.mlp = nn.Sequential(*layers)
+        self.fc_out = nn.Linear(hidden_size, 1)
+
+    def forward(self, x_future: torch.Tensor, context: torch.Tensor) -> torch.Tensor:
+        #x_future de la forme (batch_number, output_len, feature.difference(y))
+        context = context.unsqueeze(1).expand(-1, x_future.shape[1], -1)
+
+        return self.fc_out(self.mlp(torch.cat([x_future, context], dim=-1)))
+
 class Seq2seq(nn.Module):
     
     def __init__(
@@ -70,19 +172,44 @@ class Seq2seq(nn.Module):
             hidden_size: int, 
             num_layers: int, 
             output_len: int, 
-            dropout: float = 0.0
+            dropout: float = 0.0,
+            architecture: str = "lstm",
+            tcn_levels: int = 6,
+            tcn_kernel_size: int = 3,
         ):
         
         super(Seq2seq, self).__init__()
+
+        if architecture not in ARCHITECTURES:
+            raise ValueError(f"Unknown architecture '{architecture}', expected one of {ARCHITECTURES}")
         
-        self.encoder = Encoder(
-            input_size=past_features_length, 
-            hidden_size=hidden_size, 
-            num_layers=num_layers,
-            dropout=dropout
-        )
+        if architecture == "lstm":
+            self.encoder = Encoder(
+                input_size=past_features_length, 
+                hidden_size=hidden_size, 
+                num_layers=num_layers,
+                dropout=dropout
+            )
+            decoder_cls = Decoder
+        elif architecture == "gru":
+            self.encoder = GRUEncoder(
+                input_size=past_features_length,
+                hidden_size=hidden_size,
+                num_layers=num_layers,
+                dropout=dropout
+            )
+            decoder_cls = GRUDecoder
+        else:
+            self.encoder = TCNEncoder(
+                input_size=past_features_length,
+                hidden_size=hidden_size,
+                num_levels=tcn_levels,
+                kernel_size=tcn_kernel_size,
+                dropout=dropout
+            )
+            decoder_cls = TCNDecoder
         
-        self.decoder = Decoder(
+        self.decoder = decoder_cls(
             input_size=future_features_length,
             hidden_size=hidden_size,
             num_layers=num_layers,
@@ -91,8 +218,9 @@ class Seq2seq(nn.Module):
         )
 
     def forward(self, x_past: torch.Tensor, x_future: torch.Tensor) -> torch.Tensor:
-        #Encoder
-        (h_n_norm, c_n_norm) = self.encoder(x_past)
-        predictions = self.decoder(x_future, h_n_norm, c_n_norm)
+        #Encoder : (h_n, c_n) pour le LSTM, h_n pour le GRU, contexte pour le TCN
+        state = self.encoder(x_past)
+        if isinstance(state, tuple):
+            return self.decoder(x_future, *state)
 
-        return predictions
\ No newline at end of file
+        return self.decoder(x_future, state)
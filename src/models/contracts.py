@@ -7,6 +7,13 @@ import pandas as pd
 import torch.nn as nn
 import numpy as np
 
+def validate_input_schema(X: pd.DataFrame, input_schema: Dict[str, str]) -> None:
+    """Raise ValueError if X misses a training column (extra columns are allowed, dtypes are cast by the caller)"""
+
+    missing = [col for col in input_schema if col not in X.columns]
+    if missing:
+        raise ValueError(f"Missing input columns {missing}. Expected the training schema columns.")
+
 # ---LGBM contract---
 @dataclass
 class HorizonRunResult:
@@ -19,7 +26,36 @@ class HorizonRunResult:
     model:        Pipeline
     best_rmse:    float
     best_params:  dict
-    X_train:      pd.DataFrame
+
+    # Input contract : a few copied rows and the dtypes (the training frame is not kept alive)
+    input_example: pd.DataFrame
+    input_schema:  Dict[str, str]
+
+    @classmethod
+    def from_training_data(
+        cls,
+        horizon: int,
+        set_name: str,
+        model: Pipeline,
+        best_rmse: float,
+        best_params: dict,
+        X_train: pd.DataFrame,
+        n_example_rows: int = 3,
+    ) -> "HorizonRunResult":
+        """Build the contract from the training frame, keeping only its first rows (copy) and column schema"""
+        return cls(
+            horizon=horizon,
+            set_name=set_name,
+            model=model,
+            best_rmse=best_rmse,
+            best_params=best_params,
+            input_example=X_train.iloc[:n_example_rows].copy(),
+            input_schema=X_train.dtypes.astype(str).to_dict(),
+        )
+
+    def validate_input(self, X: pd.DataFrame) -> None:
+        """Check a frame against the training columns"""
+        validate_input_schema(X, self.input_schema)
 
     @property
     def n_features(self) -> int:
@@ -53,9 +89,10 @@ class HorizonRunResult:
     
     @property
     def signature(self):
+        """Inferred on the input example only (no training set prediction)"""
         return mlflow.models.infer_signature( # type: ignore
-            self.X_train,
-            self.model.predict(self.X_train)
+            self.input_example,
+            self.model.predict(self.input_example)
         )
     
     def to_record(self) -> Dict[str, Optional[float|str]]:
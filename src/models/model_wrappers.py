@@ -1,19 +1,33 @@
 import pandas as pd
 import numpy as np
 from mlflow.pyfunc.model import PythonModel
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 from sklearn.pipeline import Pipeline
 import torch.nn as nn
 import torch
+from src.utils import solar_geometry
+from src.models import contracts
 
 class MultiHorizonLGBMWrapper(PythonModel):
     
-    def __init__(self, models_dict: Dict[str, Pipeline], num_horizons: int):
+    def __init__(
+            self, 
+            models_dict: Dict[str, Pipeline], 
+            num_horizons: int, 
+            daylight: Optional[Dict[str, float]] = None,
+            input_schema: Optional[Dict[str, str]] = None
+        ):
         self.models_dict = models_dict
         self.num_horizons = num_horizons
+        self.daylight = daylight # {"latitude", "longitude", "min_elevation"} : night horizons predicted as 0
+        self.input_schema = input_schema # Training columns (checked) and dtypes (cast) before any horizon prediction
         
     def predict(self, model_input: pd.DataFrame): # type: ignore
 
+        if self.input_schema is not None:
+            contracts.validate_input_schema(model_input, self.input_schema)
+            model_input = model_input.astype(self.input_schema)
+
         all_predictions = {}
 
         for horizon in range(1, self.num_horizons+1):
@@ -22,12 +36,43 @@ class MultiHorizonLGBMWrapper(PythonModel):
                 if key not in self.models_dict:
                     raise KeyError(f"Missing model for horizon {key}. Expected {self.num_horizons} models.")
                 pipe = self.models_dict[key]
-                norm_pred = pipe.predict(model_input)
+
+                # Daylight mode : models only called for the rows whose target time t+h is daylight
+                if self.daylight is not None:
+                    is_day = solar_geometry.daylight_mask(
+                        model_input.index + pd.Timedelta(hours=horizon), 
+                        self.daylight["latitude"],
+                        self.daylight["longitude"],
+                        min_elevation=self.daylight["min_elevation"]
+                    )
+                    norm_pred = np.zeros(len(model_input))
+                    if is_day.any():
+                        norm_pred[is_day] = pipe.predict(model_input.loc[is_day])
+                else:
+                    norm_pred = pipe.predict(model_input)
                 all_predictions[key] = norm_pred
     
         return pd.DataFrame(all_predictions, index=model_input.index).clip(lower=0)
 
 
+class GlobalMultiHorizonLGBMWrapper(PythonModel):
+    """Same outputs as MultiHorizonLGBMWrapper ('+1h'...'+{n}h', normalized), one booster per horizon group"""
+
+    def __init__(self, group_models: List, num_horizons: int):
+        self.group_models = group_models # global_engine.HorizonGroupModel
+        self.num_horizons = num_horizons
+
+    def predict(self, model_input: pd.DataFrame): # type: ignore
+
+        all_predictions = pd.concat([group.predict(model_input) for group in self.group_models], axis=1)
+        expected = [f'+{horizon}h' for horizon in range(1, self.num_horizons + 1)]
+        missing = [key for key in expected if key not in all_predictions.columns]
+        if missing:
+            raise KeyError(f"Missing horizons {missing}. Expected {self.num_horizons} horizons.")
+
+        return all_predictions[expected].clip(lower=0)
+
+
 class SolarLSTMWrapper(PythonModel):
     """Wrapper PythonModel pour LSTM Seq2Seq"""
  
@@ -51,9 +96,83 @@ class SolarLSTMWrapper(PythonModel):
         self.device           = torch.device(device)
     
     def _run_inference(self, enc: torch.Tensor, dec: torch.Tensor) -> torch.Tensor:
-        """Isolated forward pass"""
+        """Isolated forward pass (no autograd graph)"""
         self.model.eval()
-        return self.model(enc, dec)
+        with torch.inference_mode():
+            return self.model(enc, dec)
+
+    def _window_starts(
+            self,
+            index: pd.Index,
+            issue_times: Optional[Sequence] = None,
+            stride: int = 1
+        ) -> np.ndarray:
+        """First row of each window. The issue time is the last encoder row (forecasts t+1...t+output_len)"""
+
+        window_length = self.seq_length + self.output_len
+        if len(index) < window_length:
+            raise ValueError(f"Input must have at least {window_length} rows, got {len(index)}")
+
+        if issue_times is None:
+            return np.arange(0, len(index) - window_length + 1, stride)
+
+        positions = index.get_indexer(pd.Index(issue_times))
+        starts = positions - self.seq_length + 1
+        invalid = (positions < 0) | (starts < 0) | (starts + window_length > len(index))
+        if invalid.any():
+            raise ValueError(f"Issue times without a full window in the input : {list(pd.Index(issue_times)[invalid])}")
+
+        return starts
+
+    def predict_batch(
+            self,
+            model_input: pd.DataFrame,
+            issue_times: Optional[Sequence] = None,
+            stride: int = 1
+        ) -> pd.DataFrame:
+        """Prédit 24 horizons pour plusieurs fenêtres d'une longue série (backtests, backfills).
+
+        Scaling once on the whole frame, all windows in one batch tensor, one forward pass.
+
+        Args:
+        model_input: DataFrame TOTAL (y inclus), hourly rows
+        issue_times: issue timestamps (last encoder row of each window). Every window by stride if None
+
+        Returns:
+        - preds (pd.DataFrame): (windows x output_len) predictions in MWh, indexed by issue time, '+{h}h' columns
+        """
+
+        starts = self._window_starts(model_input.index, issue_times, stride)
+
+        # Scaling (une seule fois)
+        X = model_input.drop(columns=["solar_mw"])
+        X_scaled = self.processor.transform(X)
+        y_scaled = self.processor.transform_y(model_input["solar_mw"])
+
+        # y_past ajouté à l'encodeur (normalisé)
+        enc_values = np.column_stack([
+            X_scaled[self.encoder_features].to_numpy(dtype=np.float32),
+            y_scaled.to_numpy(dtype=np.float32)
+        ])
+        dec_values = X_scaled[self.decoder_features].to_numpy(dtype=np.float32)
+
+        # Fenêtres : (windows x length x features)
+        rows_past = starts[:, None] + np.arange(self.seq_length)
+        rows_future = starts[:, None] + np.arange(self.seq_length, self.seq_length + self.output_len)
+        enc = torch.from_numpy(enc_values[rows_past]).to(self.device)
+        dec = torch.from_numpy(dec_values[rows_future]).to(self.device)
+
+        # Inférence
+        norm_preds = self._run_inference(enc, dec).reshape(len(starts), self.output_len).cpu().numpy()
+
+        # Denormalization (denominator at each predicted timestamp)
+        preds = self.processor.inverse_transform_y(norm_preds.ravel(), model_input.index[rows_future.ravel()])
+
+        return pd.DataFrame(
+            np.clip(preds.reshape(len(starts), self.output_len), 0, None),
+            index=model_input.index[starts + self.seq_length - 1],
+            columns=[f'+{h}h' for h in range(1, self.output_len + 1)]
+        )
     
     def predict(self, model_input: pd.DataFrame) -> np.ndarray: # type: ignore
         
@@ -69,33 +188,4 @@ class SolarLSTMWrapper(PythonModel):
         if len(model_input) != (self.seq_length + self.output_len):
             raise ValueError(f"Input must have {self.seq_length + self.output_len} rows, got {len(model_input)}")
         
-        # Init
-        y_past = model_input['solar_mw'].iloc[:self.seq_length]
-        X = model_input.drop(columns=["solar_mw"])
-        
-        # Scaling 
-        X_scaled = self.processor.transform(X)
-
-        # Slicing
-        X_past_scaled   = X_scaled[self.encoder_features].iloc[:self.seq_length]
-        X_future_scaled = X_scaled[self.decoder_features].iloc[self.seq_length:]
-
-        # y_past ajouté à l'encodeur (normalisé)
-        y_past_series = pd.Series(y_past.values, index=X.index[:self.seq_length], name="solar_mw")
-        y_past_scaled = self.processor.transform_y(y_past_series)
-        
-        enc_array = np.concatenate(
-            [X_past_scaled.values, y_past_scaled.values.reshape(-1, 1)], axis=1
-        )
-
-        # Inférence
-        enc = torch.tensor(enc_array, dtype=torch.float32).unsqueeze(0).to(self.device)
-        dec = torch.tensor(X_future_scaled.values, dtype=torch.float32).unsqueeze(0).to(self.device)
-        norm_preds = self._run_inference(enc, dec)   # (1, output_len, 1)
-        norm_preds_np = norm_preds.squeeze().cpu().numpy()
-
-        # Denormalization
-        preds = self.processor.inverse_transform_y(norm_preds_np, X_future_scaled.index)
-
-        # Return
-        return np.clip(preds, 0, None)
\ No newline at end of file
+        return self.predict_batch(model_input).to_numpy()[0]
@@ -0,0 +1,106 @@
+# Utils
+import time
+import logging
+from typing import Any, Dict, List
+
+# Libraries
+import pandas as pd
+import mlflow
+
+# Custom modules
+from src.models import model_wrappers
+from src.pipelines.training_pipeline import SolarTrainingOrchestrator
+from src.training import global_engine
+logger = logging.getLogger(__name__)
+
+class SolarGlobalTrainingOrchestrator(SolarTrainingOrchestrator):
+    """
+    Alternative training mode : one booster per horizon group (or a single one) fitted on the stacked
+    horizons with a horizon feature, packaged with the same '+{h}h' outputs as the per-horizon mode.
+    No Optuna search : hyperparameters of the selector LightGBM, n_estimators by early stopping.
+    """
+
+    model_name: str = "Solar_MultiHorizon_Global_Forecaster"
+
+    def __init__(self, *args, group_mode: str = "groups", val_fraction: float = 0.1, **kwargs):
+        super().__init__(*args, **kwargs)
+        if group_mode not in ("groups", "single"):
+            raise ValueError(f"Unknown group_mode '{group_mode}', expected 'groups' or 'single'")
+        
+        self.group_mode = group_mode
+        self.val_fraction = val_fraction
+        self.group_models: List[global_engine.HorizonGroupModel] = []
+
+    def _horizon_groups(self) -> Dict[str, List[int]]:
+        """Same groups as the per-horizon feature sets, or every horizon together"""
+
+        if self.group_mode == "single":
+            return {"all": list(range(1, self.n_horizons + 1))}
+
+        groups: Dict[str, List[int]] = {}
+        for horizon in range(1, self.n_horizons + 1):
+            set_name, _ = self._selector_parameters_for(horizon)
+            groups.setdefault(set_name, []).append(horizon)
+
+        return groups
+
+    def _group_params(self) -> Dict[str, Any]:
+        """Selector LightGBM hyperparameters, n_estimators as early stopping cap"""
+        return {
+            **self._cast_search_params(self.selector_parameters["lgbm_params"]),
+            "n_estimators": self.max_boost_rounds,
+        }
+
+    def run_training_pipeline( # type: ignore[override]
+            self,
+            X_train: pd.DataFrame,
+            y_train: pd.Series,
+        ) -> List[global_engine.HorizonGroupModel]:
+        """Fit every horizon group and log one child run per group"""
+
+        groups = self._horizon_groups()
+        logger.info(f"Global training launch : {len(groups)} boosters for {self.n_horizons} horizons")
+
+        self.group_models = []
+        with self._parent_run(run_name="MultiHorizon_Global_Training_Pipeline") as parent_run:
+            self._training_run_id = parent_run.info.run_id
+            mlflow.set_tag("training_mode", f"global_{self.group_mode}")
+
+            with self.threads.apply():
+                for set_name, horizons in groups.items():
+                    _, selector_parameters = self._selector_parameters_for(horizons[0])
+                    
+                    start = time.perf_counter()
+                    group_model, val_rmse = global_engine.fit_horizon_group(
+                        X=X_train,
+                        y=y_train,
+                        horizons=horizons,
+                        meteo_features=self.meteo_features,
+                        selector_parameters=selector_parameters,
+                        params=self._group_params(),
+                        val_fraction=self.val_fraction,
+                        early_stopping_rounds=self.early_stopping_rounds,
+                        n_jobs=self.lgbm_n_jobs,
+                        random_state=self.random_state,
+                    )
+                    self.group_models.append(group_model)
+
+                    with mlflow.start_run(run_name=f"global_{set_name}", nested=True):
+                        mlflow.log_params({
+                            **self._group_params(),
+                            "horizons": f"{horizons[0]}-{horizons[-1]}",
+                            "feature_set": set_name,
+                            "n_features": len(group_model.selector.final_selected_features_),
+                            "n_estimators_fitted": group_model.model.booster_.current_iteration(),
+                        })
+                        mlflow.log_metrics({"best_rmse_val": val_rmse, "fit_seconds": time.perf_counter() - start})
+
+        self._is_fitted = True
+        logger.info("[SUCCESS] Global training pipeline terminated.")
+        return self.group_models
+
+    def _build_meta_model(self) -> mlflow.pyfunc.PythonModel:
+        return model_wrappers.GlobalMultiHorizonLGBMWrapper(
+            group_models=self.group_models,
+            num_horizons=self.n_horizons
+        )
@@ -0,0 +1,206 @@
+# SARIMAX baseline serving
+# The fitted results are loaded once. Each hour the Kalman filter state is advanced with the new rows
+# (extend : fixed parameters, no optimizer call), parameters are re-estimated only every refit_every hours
+
+import os
+import socket
+import logging
+from pathlib import Path
+from typing import Optional
+
+import joblib
+import pandas as pd
+from statsmodels.tsa.statespace.sarimax import SARIMAX, SARIMAXResultsWrapper
+
+logger = logging.getLogger(__name__)
+
+class SarimaxInferenceJob:
+    """
+    Hourly SARIMAX forecaster t+1...t+n_horizons.
+    State file (joblib) : fitted results, last filtered timestamp, hours since the last re-estimation
+    and a bounded history window (endog + exog) used by the scheduled re-estimation.
+    """
+
+    def __init__(
+            self,
+            state_path: str | Path,
+            target: str = "solaire",
+            n_horizons: int = 24,
+            refit_every: int = 24 * 7,
+            history_hours: int = 24 * 90,
+        ):
+        self.state_path = Path(state_path)
+        self.target = target
+        self.n_horizons = n_horizons
+        self.refit_every = refit_every
+        self.history_hours = history_hours
+
+        self._results: Optional[SARIMAXResultsWrapper] = None
+        self._history: Optional[pd.DataFrame] = None
+        self._hours_since_refit: int = 0
+
+    @classmethod
+    def from_training(
+            cls,
+            state_path: str | Path,
+            X: pd.DataFrame,
+            y: pd.Series,
+            best_params: dict,
+            seasonal_period: int = 24,
+            **kwargs,
+        ) -> "SarimaxInferenceJob":
+        """Initial state from the train_sarimax best orders (cold fit on the last history_hours rows)"""
+
+        job = cls(state_path, target=str(y.name or "solaire"), **kwargs)
+        history = pd.concat([y.rename(job.target), X], axis=1).iloc[-job.history_hours:].asfreq("h")
+
+        job._results = SARIMAX(
+            endog=history[job.target],
+            exog=history.drop(columns=job.target),
+            order=(best_params["p"], best_params["d"], best_params["q"]),
+            seasonal_order=(best_params["P"], best_params["D"], best_params["Q"], seasonal_period),
+            enforce_stationarity=False,
+            enforce_invertibility=False,
+        ).fit(disp=False)
+        job._history = history
+        job.save()
+
+        return job
+
+    # 1 - State
+
+    @property
+    def exog_names(self) -> list:
+        return list(self._results.model.exog_names or []) if self._results is not None else []
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp:
+        return self._history.index[-1]
+
+    def load(self) -> "SarimaxInferenceJob":
+        if self._results is not None:
+            return self
+
+        state = joblib.load(self.state_path)
+        self._results = state["results"]
+        self._history = state["history"]
+        self._hours_since_refit = state["hours_since_refit"]
+        logger.info(f"[SARIMAX] State loaded : filtered up to {self.last_timestamp}, {self._hours_since_refit}h since re-estimation")
+
+        return self
+
+    def save(self) -> None:
+        """Atomic state write (a concurrent reader never loads a partial file)"""
+
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.tmp-{socket.gethostname()}-{os.getpid()}")
+        joblib.dump(
+            {"results": self._results, "history": self._history, "hours_since_refit": self._hours_since_refit},
+            tmp_path
+        )
+        os.replace(tmp_path, self.state_path)
+
+    # 2 - Filter update and scheduled re-estimation
+
+    def update(self, dataset: pd.DataFrame) -> int:
+        """
+        Advance the filter with the rows of dataset after the last filtered timestamp.
+        Missing targets (not yet published) are kept as NaN : the filter skips them, and they are backfilled
+        from dataset once published (the history window is then re-filtered with fixed parameters).
+        Return the number of new rows.
+        """
+
+        self.load()
+        rows = dataset[[self.target, *self.exog_names]]
+        n_backfilled = self._backfill_targets(rows.loc[rows.index <= self.last_timestamp, self.target])
+        new_rows = rows.loc[rows.index > self.last_timestamp]
+        if new_rows.empty:
+            if n_backfilled:
+                self._refilter()
+            return 0
+
+        expected_start = self.last_timestamp + pd.Timedelta(hours=1)
+        if new_rows.index[0] != expected_start:
+            raise ValueError(f"SARIMAX state ends at {self.last_timestamp}, new rows start at {new_rows.index[0]}")
+
+        new_rows = new_rows.asfreq("h")
+        if new_rows[self.exog_names].isna().any().any():
+            raise ValueError("SARIMAX update : missing exogenous values in the new rows")
+
+        self._history = pd.concat([self._history, new_rows]).iloc[-self.history_hours:]
+        self._hours_since_refit += len(new_rows)
+
+        if self._hours_since_refit >= self.refit_every:
+            self._reestimate()
+        elif n_backfilled:
+            self._refilter()
+        else:
+            exog = new_rows[self.exog_names] if self.exog_names else None
+            self._results = self._results.extend(endog=new_rows[self.target], exog=exog)
+
+        return len(new_rows)
+
+    def _backfill_targets(self, observed: pd.Series) -> int:
+        """Targets published after their row was filtered (NaN in the history). Return the number of rows filled"""
+
+        observed = observed.reindex(self._history.index)
+        late = observed[self._history[self.target].isna() & observed.notna()]
+        if late.empty:
+            return 0
+
+        self._history.loc[late.index, self.target] = late
+        logger.info(f"[SARIMAX] {len(late)} late targets backfilled (from {late.index[0]})")
+
+        return len(late)
+
+    def _refilter(self) -> None:
+        """Kalman filter re-run on the history window, parameters unchanged"""
+
+        exog = self._history[self.exog_names] if self.exog_names else None
+        self._results = self._results.apply(endog=self._history[self.target], exog=exog, refit=False)
+
+    def _reestimate(self) -> None:
+        """Parameters re-estimated on the history window, warm started from the current parameters"""
+
+        exog = self._history[self.exog_names] if self.exog_names else None
+        self._results = self._results.apply(
+            endog=self._history[self.target],
+            exog=exog,
+            refit=True,
+            fit_kwargs={"start_params": self._results.params, "disp": False},
+        )
+        self._hours_since_refit = 0
+        logger.info(f"[REFIT] SARIMAX parameters re-estimated on {len(self._history)} rows up to {self.last_timestamp}")
+
+    # 3 - Forecast
+
+    def forecast(self, exog_future: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        One row indexed by the last filtered timestamp, '+{h}h' columns (same layout as the LightGBM
+        meta model : InferenceJob.offset_to_datetime / to_sql_format apply unchanged).
+        exog_future : exogenous rows t+1...t+n_horizons, required when the model has exogenous variables.
+        """
+
+        self.load()
+        exog = None
+        if self.exog_names:
+            if exog_future is None or len(exog_future) < self.n_horizons:
+                raise ValueError(f"SARIMAX forecast needs {self.n_horizons} future exogenous rows")
+            exog = exog_future[self.exog_names].iloc[:self.n_horizons]
+
+        predictions = self._results.forecast(steps=self.n_horizons, exog=exog)
+
+        return pd.DataFrame(
+            [predictions.to_numpy()],
+            index=[self.last_timestamp],
+            columns=[f'+{h}h' for h in range(1, self.n_horizons + 1)]
+        )
+
+    def run(self, dataset: pd.DataFrame, exog_future: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Hourly call : filter update, forecast, state persisted for the next hour"""
+
+        n_new = self.update(dataset)
+        predictions = self.forecast(exog_future)
+        self.save()
+        logger.info(f"[SUCCESS] SARIMAX forecast from {self.last_timestamp} ({n_new} new rows filtered)")
+
+        return predictions
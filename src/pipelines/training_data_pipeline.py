@@ -10,6 +10,7 @@ from src.utils.config import SolarSettings, settings
 from src.etl.data_processing import solar_preprocessing, feature_engine
 from src.etl.data_collection import fetching_solar_data, fetching_weather_data
 from src.etl import schemas
+from src.utils import solar_geometry
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,15 @@ class SolarETLTrainingJob:
         # 3 - Rearranging and finishing pipeline
         final_dataset = feature_engine.transform_pipeline(inference_data=all_inference_data,
                        timeframe_dict=self.config.timeframe_dict) 
+
+        # Night rows are kept : horizons are aligned by position, the daylight mask is applied at t+h in training
+        night_share = 1 - solar_geometry.daylight_mask(
+            final_dataset.index, 
+            self.config.barycentre_latitude, 
+            self.config.barycentre_longitude,
+            min_elevation=self.config.daylight_min_elevation
+        ).mean()
+        logger.info(f"[TRANSFORM] {night_share:.0%} night rows (sun below {self.config.daylight_min_elevation}°)")
         
         logger.info("[SUCCESS] - [TRANSFORM] Phase succeeded")
         
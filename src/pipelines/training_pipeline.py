@@ -1,7 +1,13 @@
 # Utils
 import os
+import copy
+import time
+from contextlib import contextmanager
 import logging
-from typing import Any, Dict, List, Tuple
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Libraries
 from datetime import datetime
@@ -13,21 +19,76 @@ from mlflow.tracking import MlflowClient
 import lightgbm as lgb
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.pipeline import Pipeline
-from optuna.pruners import MedianPruner
+from optuna.pruners import MedianPruner, SuccessiveHalvingPruner
+from optuna.study import MaxTrialsCallback
+from optuna.storages import BaseStorage
+from optuna.trial import TrialState
 
 # Custom modules
-from src.etl import processors
+from src.etl import processors, horizons
 from src.utils.config import SolarSettings
 from src.models import contracts, model_wrappers
-from src.utils import metrics
+from src.training.dataset_cache import LGBMDatasetCache
+from src.training.distributed import SharedTrainingWorkspace
+from src.training.checkpoints import TrainingCheckpointStore
+from src.training.retrain_planner import RetrainPlanner
+from src.training import champion, out_of_core
+from src.utils import metrics, logging_utils
+from src.utils.threads import ThreadBudget, ThreadAllocation
+from src.utils import solar_geometry
 logger = logging.getLogger(__name__)
 
+# Trial states counted in the budget of a shared (checkpointed / distributed) study
+BUDGET_TRIAL_STATES = (TrialState.COMPLETE, TrialState.PRUNED)
+
+# Process pool state : one orchestrator copy and one shared-memory training frame per worker
+_WORKER_STATE: Dict[str, Any] = {}
+
+def _init_horizon_worker(
+        orchestrator: "SolarTrainingOrchestrator",
+        shm_name: str,
+        shape: Tuple[int, int],
+        index: pd.Index,
+        columns: pd.Index,
+        y: pd.Series,
+        threads: ThreadAllocation,
+    ) -> None:
+    """Attach the shared training values and cap the worker threads (LightGBM, OpenMP, BLAS)"""
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    values.flags.writeable = False
+
+    # Threads : worker share of the node budget, sequential Optuna trials
+    orchestrator.use_threads(threads)
+    
+    _WORKER_STATE.update({
+        "shm": shm, # Keep the mapping alive
+        "limits": threads.apply(),
+        "orchestrator": orchestrator,
+        "X": pd.DataFrame(values, index=index, columns=columns, copy=False),
+        "y": y,
+    })
+
+def _fit_horizon_in_worker(horizon: int) -> contracts.HorizonRunResult:
+    """Process pool task : optimize and train one horizon"""
+    return _WORKER_STATE["orchestrator"]._fit_single_horizon(_WORKER_STATE["X"], _WORKER_STATE["y"], horizon)
+
 class SolarTrainingOrchestrator:
     """
     End-to-end orchestrator to train multi-horizons solar forecasting.
     Handle HP optimization, horizon training and MLFlow serialization.
     """
 
+    # Registered meta model and LGBM search space (name : type, used to cast warm start params)
+    model_name: str = "Solar_MultiHorizon_Forecaster"
+    search_space_types: Dict[str, type] = {
+        "num_leaves": int,
+        "learning_rate": float,
+        "max_depth": int,
+        "min_child_samples": int,
+    }
+
     def __init__(
             self,
             config: SolarSettings,
@@ -38,6 +99,17 @@ class SolarTrainingOrchestrator:
             n_cv_splits: int = 5,
             num_trials: int = 30,
             random_state: int = 42,
+            dataset_cache_dir: Optional[str] = None,
+            max_boost_rounds: int = 1000,
+            early_stopping_rounds: int = 50,
+            warm_start: bool = True,
+            warm_num_trials: Optional[int] = None,
+            checkpoint_dir: Optional[str] = None,
+            search_mode: str = "full",
+            fidelity_rungs: Optional[List[Tuple[float, int, int]]] = None,
+            async_logging: bool = True,
+            thread_budget: Optional[ThreadBudget] = None,
+            daylight_only: bool = False,
     ):
         # 1 - Config injection
         self.config = config
@@ -50,12 +122,82 @@ class SolarTrainingOrchestrator:
         self.n_cv_splits = n_cv_splits
         self.num_trials = num_trials
         self.random_state = random_state
+        self.max_boost_rounds = max_boost_rounds
+        self.early_stopping_rounds = early_stopping_rounds
+
+        # Search mode : "full" (every trial on all folds) or "multi_fidelity" (successive halving).
+        # Low fidelity rungs : (recent history fraction of each fold, number of most recent folds, max boosting rounds),
+        # the full fidelity rung (all history, all folds, max_boost_rounds) is always the last one.
+        if search_mode not in ("full", "multi_fidelity"):
+            raise ValueError(f"Unknown search_mode '{search_mode}'. Expected 'full' or 'multi_fidelity'.")
+        self.search_mode = search_mode
+        self.fidelity_rungs = fidelity_rungs or [(0.25, 1, 100), (0.5, 2, 300)]
 
-        # 3 - Internal state
+        # Daylight mode : rows whose target time t+h is night are dropped, predicted as 0 by the wrapper
+        self.daylight_only = daylight_only
+
+        # Warm start : previous horizon and champion params enqueued, reduced budget if warm_num_trials
+        self.warm_start = warm_start
+        self.warm_num_trials = warm_num_trials
+
+        # Threads : node budget (SolarSettings), sequential allocation. Overridden inside process pool workers
+        self.thread_budget = thread_budget or ThreadBudget.from_settings(config)
+        self.use_threads(self.thread_budget.allocate("sequential"))
+
+        # 3 - LightGBM binned datasets (shared by trials, persisted across runs if dataset_cache_dir)
+        self.dataset_params: Dict[str, Any] = {
+            "max_bin": 255,
+            "feature_pre_filter": False, # min_child_samples is searched after construction
+            "seed": random_state,
+            "verbosity": -1,
+        }
+        self._dataset_cache = LGBMDatasetCache(cache_dir=dataset_cache_dir, dataset_params=self.dataset_params)
+
+        # 4 - Per-horizon checkpoints and Optuna journal (resume option)
+        self._checkpoints = TrainingCheckpointStore(checkpoint_dir) if checkpoint_dir is not None else None
+
+        # 5 - Internal state
         self.models_dict: Dict[str, Pipeline] = {}
+        self._best_params_by_horizon: Dict[int, Dict[str, Any]] = {}
+        self._champion_runs: Dict[int, Dict[str, Any]] = {}
+        self._training_run_id: Optional[str] = None
+        self._input_schema: Optional[Dict[str, str]] = None # Training columns and dtypes of the horizons
+        self._target_matrix: Tuple[Optional[pd.Series], np.ndarray] = (None, np.empty((0, 0)))
         self._is_fitted = False
         self._init_mlflow()
 
+        # 6 - Child runs logged in background while the next horizon trains
+        self.async_logging = async_logging
+        self._async_logger: Optional[logging_utils.AsyncMlflowLogger] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Target matrix rebuilt in each process (a pickled strided view would be copied), logger thread not shared
+        return {**self.__dict__, "_target_matrix": (None, np.empty((0, 0))), "_async_logger": None}
+
+    def use_threads(self, threads: ThreadAllocation) -> None:
+        """Thread counts used by the Optuna studies and the LightGBM fits of this orchestrator"""
+        self.threads = threads
+        self.lgbm_n_jobs: Optional[int] = threads.lgbm_n_jobs
+        self.optuna_n_jobs: int = threads.optuna_n_jobs
+
+    @property
+    def mlflow_logger(self) -> Optional[logging_utils.AsyncMlflowLogger]:
+        """Lazy background logger (None in synchronous mode)"""
+        if self.async_logging and self._async_logger is None:
+            self._async_logger = logging_utils.AsyncMlflowLogger()
+
+        return self._async_logger
+
+    @contextmanager
+    def _parent_run(self, **run_kwargs):
+        """Parent MLflow run, closed only once the queued child runs are sent"""
+        with mlflow.start_run(**run_kwargs) as parent_run:
+            try:
+                yield parent_run
+            finally:
+                if self._async_logger is not None:
+                    self._async_logger.flush()
+
     def _init_mlflow(self) -> None:
         """Tracking MLflow server connexion initialization"""
         try:
@@ -74,26 +216,42 @@ class SolarTrainingOrchestrator:
             y: pd.Series, 
             horizon: int,
             ) -> Tuple[pd.DataFrame, pd.Series]:
-        """Align features with temporal shift"""
-        
-        y_shifted = y.shift(-horizon).dropna()
-        X_aligned = X.loc[y_shifted.index]
+        """Align features with temporal shift (positional views, one target matrix per target series)"""
+
+        cached_y, target_matrix = self._target_matrix
+        if cached_y is not y or target_matrix.shape[1] < horizon:
+            target_matrix = horizons.horizon_target_matrix(y, max(self.n_horizons, horizon))
+            self._target_matrix = (y, target_matrix)
         
-        return X_aligned, y_shifted
+        X_aligned, y_shifted = horizons.align_horizon(X, y, horizon, target_matrix=target_matrix)
+        if not self.daylight_only:
+            return X_aligned, y_shifted
+
+        is_day = solar_geometry.daylight_mask(X_aligned.index + pd.Timedelta(hours=horizon), **self._daylight_params())
+        return X_aligned.loc[is_day], y_shifted.loc[is_day]
+
+    def _daylight_params(self) -> Dict[str, float]:
+        """Barycentre coordinates and elevation threshold of the daylight mask"""
+        return {
+            "latitude": self.config.barycentre_latitude,
+            "longitude": self.config.barycentre_longitude,
+            "min_elevation": self.config.daylight_min_elevation,
+        }
     
-    def _optimize_hyperparameters(
+    def _build_cv_folds(
             self, 
             X: pd.DataFrame,
             y: pd.Series,
-            current_selector_parameters: Dict[str, Any]
-        ) -> Tuple[float, Dict[str, Any]]:
-        """Launch Optuna study to fin best hyperparameters (LGBM model)"""
+            current_selector_parameters: Dict[str, Any],
+            set_name: str = "default",
+        ) -> List[Dict[str, Any]]:
+        """Fit the selector and build the constructed Datasets of every CV fold (shared by all the scorings)"""
 
         # Folds
         tscv = TimeSeriesSplit(gap=0, n_splits=self.n_cv_splits)
         
         # Processor fit
-        selector_processor = processors.SolarDataProcessor(meteo_features=self.meteo_features)
+        selector_processor = processors.SolarDataProcessor(meteo_features=self.meteo_features, time_window=self.daylight_only)
         selector_processor.fit(X, y)
         X_scaled = selector_processor.transform(X=X)
         y_scaled = selector_processor.transform_y(y=y)
@@ -106,21 +264,117 @@ class SolarTrainingOrchestrator:
 
         # Static 
         folds_data = []
-        for train_idx, val_idx in tscv.split(X):
+        for fold, (train_idx, val_idx) in enumerate(tscv.split(X)):
             X_train, X_val = X.iloc[train_idx], X.iloc[val_idx]
             y_train, y_val = y.iloc[train_idx], y.iloc[val_idx]
 
-            fold_processor = processors.SolarDataProcessor(meteo_features=self.meteo_features)
+            fold_processor = processors.SolarDataProcessor(meteo_features=self.meteo_features, time_window=self.daylight_only)
             fold_processor.fit(X_train, y_train)
 
+            # Binned once per fold (or loaded from cache), then shared by every trial
+            train_set = self._dataset_cache.get_or_build(
+                set_name=set_name,
+                fold=fold,
+                X=selector.transform(fold_processor.transform(X_train)),
+                y=fold_processor.transform_y(y_train),
+            )
+
+            X_val_input = selector.transform(fold_processor.transform(X_val))
+            y_val_scaled = fold_processor.transform_y(y_val)
+            val_set = lgb.Dataset(
+                X_val_input,
+                label=y_val_scaled,
+                reference=train_set, # Bins of the training fold
+                params=self.dataset_params,
+            ).construct()
+            fidelity_sets = {1.0: (train_set, val_set)}
+
+            # Multi-fidelity : most recent rows of the fold, subsets sharing the fold bins (no re-binning)
+            if self.search_mode == "multi_fidelity":
+                n_rows = train_set.num_data()
+                for fraction, _, _ in self.fidelity_rungs:
+                    recent_subset = train_set.subset(list(range(int(n_rows * (1 - fraction)), n_rows))).construct()
+                    recent_val_set = lgb.Dataset(
+                        X_val_input, 
+                        label=y_val_scaled, 
+                        reference=recent_subset, 
+                        params=self.dataset_params
+                    ).construct()
+                    fidelity_sets[fraction] = (recent_subset, recent_val_set)
+
             folds_data.append({
-                'X_train': selector.transform(fold_processor.transform(X_train)),
-                'y_train': fold_processor.transform_y(y_train),
-                'X_val': selector.transform(fold_processor.transform(X_val)),
+                'fidelity_sets': fidelity_sets,
+                'X_val': X_val_input,
                 'y_val_real': y_val, #MWh for final comparison
                 'proc': fold_processor
             })
 
+        return folds_data
+
+    def _train_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Native API params on the constructed Datasets (dataset params kept identical to construction)"""
+
+        train_params = {**self.dataset_params, **params, "objective": "regression"}
+        if self.lgbm_n_jobs is not None:
+            train_params["num_threads"] = self.lgbm_n_jobs
+
+        return train_params
+
+    def _score_fold(
+            self, 
+            train_params: Dict[str, Any], 
+            fold: Dict[str, Any], 
+            fraction: float, 
+            num_boost_round: int
+        ) -> Tuple[float, int]:
+        """Validation RMSE (MWh) and early-stopped iteration count on one fold"""
+        
+        fold_train_set, fold_val_set = fold['fidelity_sets'][fraction]
+        booster = lgb.train(
+            train_params, 
+            fold_train_set, 
+            num_boost_round=num_boost_round,
+            valid_sets=[fold_val_set],
+            callbacks=[lgb.early_stopping(self.early_stopping_rounds, verbose=False)]
+        )
+        y_pred_norm = booster.predict(fold['X_val'], num_iteration=booster.best_iteration)
+
+        # Denormalization
+        y_pred = fold['proc'].inverse_transform_y(y_pred_norm, fold['y_val_real'].index)
+        
+        return metrics.rmse(fold['y_val_real'], y_pred), booster.best_iteration
+
+    def _cross_validate_params(self, folds_data: List[Dict[str, Any]], params: Dict[str, Any]) -> Tuple[float, int]:
+        """Mean CV RMSE (MWh) and mean early-stopped n_estimators of fixed hyperparameters"""
+
+        train_params = self._train_params({k: v for k, v in params.items() if k != "n_estimators"})
+        scores, best_iterations = zip(*[
+            self._score_fold(train_params, fold, 1.0, self.max_boost_rounds) for fold in folds_data
+        ])
+
+        return float(np.mean(scores)), int(np.mean(best_iterations))
+
+    def _optimize_hyperparameters(
+            self, 
+            X: pd.DataFrame,
+            y: pd.Series,
+            current_selector_parameters: Dict[str, Any],
+            set_name: str = "default",
+            study_name: Optional[str] = None,
+            storage: Optional[BaseStorage] = None,
+            warm_start_params: Optional[List[Dict[str, Any]]] = None,
+            folds_data: Optional[List[Dict[str, Any]]] = None,
+        ) -> Tuple[float, Dict[str, Any]]:
+        """
+        Launch Optuna study to fin best hyperparameters (LGBM model).
+        With a shared storage, the study is loaded if it exists and trials are added until num_trials is reached
+        across all the workers. warm_start_params are enqueued as first trials and allow the warm_num_trials budget.
+        folds_data : already built CV folds (see _build_cv_folds), built here otherwise.
+        """
+
+        if folds_data is None:
+            folds_data = self._build_cv_folds(X, y, current_selector_parameters, set_name=set_name)
+
         def objective_lightgbm(trial) -> np.float64 :
             
             # Init
@@ -128,42 +382,132 @@ class SolarTrainingOrchestrator:
                 "num_leaves" : trial.suggest_int("num_leaves", 10, 100),
                 "learning_rate" : trial.suggest_float("learning_rate", 0.005, 0.2, log=True),
                 "max_depth" : trial.suggest_int("max_depth", 1, 30),
-                "n_estimators" : trial.suggest_int("n_estimators", 100, 1000),
                 "min_child_samples" : trial.suggest_int("min_child_samples", 10, 50),
-                "verbosity" : -1,
-                "random_state": 42
             }
-            scores = []
 
-            for fold in folds_data:
-                model = lgb.LGBMRegressor(**params)
-                model.fit(fold['X_train'], fold['y_train'])
-                y_pred_norm = model.predict(fold['X_val'])
+            train_params = self._train_params(params)
+
+            # Low fidelity rungs : only the best fraction of the trials is promoted by the pruner
+            if self.search_mode == "multi_fidelity":
+                for rung, (fraction, n_folds, num_boost_round) in enumerate(self.fidelity_rungs):
+                    rung_scores = [self._score_fold(train_params, fold, fraction, num_boost_round)[0] for fold in folds_data[-n_folds:]]
+                    trial.report(float(np.mean(rung_scores)), step=rung + 1)
+                    if trial.should_prune():
+                        raise optuna.TrialPruned()
+
+            # Full fidelity
+            scores = []
+            best_iterations = []
+            for step, fold in enumerate(folds_data):
+                # n_estimators chosen by early stopping on the validation slice
+                score, best_iteration = self._score_fold(train_params, fold, 1.0, self.max_boost_rounds)
+                scores.append(score)
+                best_iterations.append(best_iteration)
 
-                # Denormalization
-                y_pred = fold['proc'].inverse_transform_y(y_pred_norm, fold['y_val_real'].index)
-                scores.append(metrics.rmse(fold['y_val_real'], y_pred))
+                # Cumulative fold RMSE for the pruner
+                if self.search_mode == "full":
+                    trial.report(float(np.mean(scores)), step=step)
+                    if trial.should_prune():
+                        raise optuna.TrialPruned()
             
+            trial.set_user_attr("n_estimators", int(np.mean(best_iterations)))
             return np.mean(scores) # type: ignore
         
         # Recherche des HP et prédiction
         optuna.logging.set_verbosity(optuna.logging.WARNING)
+        pruner = (
+            SuccessiveHalvingPruner(min_resource=1, reduction_factor=2)
+            if self.search_mode == "multi_fidelity"
+            else MedianPruner(n_startup_trials=5, n_warmup_steps=1)
+        )
         study = optuna.create_study(
             direction="minimize",
-            pruner=MedianPruner(n_startup_trials=5, n_warmup_steps=3)
+            pruner=pruner,
+            study_name=study_name,
+            storage=storage,
+            load_if_exists=True
         )
-        study.optimize(objective_lightgbm, n_trials=self.num_trials, n_jobs=4)
 
-        return study.best_value, study.best_params
+        # Warm start (skip_if_exists : several workers may enqueue on a shared study)
+        warm_start_params = warm_start_params or []
+        for warm_params in warm_start_params:
+            study.enqueue_trial(warm_params, skip_if_exists=True)
         
-    def _fit_single_horizon(
-            self,
-            X: pd.DataFrame,
-            y: pd.Series,
-            horizon: int,
-        ) -> contracts.HorizonRunResult:
-        """Optimize and trains the final model for a given horizon"""
-        X_h, y_h = self._prepare_horizon_data(X=X, y=y, horizon=horizon)
+        n_trials = self._trial_budget(warm_start_params)
+        if warm_start_params and self.warm_num_trials is not None:
+            logger.info(f"Warm started study ({len(warm_start_params)} seeds) : {n_trials} trials")
+
+        if storage is None:
+            study.optimize(objective_lightgbm, n_trials=n_trials, n_jobs=self.optuna_n_jobs)
+        
+        elif self._finished_trials(study) < n_trials:
+            # Shared budget : finished trials only (enqueued seeds and failed trials are not counted),
+            # n_trials bounds the attempts of this worker if every trial fails
+            study.optimize(
+                objective_lightgbm, 
+                n_trials=n_trials - self._finished_trials(study),
+                n_jobs=self.optuna_n_jobs,
+                callbacks=[MaxTrialsCallback(n_trials, states=BUDGET_TRIAL_STATES)]
+            )
+        self._dataset_cache.clear_memory()
+
+        return self._best_from_study(study)
+
+    def _trial_budget(self, warm_start_params: Optional[List[Dict[str, Any]]]) -> int:
+        """Trials of a horizon study : warm_num_trials when warm started, num_trials otherwise"""
+        if warm_start_params and self.warm_num_trials is not None:
+            return self.warm_num_trials
+
+        return self.num_trials
+
+    @staticmethod
+    def _finished_trials(study: optuna.Study) -> int:
+        """Trials counted in the budget of a shared study (same states as the MaxTrialsCallback)"""
+        return len(study.get_trials(deepcopy=False, states=BUDGET_TRIAL_STATES))
+
+    @staticmethod
+    def _best_from_study(study: optuna.Study) -> Tuple[float, Dict[str, Any]]:
+        """Best RMSE and params, with the early-stopped iteration count as n_estimators"""
+
+        best_params = {**study.best_params, "n_estimators": study.best_trial.user_attrs["n_estimators"]}
+
+        return study.best_value, best_params
+        
+    def _cast_search_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the search space keys only, cast to their type (MLflow params are strings)"""
+        return {
+            key: cast(float(params[key])) if cast is int else cast(params[key])
+            for key, cast in self.search_space_types.items() 
+            if key in params
+        }
+
+    def _warm_start_params_for(self, horizon: int) -> List[Dict[str, Any]]:
+        """Previous horizon best params and champion params of the same horizon"""
+
+        if not self.warm_start:
+            return []
+
+        candidates = []
+        if horizon - 1 in self._best_params_by_horizon:
+            candidates.append(self._best_params_by_horizon[horizon - 1])
+        if horizon in self._champion_runs:
+            candidates.append(self._champion_runs[horizon]["params"])
+
+        warm_start_params = []
+        for params in candidates:
+            casted = self._cast_search_params(params)
+            if len(casted) == len(self.search_space_types) and casted not in warm_start_params:
+                warm_start_params.append(casted)
+
+        return warm_start_params
+
+    def _load_champion_runs(self) -> None:
+        """Champion horizon runs for warm start (none on a first training)"""
+        if self.warm_start:
+            self._champion_runs = champion.load_champion_horizon_runs(model_name=self.model_name)
+
+    def _selector_parameters_for(self, horizon: int) -> Tuple[str, Dict[str, Any]]:
+        """Return the feature group name and selector parameters of a given horizon"""
 
         current_selector_params = self.selector_parameters.copy()
         if horizon <= 3:
@@ -175,21 +519,132 @@ class SolarTrainingOrchestrator:
         else:
             set_name = "long"
             current_selector_params["horizons"] = [12, 24]
+
+        # Capped threads for the selector boosters too
+        if self.lgbm_n_jobs is not None and "lgbm_params" in current_selector_params:
+            current_selector_params["lgbm_params"] = {
+                **current_selector_params["lgbm_params"], 
+                "n_jobs": self.lgbm_n_jobs
+            }
+
+        return set_name, current_selector_params
+
+    def _fit_single_horizon(
+            self,
+            X: pd.DataFrame,
+            y: pd.Series,
+            horizon: int,
+        ) -> contracts.HorizonRunResult:
+        """Optimize and trains the final model for a given horizon"""
+        X_h, y_h = self._prepare_horizon_data(X=X, y=y, horizon=horizon)
+
+        set_name, current_selector_params = self._selector_parameters_for(horizon)
+        
+        # Study persisted alongside the checkpoints : an interrupted search is resumed
+        study_name, storage = None, None
+        if self._checkpoints is not None:
+            study_name, storage = self._checkpoints.study_name(horizon), self._checkpoints.storage
         
         logger.info(f"Start horizon optimization +{horizon}h ({set_name})")
-        best_rmse, best_params = self._optimize_hyperparameters(X_h, y_h, current_selector_params)
+        best_rmse, best_params = self._optimize_hyperparameters(
+            X_h, y_h, current_selector_params, 
+            set_name=set_name,
+            study_name=study_name,
+            storage=storage,
+            warm_start_params=self._warm_start_params_for(horizon)
+        )
+        self._best_params_by_horizon[horizon] = best_params
+
+        return self._fit_final_pipeline(
+            X_h=X_h,
+            y_h=y_h,
+            horizon=horizon,
+            set_name=set_name,
+            selector_parameters=current_selector_params,
+            best_rmse=best_rmse,
+            best_params=best_params,
+        )
+
+    def _fit_horizon_from_champion(
+            self,
+            X: pd.DataFrame,
+            y: pd.Series,
+            horizon: int,
+            rmse_tolerance: float,
+        ) -> contracts.HorizonRunResult:
+        """
+        Refit a horizon with the champion hyperparameters (no search). The full Optuna search is launched
+        only if their CV RMSE exceeds the champion validation RMSE by more than rmse_tolerance.
+        """
+
+        champion_run = self._champion_runs.get(horizon)
+        if champion_run is None or champion_run.get("best_rmse") is None:
+            logger.warning(f"No champion hyperparameters for +{horizon}h : full search")
+            return self._fit_single_horizon(X, y, horizon)
+
+        X_h, y_h = self._prepare_horizon_data(X=X, y=y, horizon=horizon)
+        set_name, current_selector_params = self._selector_parameters_for(horizon)
+        folds_data = self._build_cv_folds(X_h, y_h, current_selector_params, set_name=set_name)
+
+        # 1 - Champion hyperparameters on the fresh folds (n_estimators re-chosen by early stopping)
+        champion_params = self._cast_search_params(champion_run["params"])
+        cv_rmse, n_estimators = self._cross_validate_params(folds_data, champion_params)
+        max_rmse = champion_run["best_rmse"] * (1 + rmse_tolerance)
+
+        if cv_rmse <= max_rmse:
+            self._dataset_cache.clear_memory()
+            best_rmse, best_params = cv_rmse, {**champion_params, "n_estimators": n_estimators}
+            logger.info(f"Horizon +{horizon}h : champion params kept (CV RMSE {cv_rmse:.2f} <= {max_rmse:.2f})")
+
+        # 2 - Degraded : full search on the same folds
+        else:
+            logger.warning(f"Horizon +{horizon}h : CV RMSE {cv_rmse:.2f} > {max_rmse:.2f}, full search")
+            best_rmse, best_params = self._optimize_hyperparameters(
+                X_h, y_h, current_selector_params,
+                set_name=set_name,
+                warm_start_params=self._warm_start_params_for(horizon),
+                folds_data=folds_data,
+            )
+        self._best_params_by_horizon[horizon] = best_params
+
+        return self._fit_final_pipeline(
+            X_h=X_h,
+            y_h=y_h,
+            horizon=horizon,
+            set_name=set_name,
+            selector_parameters=current_selector_params,
+            best_rmse=best_rmse,
+            best_params=best_params,
+        )
+
+    def _fit_final_pipeline(
+            self,
+            X_h: pd.DataFrame,
+            y_h: pd.Series,
+            horizon: int,
+            set_name: str,
+            selector_parameters: Dict[str, Any],
+            best_rmse: float,
+            best_params: Dict[str, Any],
+        ) -> contracts.HorizonRunResult:
+        """Fit processor, selector and model on the whole horizon data with the given hyperparameters"""
 
         # Final training
-        processor = processors.SolarDataProcessor(meteo_features=self.meteo_features)
+        processor = processors.SolarDataProcessor(meteo_features=self.meteo_features, time_window=self.daylight_only)
         processor.fit(X_h, y_h)
         X_scaled = processor.transform(X_h)
         y_scaled = processor.transform_y(y_h)
 
-        selector = processors.LGBMFeatureSelector(**current_selector_params)
+        selector = processors.LGBMFeatureSelector(**selector_parameters)
         selector.fit(X_scaled, y_scaled)
         X_final_input = selector.transform(X_scaled)
 
-        final_model = lgb.LGBMRegressor(**best_params, verbosity=-1, random_state=self.random_state)
+        final_model = lgb.LGBMRegressor(
+            **best_params, 
+            verbosity=-1, 
+            random_state=self.random_state,
+            n_jobs=self.lgbm_n_jobs
+        )
         final_model.fit(X_final_input, y_scaled)
 
         pipeline = Pipeline([
@@ -198,7 +653,7 @@ class SolarTrainingOrchestrator:
             ('model', final_model)
         ])
 
-        return contracts.HorizonRunResult(
+        return contracts.HorizonRunResult.from_training_data(
             horizon=horizon,
             set_name=set_name,
             best_rmse=best_rmse,
@@ -207,39 +662,571 @@ class SolarTrainingOrchestrator:
             X_train=X_h
         )
 
-    def run_training_pipeline(self, X_train: pd.DataFrame, y_train: pd.Series) -> Dict[str, Pipeline]:
+    def _log_horizon_result(self, result: contracts.HorizonRunResult, on_logged: Optional[Callable[[], None]] = None) -> None:
         """
-        Main entrypoint. Multihorizons iterations, launch trainings and log results on MLFlow (interlocking run)
+        Log a horizon child run (tags, params, metric and model) under the active parent run.
+        Queued to the background logger in async mode, on_logged is called once the run is sent.
+        """
+
+        if self.mlflow_logger is not None:
+            self.mlflow_logger.log_child_run(
+                parent_run_id=mlflow.active_run().info.run_id, # type: ignore
+                run_name=f"+{result.horizon}h_{result.set_name}",
+                tags=result.tags_to_log,
+                params=result.params_to_log,
+                metrics={"best_rmse_val": result.best_rmse},
+                sk_model=result.model,
+                signature=result.signature,
+                input_example=result.input_example,
+                on_logged=on_logged,
+            )
+            return
+
+        with mlflow.start_run(run_name=f"+{result.horizon}h_{result.set_name}", nested=True):
+            mlflow.set_tags(result.tags_to_log)
+            mlflow.log_params(result.params_to_log)
+            mlflow.log_metric("best_rmse_val", result.best_rmse)
+            
+            mlflow.sklearn.log_model( # type: ignore
+                sk_model=result.model,
+                artifact_path="model",
+                signature=result.signature,
+                input_example=result.input_example
+            )
+        if on_logged is not None:
+            on_logged()
+
+    def _record_horizon_result(self, result: contracts.HorizonRunResult, checkpointed: bool = False) -> None:
+        """Register a finished horizon : models_dict, local checkpoint and MLflow child run (once)"""
+
+        # Registry model for metamodel
+        self.models_dict[f'+{result.horizon}h'] = result.model
+        self._best_params_by_horizon[result.horizon] = result.best_params
+        self._input_schema = result.input_schema
+
+        if self._checkpoints is not None:
+            if not checkpointed:
+                self._checkpoints.save_result(result)
+            if self._checkpoints.is_logged(result.horizon):
+                return
+
+        # Enfant log run (marked logged only once sent)
+        checkpoints = self._checkpoints
+        self._log_horizon_result(
+            result, 
+            on_logged=(lambda: checkpoints.mark_logged(result.horizon)) if checkpoints is not None else None
+        )
+
+    def _run_parallel_horizons(
+            self, 
+            X_train: pd.DataFrame, 
+            y_train: pd.Series, 
+            horizons: List[int], 
+            n_workers: int
+        ) -> None:
+        """
+        Train horizons across a process pool. The training values are shared once through shared memory,
+        each worker gets its share of the thread budget. Child runs are logged by the parent as results arrive.
+        """
+
+        threads = self.thread_budget.allocate("process_pool", n_workers=n_workers)
+        logger.info(f"Parallel training : {n_workers} workers x {threads.lgbm_n_jobs} threads")
+
+        # 1 - Shared training values (single copy for every worker)
+        values = X_train.to_numpy(dtype=np.float64)
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+            del values
+
+            # 2 - Spawn context (no fork after OpenMP initialization)
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_horizon_worker,
+                initargs=(self, shm.name, X_train.shape, X_train.index, X_train.columns, y_train, threads),
+            ) as executor:
+                futures = {
+                    executor.submit(_fit_horizon_in_worker, horizon): horizon
+                    for horizon in horizons
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    self._record_horizon_result(result)
+                    logger.info(f"[SUCCESS] Horizon +{result.horizon}h trained and logged")
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+        # Horizon order for the meta model
+        self.models_dict = {
+            f'+{horizon}h': self.models_dict[f'+{horizon}h'] for horizon in range(1, self.n_horizons + 1)
+        }
+
+    def run_training_pipeline(
+            self, 
+            X_train: pd.DataFrame, 
+            y_train: pd.Series,
+            n_workers: int = 1,
+            resume: bool = False,
+        ) -> Dict[str, Pipeline]:
+        """
+        Main entrypoint. Multihorizons iterations, launch trainings and log results on MLFlow (interlocking run).
+        n_workers > 1 trains the horizons in parallel processes.
+        resume=True (requires checkpoint_dir) skips the checkpointed horizons and reattaches to the parent MLflow run.
         """
 
         logger.info(f"Pipeline training launch for {self.n_horizons} horizons")
+        self._load_champion_runs()
+
+        # 0 - Checkpoints : reattach or start from scratch
+        run_kwargs: Dict[str, Any] = {"run_name": "MultiHorizon_Training_Pipeline"}
+        if self._checkpoints is not None:
+            run_state = self._checkpoints.load_run_state() if resume else None
+            if run_state is not None:
+                logger.info(f"Resuming training run {run_state['parent_run_id']}")
+                run_kwargs = {"run_id": run_state["parent_run_id"]}
+                self._checkpoints.fail_stale_trials()
+            else:
+                if resume:
+                    logger.warning("No checkpoint to resume from. Fresh training.")
+                self._checkpoints.reset()
+
+        elif resume:
+            raise ValueError("resume=True requires a checkpoint_dir.")
 
         # 1 - Global run
-        with mlflow.start_run(run_name="MultiHorizon_Training_Pipeline") as parent_run:
-            for horizon in range(1, self.n_horizons + 1):
-                result = self._fit_single_horizon(X_train, y_train, horizon)
-                
-                # Registry model for metamodel
-                self.models_dict[f'+{horizon}h'] = result.model
-                
-                # Enfant log run
-                with mlflow.start_run(run_name=f"+{horizon}h_{result.set_name}", nested=True):
-                    mlflow.set_tags(result.tags_to_log)
-                    mlflow.log_params(result.params_to_log)
-                    mlflow.log_metric("best_rmse_val", result.best_rmse)
-                    
-                    mlflow.sklearn.log_model( # type: ignore
-                        sk_model=result.model,
-                        artifact_path="model",
-                        signature=result.signature,
-                        input_example=result.X_train.iloc[:3]
-                    )
+        with self._parent_run(**run_kwargs) as parent_run:
+            self._training_run_id = parent_run.info.run_id
+            if self._checkpoints is not None:
+                self._checkpoints.save_run_state(parent_run.info.run_id)
+                for horizon in self._checkpoints.completed_horizons(self.n_horizons):
+                    result = self._checkpoints.load_result(horizon)
+                    result.validate_input(X_train) # Checkpoint trained on another feature set
+                    self._record_horizon_result(result, checkpointed=True)
+                    logger.info(f"Horizon +{horizon}h restored from checkpoint")
+
+            horizons = [h for h in range(1, self.n_horizons + 1) if f'+{h}h' not in self.models_dict]
+            if n_workers > 1:
+                self._run_parallel_horizons(X_train, y_train, horizons=horizons, n_workers=n_workers)
+            
+            else:
+                with self.threads.apply():
+                    for horizon in horizons:
+                        result = self._fit_single_horizon(X_train, y_train, horizon)
+                        self._record_horizon_result(result)
 
         # 2 - Returns      
         self._is_fitted = True
         logger.info("[SUCCESS] Training pipeline terminated.")
         return self.models_dict
     
+    def run_fast_retrain_pipeline(
+            self, 
+            X_train: pd.DataFrame, 
+            y_train: pd.Series,
+            rmse_tolerance: float = 0.05,
+        ) -> Dict[str, Pipeline]:
+        """
+        Routine retraining on grown data : every horizon is refitted with its champion hyperparameters,
+        the Optuna search only runs for the horizons whose CV RMSE degrades past rmse_tolerance.
+        """
+
+        logger.info(f"Fast retraining launch for {self.n_horizons} horizons")
+        self._champion_runs = champion.load_champion_horizon_runs(model_name=self.model_name)
+        if self._checkpoints is not None:
+            self._checkpoints.reset()
+
+        with self._parent_run(run_name="MultiHorizon_Fast_Retrain_Pipeline") as parent_run:
+            self._training_run_id = parent_run.info.run_id
+            mlflow.log_param("rmse_tolerance", rmse_tolerance)
+
+            for horizon in range(1, self.n_horizons + 1):
+                result = self._fit_horizon_from_champion(X_train, y_train, horizon, rmse_tolerance=rmse_tolerance)
+                self._record_horizon_result(result)
+
+        self._is_fitted = True
+        logger.info("[SUCCESS] Fast retraining terminated.")
+        return self.models_dict
+
+    def _default_horizon_params(self, horizon: int) -> Dict[str, Any]:
+        """Champion hyperparameters of the horizon, selector LightGBM params otherwise (no search)"""
+
+        champion_run = self._champion_runs.get(horizon)
+        source = champion_run["params"] if champion_run is not None else self.selector_parameters["lgbm_params"]
+        params = self._cast_search_params(source)
+        params["n_estimators"] = int(float(source.get("n_estimators", self.max_boost_rounds)))
+
+        return params
+
+    def run_out_of_core_training_pipeline(
+            self,
+            partition_paths: List[str],
+            sample_rows: int = 200_000,
+            n_holdout: int = 24 * 30,
+        ) -> Dict[str, Pipeline]:
+        """
+        Train the horizons from partitioned parquet without loading the feature frame : row groups are
+        scaled chunk by chunk and streamed into LightGBM. No HP search (champion hyperparameters),
+        the feature selector is fitted on the sample_rows most recent rows. 
+        RMSE is measured on the last n_holdout rows, kept out of training.
+        """
+
+        partitions = out_of_core.ParquetPartitions(partition_paths)
+        logger.info(f"Out-of-core training launch : {partitions.n_rows} rows in {len(partitions.paths)} partitions")
+
+        y = partitions.read_target()
+        meteo_processor = out_of_core.fit_processor_streaming(partitions, self.meteo_features)
+        self._champion_runs = champion.load_champion_horizon_runs(model_name=self.model_name)
+        if self._checkpoints is not None:
+            self._checkpoints.reset()
+        
+        dataset_params = {**self.dataset_params}
+        if self.lgbm_n_jobs is not None:
+            dataset_params["num_threads"] = self.lgbm_n_jobs
+
+        with self._parent_run(run_name="MultiHorizon_OutOfCore_Training_Pipeline") as parent_run:
+            self._training_run_id = parent_run.info.run_id
+            for horizon in range(1, self.n_horizons + 1):
+                set_name, current_selector_params = self._selector_parameters_for(horizon)
+                params = self._default_horizon_params(horizon)
+
+                pipeline, X_holdout, y_holdout = out_of_core.train_horizon_out_of_core(
+                    partitions=partitions,
+                    meteo_processor=meteo_processor,
+                    y=y,
+                    horizon=horizon,
+                    selector_parameters=current_selector_params,
+                    params=params,
+                    dataset_params=dataset_params,
+                    sample_rows=sample_rows,
+                    n_holdout=n_holdout,
+                )
+                result = contracts.HorizonRunResult.from_training_data(
+                    horizon=horizon,
+                    set_name=set_name,
+                    best_rmse=self._evaluate_pipeline(pipeline, X_holdout, y_holdout),
+                    best_params=params,
+                    model=pipeline,
+                    X_train=X_holdout
+                )
+                self._record_horizon_result(result)
+                logger.info(f"Horizon +{horizon}h trained out-of-core : holdout RMSE {result.best_rmse:.2f}")
+
+        self._is_fitted = True
+        logger.info("[SUCCESS] Out-of-core training terminated.")
+        return self.models_dict
+
+    def _evaluate_pipeline(self, pipeline: Pipeline, X_h: pd.DataFrame, y_h: pd.Series) -> float:
+        """RMSE (MWh) of a horizon pipeline on already aligned horizon data"""
+
+        norm_pred = pipeline.predict(X_h)
+        y_pred = pipeline.named_steps['processor'].inverse_transform_y(norm_pred, X_h.index)
+
+        return metrics.rmse(y_h, y_pred)
+
+    def _refit_horizon(
+            self, 
+            champion_pipeline: Pipeline, 
+            X_h: pd.DataFrame, 
+            y_h: pd.Series, 
+            y_history: pd.Series,
+            n_new_estimators: int,
+        ) -> Pipeline:
+        """
+        Continue the champion booster on new rows (init_model). Hyperparameters, selected features
+        and meteo scaling are kept, the target denominators are extended to the new history.
+        """
+
+        processor = copy.deepcopy(champion_pipeline.named_steps['processor']).update_target_scaling(y_history)
+        selector = champion_pipeline.named_steps['selector']
+        champion_model = champion_pipeline.named_steps['model']
+
+        model = lgb.LGBMRegressor(**{
+            **champion_model.get_params(), 
+            "n_estimators": n_new_estimators, 
+            "n_jobs": self.lgbm_n_jobs
+        })
+        model.fit(
+            selector.transform(processor.transform(X_h)), 
+            processor.transform_y(y_h),
+            init_model=champion_model.booster_
+        )
+
+        return Pipeline([
+            ('processor', processor),
+            ('selector', selector),
+            ('model', model)
+        ])
+
+    def run_refit_pipeline(
+            self,
+            X_train: pd.DataFrame,
+            y_train: pd.Series,
+            X_holdout: pd.DataFrame,
+            y_holdout: pd.Series,
+            refit_start: Optional[pd.Timestamp] = None,
+            n_new_estimators: int = 100,
+        ) -> bool:
+        """
+        Fast refresh of the champion : each horizon booster is continued on the rows appended since its
+        training (after refit_start, default : last champion training timestamp), without HP search.
+        The refreshed meta model is registered only if its mean holdout RMSE doesn't regress.
+        Return True if a new version was published.
+        """
+
+        logger.info(f"Incremental refit launch for {self.n_horizons} horizons")
+        champion_models = champion.load_champion_models(model_name=self.model_name)
+
+        # 1 - Candidates
+        results: Dict[int, contracts.HorizonRunResult] = {}
+        champion_rmses, candidate_rmses = [], []
+        for horizon in range(1, self.n_horizons + 1):
+            champion_pipeline = champion_models[f'+{horizon}h']
+            X_h, y_h = self._prepare_horizon_data(X=X_train, y=y_train, horizon=horizon)
+            X_hold_h, y_hold_h = self._prepare_horizon_data(X=X_holdout, y=y_holdout, horizon=horizon)
+
+            start = refit_start or champion_pipeline.named_steps['processor'].denominator_series_.index.max()
+            new_rows = X_h.index > start
+            if not new_rows.any():
+                raise ValueError(f"No new rows after {start} to refit horizon +{horizon}h.")
+
+            candidate = self._refit_horizon(
+                champion_pipeline, 
+                X_h.loc[new_rows], 
+                y_h.loc[new_rows], 
+                y_history=y_h,
+                n_new_estimators=n_new_estimators
+            )
+            champion_rmses.append(self._evaluate_pipeline(champion_pipeline, X_hold_h, y_hold_h))
+            candidate_rmses.append(self._evaluate_pipeline(candidate, X_hold_h, y_hold_h))
+
+            set_name, _ = self._selector_parameters_for(horizon)
+            model = candidate.named_steps['model']
+            results[horizon] = contracts.HorizonRunResult.from_training_data(
+                horizon=horizon,
+                set_name=set_name,
+                best_rmse=candidate_rmses[-1],
+                best_params={
+                    **self._cast_search_params(model.get_params()), 
+                    "n_estimators": model.booster_.current_iteration()
+                },
+                model=candidate,
+                X_train=X_h.loc[new_rows]
+            )
+            logger.info(f"Horizon +{horizon}h refitted : holdout RMSE {champion_rmses[-1]:.2f} -> {candidate_rmses[-1]:.2f}")
+
+        # 2 - Gate on holdout RMSE
+        champion_rmse, candidate_rmse = float(np.mean(champion_rmses)), float(np.mean(candidate_rmses))
+        accepted = candidate_rmse <= champion_rmse
+        if accepted and self._checkpoints is not None:
+            self._checkpoints.reset()
+
+        with self._parent_run(run_name="MultiHorizon_Refit_Pipeline") as parent_run:
+            mlflow.log_metrics({"champion_holdout_rmse": champion_rmse, "candidate_holdout_rmse": candidate_rmse})
+            mlflow.set_tag("refit_accepted", str(accepted))
+
+            if accepted:
+                self._training_run_id = parent_run.info.run_id
+                for result in results.values():
+                    self._record_horizon_result(result)
+
+        if not accepted:
+            logger.warning(f"[REFIT] Rejected : holdout RMSE {candidate_rmse:.2f} > champion {champion_rmse:.2f}")
+            return False
+
+        self._is_fitted = True
+        self.package_and_log_meta_model(X_sample=X_holdout.iloc[:3], run_name="LGBM_DirectPrediction_J+1_refit")
+        logger.info(f"[SUCCESS] Refit published : holdout RMSE {champion_rmse:.2f} -> {candidate_rmse:.2f}")
+
+        return True
+
+    def run_drift_retrain_pipeline(
+            self,
+            X_train: pd.DataFrame,
+            y_train: pd.Series,
+            X_recent: pd.DataFrame,
+            y_recent: pd.Series,
+            planner: Optional[RetrainPlanner] = None,
+        ) -> List[int]:
+        """
+        Partial retraining : only the horizons whose inputs (PSI) or recent error drifted against the champion
+        are optimized and refitted on X_train, the other champion pipelines are kept as is.
+        The spliced meta model is published as a new version. Return the retrained horizons.
+        """
+
+        planner = planner or RetrainPlanner()
+        champion_models = champion.load_champion_models(model_name=self.model_name)
+        base_training_run_id = champion.champion_training_run_id(model_name=self.model_name)
+        self._champion_runs = champion.load_champion_horizon_runs(model_name=self.model_name)
+
+        # 1 - Drift plan, reference = champion training period of each horizon
+        horizon_data = {}
+        for horizon in range(1, self.n_horizons + 1):
+            X_h, _ = self._prepare_horizon_data(X=X_train, y=y_train, horizon=horizon)
+            X_recent_h, y_recent_h = self._prepare_horizon_data(X=X_recent, y=y_recent, horizon=horizon)
+            
+            champion_pipeline = champion_models.get(f'+{horizon}h')
+            if champion_pipeline is not None:
+                trained_until = champion_pipeline.named_steps['processor'].denominator_series_.index.max()
+                X_h = X_h.loc[X_h.index <= trained_until]
+            horizon_data[horizon] = {"X_reference": X_h, "X_recent": X_recent_h, "y_recent": y_recent_h}
+
+        reports = planner.plan(
+            champion_models=champion_models, 
+            champion_runs=self._champion_runs, 
+            horizon_data=horizon_data
+        )
+        horizons = [h for h, report in reports.items() if report.retrain]
+        if not horizons:
+            logger.info("[DRIFT] No horizon crossed the thresholds. Champion kept.")
+            return []
+
+        logger.info(f"[DRIFT] Retraining horizons {horizons}")
+        if self._checkpoints is not None:
+            self._checkpoints.reset()
+
+        # 2 - Retrain the drifted horizons, splice them into the champion pipelines
+        self.models_dict = dict(champion_models)
+        with self._parent_run(run_name="MultiHorizon_Drift_Retrain_Pipeline") as parent_run:
+            self._training_run_id = parent_run.info.run_id
+            if base_training_run_id is not None:
+                mlflow.set_tag("base_training_run_id", base_training_run_id) # Kept horizons runs
+            mlflow.log_metrics({
+                **{f"psi_max_h{h}": report.max_psi for h, report in reports.items()},
+                **{f"recent_rmse_h{h}": report.recent_rmse for h, report in reports.items()},
+            })
+            mlflow.log_param("retrained_horizons", ",".join(map(str, horizons)))
+
+            for horizon in horizons:
+                result = self._fit_single_horizon(X_train, y_train, horizon)
+                self._record_horizon_result(result)
+
+        # 3 - New version
+        self._is_fitted = True
+        self.package_and_log_meta_model(X_sample=X_recent.iloc[:3], run_name="LGBM_DirectPrediction_J+1_drift_retrain")
+        logger.info(f"[SUCCESS] Drift retraining terminated : {len(horizons)}/{self.n_horizons} horizons retrained")
+
+        return horizons
+
+    def run_worker(self, X_train: pd.DataFrame, y_train: pd.Series, workspace_dir: str) -> None:
+        """
+        Distributed worker mode (one or several per node). Every worker goes through the horizons :
+        it adds trials to the shared horizon study until its trial budget is reached (warm_num_trials if warm
+        started), then a single worker claims the final fit and writes the result in the shared workspace.
+        """
+
+        workspace = SharedTrainingWorkspace(workspace_dir)
+        logger.info(f"[WORKER] Started on workspace {workspace_dir}")
+        self._load_champion_runs()
+        with self.threads.apply(): # Thread limits held while the worker runs, restored on exit
+            for horizon in range(1, self.n_horizons + 1):
+                if workspace.has_result(horizon):
+                    continue
+
+                set_name, current_selector_params = self._selector_parameters_for(horizon)
+                study_name = workspace.study_name(horizon)
+                warm_start_params = self._warm_start_params_for(horizon)
+
+                # 1 - Trial work units (skipped before any data preparation if the budget is already taken)
+                study = optuna.create_study(
+                    direction="minimize", 
+                    study_name=study_name, 
+                    storage=workspace.storage, 
+                    load_if_exists=True
+                )
+                X_h, y_h = None, None
+                if self._finished_trials(study) < self._trial_budget(warm_start_params):
+                    logger.info(f"[WORKER] Trials on +{horizon}h ({set_name})")
+                    X_h, y_h = self._prepare_horizon_data(X=X_train, y=y_train, horizon=horizon)
+                    self._optimize_hyperparameters(
+                        X_h, y_h, current_selector_params, 
+                        set_name=set_name, 
+                        study_name=study_name, 
+                        storage=workspace.storage,
+                        warm_start_params=warm_start_params
+                    )
+
+                # 2 - Final fit work unit
+                if not workspace.try_claim(f"fit_{study_name}"):
+                    continue
+            
+                try:
+                    if X_h is None:
+                        X_h, y_h = self._prepare_horizon_data(X=X_train, y=y_train, horizon=horizon)
+                    workspace.wait_running_trials(study)
+                    best_rmse, best_params = self._best_from_study(study)
+                    self._best_params_by_horizon[horizon] = best_params
+                    result = self._fit_final_pipeline(
+                        X_h=X_h,
+                        y_h=y_h,
+                        horizon=horizon,
+                        set_name=set_name,
+                        selector_parameters=current_selector_params,
+                        best_rmse=best_rmse,
+                        best_params=best_params,
+                    )
+                    workspace.save_result(result)
+                    logger.info(f"[WORKER] [SUCCESS] Horizon +{horizon}h fitted")
+            
+                except Exception:
+                    workspace.release(f"fit_{study_name}")
+                    raise
+
+        logger.info("[WORKER] No work unit left.")
+
+    def run_coordinator(
+            self, 
+            workspace_dir: str, 
+            X_sample: pd.DataFrame,
+            poll_interval: float = 30,
+            timeout: Optional[float] = None,
+        ) -> Dict[str, Pipeline]:
+        """
+        Distributed coordinator mode. Wait for the workers results, log the child runs,
+        assemble models_dict and package the meta model.
+        """
+
+        workspace = SharedTrainingWorkspace(workspace_dir)
+        start = time.monotonic()
+
+        # 1 - Wait for every horizon
+        while len(workspace.completed_horizons(self.n_horizons)) < self.n_horizons:
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise TimeoutError(
+                    f"Distributed training incomplete after {timeout}s : "
+                    f"{workspace.completed_horizons(self.n_horizons)} horizons done"
+                )
+            time.sleep(poll_interval)
+
+        # 2 - Assemble and log
+        results = workspace.load_results(self.n_horizons)
+        with self._parent_run(run_name="MultiHorizon_Distributed_Training_Pipeline") as parent_run:
+            self._training_run_id = parent_run.info.run_id
+            for horizon, result in results.items():
+                result.validate_input(X_sample)
+                self.models_dict[f'+{horizon}h'] = result.model
+                self._input_schema = result.input_schema
+                self._log_horizon_result(result)
+
+        self._is_fitted = True
+        logger.info("[SUCCESS] Distributed training collected.")
+
+        # 3 - Meta model
+        self.package_and_log_meta_model(X_sample=X_sample)
+
+        return self.models_dict
+
+    def _build_meta_model(self) -> mlflow.pyfunc.PythonModel:
+        """PyFunc wrapper of the fitted horizons"""
+        return model_wrappers.MultiHorizonLGBMWrapper(
+            models_dict=self.models_dict, 
+            num_horizons=self.n_horizons,
+            daylight=self._daylight_params() if self.daylight_only else None,
+            input_schema=self._input_schema
+            )
+
     def package_and_log_meta_model(self, X_sample: pd.DataFrame, run_name: str = "LGBM_DirectPrediction_J+1") -> None:
         """
         Wraps all the pipelines int the LGBMwraapper and save on MLflow server as a unique artifact.
@@ -249,16 +1236,15 @@ class SolarTrainingOrchestrator:
 
         date = datetime.now().strftime("%Y-%m-%d")
         artifact_path = f"{date}_wrapped_denormalized_lgbm_model"
-        meta_model = model_wrappers.MultiHorizonLGBMWrapper(
-            models_dict=self.models_dict, 
-            num_horizons=self.n_horizons
-            )
+        meta_model = self._build_meta_model()
         
         # Unique name
-        model_name = "Solar_MultiHorizon_Forecaster"
+        model_name = self.model_name
 
-        # Specific run (out of deployment)
+        # Specific run (out of deployment), linked to the horizon runs for the next warm starts
         with mlflow.start_run(run_name=run_name):
+            if self._training_run_id is not None:
+                mlflow.set_tag("training_run_id", self._training_run_id)
             model_info = mlflow.pyfunc.log_model(
                 artifact_path=artifact_path,
                 python_model=meta_model,
@@ -0,0 +1,82 @@
+# Champion lookups on the MLflow registry (hyperparameters and metrics of the horizon child runs)
+
+import logging
+from typing import Any, Dict, Optional
+
+import mlflow
+from mlflow.tracking import MlflowClient
+from sklearn.pipeline import Pipeline
+
+logger = logging.getLogger(__name__)
+
+def champion_training_run_id(model_name: str, alias: str = "champion") -> Optional[str]:
+    """Training run that produced the registered champion ('training_run_id' tag of the packaging run)"""
+
+    client = MlflowClient()
+    try:
+        version = client.get_model_version_by_alias(name=model_name, alias=alias)
+        packaging_run = client.get_run(version.run_id)
+
+    except mlflow.exceptions.MlflowException as e:
+        logger.warning(f"No champion found for '{model_name}@{alias}' : {e}")
+        return None
+
+    training_run_id = packaging_run.data.tags.get("training_run_id")
+    if training_run_id is None:
+        logger.warning(f"Champion version {version.version} has no 'training_run_id' tag. No horizon runs.")
+
+    return training_run_id
+
+def load_training_horizon_runs(training_run_id: str) -> Dict[int, Dict[str, Any]]:
+    """
+    Return {horizon: {"params": {...}, "best_rmse": float}} from the child runs of a training run.
+    A partial retraining run only holds its retrained horizons : the others are read from the run
+    it was spliced on ('base_training_run_id' tag), recursively.
+    """
+
+    client = MlflowClient()
+    training_run = client.get_run(training_run_id)
+    child_runs = mlflow.search_runs(
+        experiment_ids=[training_run.info.experiment_id],
+        filter_string=f"tags.mlflow.parentRunId = '{training_run_id}'",
+        output_format="list",
+    )
+
+    horizon_runs = {}
+    base_training_run_id = training_run.data.tags.get("base_training_run_id")
+    if base_training_run_id is not None:
+        horizon_runs.update(load_training_horizon_runs(base_training_run_id))
+
+    for run in child_runs:
+        params = dict(run.data.params)
+        if "horizon" not in params:
+            continue
+        horizon_runs[int(params["horizon"])] = {
+            "params": params,
+            "best_rmse": run.data.metrics.get("best_rmse_val"),
+        }
+
+    return horizon_runs
+
+def load_champion_horizon_runs(model_name: str, alias: str = "champion") -> Dict[int, Dict[str, Any]]:
+    """
+    Return {horizon: {"params": {...}, "best_rmse": float}} for the registered champion.
+    Params are returned as logged by MLflow (strings). Empty dict if no champion can be resolved.
+    """
+
+    training_run_id = champion_training_run_id(model_name=model_name, alias=alias)
+    if training_run_id is None:
+        return {}
+
+    horizon_runs = load_training_horizon_runs(training_run_id)
+    logger.info(f"Champion '{model_name}@{alias}' : {len(horizon_runs)} horizon runs loaded")
+
+    return horizon_runs
+
+def load_champion_models(model_name: str, alias: str = "champion") -> Dict[str, Pipeline]:
+    """Return the per-horizon pipelines ({'+1h': Pipeline, ...}) of the registered meta model"""
+
+    meta_model = mlflow.pyfunc.load_model(f"models:/{model_name}@{alias}").unwrap_python_model()
+    logger.info(f"Champion '{model_name}@{alias}' loaded : {len(meta_model.models_dict)} horizons")
+
+    return meta_model.models_dict
@@ -0,0 +1,75 @@
+# Local checkpoints of a multi-horizon training run (resume after a crash)
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import optuna
+from optuna.trial import TrialState
+
+from src.training.distributed import SharedTrainingWorkspace
+
+logger = logging.getLogger(__name__)
+
+class TrainingCheckpointStore(SharedTrainingWorkspace):
+    """
+    Checkpoint directory of a training run, same layout as the distributed workspace :
+    - results/ : one HorizonRunResult per finished horizon (pipeline, best params, RMSE)
+    - optuna_journal.log : Optuna study state of every horizon (a study interrupted mid-search is resumed)
+    - run_state.json : parent MLflow run id, to reattach on resume
+    - logged/ : markers of the horizons already logged on MLflow
+    """
+
+    def __init__(self, root: str | Path):
+        super().__init__(root)
+        self.logged_dir = self.root / "logged"
+        self.logged_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def _run_state_path(self) -> Path:
+        return self.root / "run_state.json"
+
+    def reset(self) -> None:
+        """Forget a previous run (fresh training in the same directory)"""
+
+        for directory in (self.results_dir, self.locks_dir, self.logged_dir):
+            for path in directory.iterdir():
+                path.unlink()
+        for path in (self.root / "optuna_journal.log", self._run_state_path):
+            path.unlink(missing_ok=True)
+        self._storage = None
+
+    # 1 - Run state
+
+    def save_run_state(self, parent_run_id: str) -> None:
+        tmp_path = self._run_state_path.with_suffix(f".tmp-{os.getpid()}")
+        tmp_path.write_text(json.dumps({"parent_run_id": parent_run_id}))
+        os.replace(tmp_path, self._run_state_path)
+
+    def load_run_state(self) -> Optional[Dict[str, Any]]:
+        if not self._run_state_path.exists():
+            return None
+        return json.loads(self._run_state_path.read_text())
+
+    # 2 - MLflow markers
+
+    def mark_logged(self, horizon: int) -> None:
+        (self.logged_dir / f"+{horizon}h").touch()
+
+    def is_logged(self, horizon: int) -> bool:
+        return (self.logged_dir / f"+{horizon}h").exists()
+
+    # 3 - Optuna
+
+    def fail_stale_trials(self) -> None:
+        """Trials left RUNNING by the crashed process are marked FAIL so the resumed study can go on"""
+
+        for summary in optuna.get_all_study_summaries(storage=self.storage, include_best_trial=False):
+            study = optuna.load_study(study_name=summary.study_name, storage=self.storage)
+            study_id = self.storage.get_study_id_from_name(summary.study_name)
+            for trial in study.get_trials(deepcopy=False, states=(TrialState.RUNNING,)):
+                trial_id = self.storage.get_trial_id_from_study_id_trial_number(study_id, trial.number)
+                self.storage.set_trial_state_values(trial_id, state=TrialState.FAIL)
+                logger.info(f"[CHECKPOINT] Stale trial {trial.number} of {summary.study_name} marked as failed")
@@ -0,0 +1,122 @@
+# LightGBM binary dataset cache
+# Constructed (binned) datasets are saved with save_binary and reloaded on the next runs
+
+import os
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+import lightgbm as lgb
+
+logger = logging.getLogger(__name__)
+
+class LGBMDatasetCache:
+    """
+    Local cache of constructed LightGBM datasets, one binary file per (horizon group, fold, dataset hash).
+    The hash covers the final model input (scaled values, selected columns, index), the target
+    and the binning parameters: a changed dataset or feature selection gives a new key.
+    Datasets are also kept in memory so every Optuna trial reuses the same histograms.
+    Disk eviction : files unused for max_age_days are removed, then the least recently used beyond max_entries.
+    Only the binning is cached : the processor and the feature selector are still fitted on every run.
+    """
+
+    def __init__(
+            self, 
+            cache_dir: Optional[str | Path], 
+            dataset_params: Dict[str, Any],
+            max_entries: Optional[int] = 64,
+            max_age_days: Optional[float] = 30,
+        ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.dataset_params = dataset_params
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._memory: Dict[str, lgb.Dataset] = {}
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.evict()
+
+    def dataset_hash(self, X: pd.DataFrame, y: pd.Series) -> str:
+        """Content hash of a model input and its target"""
+
+        hasher = hashlib.sha1()
+        hasher.update("|".join(map(str, X.columns)).encode())
+        hasher.update(pd.util.hash_pandas_object(X, index=True).values.tobytes())
+        hasher.update(pd.util.hash_pandas_object(y, index=True).values.tobytes())
+        hasher.update(json.dumps(self.dataset_params, sort_keys=True, default=str).encode())
+        hasher.update(lgb.__version__.encode()) # Binary format is version dependant
+
+        return hasher.hexdigest()[:16]
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{key}.bin"
+
+    def get_or_build(self, set_name: str, fold: int, X: pd.DataFrame, y: pd.Series) -> lgb.Dataset:
+        """Return a constructed Dataset, loaded from cache if the key matches, built and saved otherwise"""
+
+        key = f"{set_name}_fold{fold}_{self.dataset_hash(X, y)}"
+        if key in self._memory:
+            return self._memory[key]
+
+        # 1 - Disk hit
+        if self.cache_dir is not None and self._path(key).exists():
+            try:
+                dataset = lgb.Dataset(str(self._path(key)), params=self.dataset_params).construct()
+                self._path(key).touch() # Last use, for eviction
+                logger.info(f"[CACHE] LightGBM dataset loaded: {key}")
+                self._memory[key] = dataset
+                return dataset
+
+            except lgb.basic.LightGBMError as e:
+                logger.warning(f"[CACHE] Unreadable dataset {key}, rebuilding : {e}")
+
+        # 2 - Build
+        dataset = lgb.Dataset(X, label=y, params=self.dataset_params, free_raw_data=True).construct()
+
+        # 3 - Atomic save (concurrent runs may share the same directory)
+        if self.cache_dir is not None:
+            tmp_path = self.cache_dir / f"{key}.bin.tmp-{os.getpid()}"
+            dataset.save_binary(str(tmp_path))
+            os.replace(tmp_path, self._path(key))
+            logger.info(f"[CACHE] LightGBM dataset saved: {key}")
+            self.evict()
+
+        self._memory[key] = dataset
+        return dataset
+
+    def evict(self) -> None:
+        """Remove the binary files unused for max_age_days, then the least recently used beyond max_entries"""
+
+        if self.cache_dir is None:
+            return
+
+        files = []
+        for path in self.cache_dir.glob("*.bin"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError: # Evicted by a concurrent run
+                continue
+        files.sort(reverse=True)
+
+        expired = []
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400
+            expired = [path for mtime, path in files if mtime < cutoff]
+            files = [(mtime, path) for mtime, path in files if mtime >= cutoff]
+        if self.max_entries is not None:
+            expired += [path for _, path in files[self.max_entries:]]
+
+        for path in expired:
+            path.unlink(missing_ok=True)
+        if expired:
+            logger.info(f"[CACHE] {len(expired)} LightGBM dataset(s) evicted")
+
+    def clear_memory(self) -> None:
+        """Release in-memory datasets (disk files are kept)"""
+        self._memory.clear()
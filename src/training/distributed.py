@@ -0,0 +1,106 @@
+# Shared workspace for multi-node training
+# Workers coordinate through files only (Optuna journal + atomic lock files) on a network filesystem
+
+import os
+import time
+import socket
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import joblib
+import optuna
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
+from optuna.trial import TrialState
+
+from src.models import contracts
+
+logger = logging.getLogger(__name__)
+
+class SharedTrainingWorkspace:
+    """
+    Directory shared by training workers (one directory per training run) :
+    - optuna_journal.log : Optuna journal storage, one study per horizon (trial work units)
+    - locks/ : exclusive claims (O_CREAT | O_EXCL) so a single worker fits each final pipeline
+    - results/ : finished HorizonRunResult, collected by the coordinator
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.locks_dir = self.root / "locks"
+        self.results_dir = self.root / "results"
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self._storage: Optional[JournalStorage] = None
+
+    def __getstate__(self) -> Dict:
+        # Journal storage holds locks : rebuilt lazily in each process
+        return {**self.__dict__, "_storage": None}
+
+    @property
+    def storage(self) -> JournalStorage:
+        """Lazy Optuna journal storage (no database server needed)"""
+        if self._storage is None:
+            self._storage = JournalStorage(JournalFileBackend(str(self.root / "optuna_journal.log")))
+
+        return self._storage
+
+    @staticmethod
+    def study_name(horizon: int) -> str:
+        return f"horizon_{horizon:02d}"
+
+    def _result_path(self, horizon: int) -> Path:
+        return self.results_dir / f"+{horizon}h.joblib"
+
+    # 1 - Locks
+
+    def try_claim(self, name: str) -> bool:
+        """Atomically claim a work unit. Return False if another worker owns it"""
+        try:
+            fd = os.open(self.locks_dir / f"{name}.lock", os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(fd, "w") as f:
+            f.write(f"{socket.gethostname()}:{os.getpid()}")
+
+        return True
+
+    def release(self, name: str) -> None:
+        """Release a claim (failed work unit, another worker may take it)"""
+        (self.locks_dir / f"{name}.lock").unlink(missing_ok=True)
+
+    # 2 - Trials
+
+    def wait_running_trials(self, study: optuna.Study, poll_interval: float = 10, timeout: float = 3600) -> None:
+        """Wait for trials still running on other workers before reading the best trial"""
+
+        deadline = time.monotonic() + timeout
+        while study.get_trials(deepcopy=False, states=(TrialState.RUNNING,)):
+            if time.monotonic() > deadline:
+                logger.warning(f"[DISTRIBUTED] {study.study_name} : running trials ignored after {timeout}s")
+                return
+            time.sleep(poll_interval)
+
+    # 3 - Results
+
+    def save_result(self, result: contracts.HorizonRunResult) -> None:
+        """Atomic result write (the coordinator never reads a partial file)"""
+
+        path = self._result_path(result.horizon)
+        tmp_path = path.with_name(f"{path.name}.tmp-{socket.gethostname()}-{os.getpid()}")
+        joblib.dump(result, tmp_path)
+        os.replace(tmp_path, path)
+
+    def has_result(self, horizon: int) -> bool:
+        return self._result_path(horizon).exists()
+
+    def completed_horizons(self, n_horizons: int) -> List[int]:
+        return [h for h in range(1, n_horizons + 1) if self.has_result(h)]
+
+    def load_result(self, horizon: int) -> contracts.HorizonRunResult:
+        return joblib.load(self._result_path(horizon))
+
+    def load_results(self, n_horizons: int) -> Dict[int, contracts.HorizonRunResult]:
+        return {h: self.load_result(h) for h in range(1, n_horizons + 1)}
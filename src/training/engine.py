@@ -5,7 +5,8 @@
 import pandas as pd
 import numpy as np
 from math import inf
-from src.etl import processors
+from src.etl import processors, data_preparation
+from src.models import architectures
 
 # ML - DL
 from sklearn.model_selection import TimeSeriesSplit
@@ -14,20 +15,141 @@ import torch
 from torch.utils.data import DataLoader
 import optuna
 from optuna.pruners import MedianPruner
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 import lightgbm as lgb
 from sklearn.metrics import mean_squared_error
 from src.utils.metrics import rmse
+from src.utils.threads import ThreadBudget, ThreadAllocation
+from src.utils.config import settings
 
 # Utils
 from typing import Any, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+import os
+import hashlib
 import logging
 import traceback
+import time
+import itertools
+import tempfile
+import contextlib
+from pathlib import Path
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 ############################################################################ SARIMAX ####################################################################
 
-def train_sarimax(X: pd.DataFrame, y: pd.Series,  nb_cv_splits: int, num_trials: Optional[int|None]) -> tuple:
+# Process pool state : training data sent once per worker
+_SARIMAX_STATE: Dict[str, Any] = {}
+
+def _init_sarimax_worker(X: pd.DataFrame, y: pd.Series, threads: ThreadAllocation) -> None:
+    _SARIMAX_STATE.update({"X": X, "y": y, "limits": threads.apply()})
+
+def _score_sarimax_candidate(
+        params: Dict[str, int], 
+        fold_bounds: List[Tuple[int, int]], 
+        seasonal_period: int,
+        refit_folds: bool,
+    ) -> Tuple[Dict[str, int], float]:
+    """
+    Mean CV RMSE of one SARIMAX order on expanding folds. Only the first fold is a cold fit : each next
+    training window is appended to the previous results (warm start from the previous parameters
+    if refit_folds, filtering with fixed parameters otherwise).
+    """
+
+    X, y = _SARIMAX_STATE["X"], _SARIMAX_STATE["y"]
+    order = (params["p"], params["d"], params["q"])
+    seasonal_order = (params["P"], params["D"], params["Q"], seasonal_period)
+
+    rmses = []
+    results = None
+    train_end = 0
+    try:
+        for fold_train_end, fold_val_end in fold_bounds:
+            if results is None:
+                results = SARIMAX(endog=y.iloc[:fold_train_end], 
+                                  exog=X.iloc[:fold_train_end], 
+                                  order=order, 
+                                  seasonal_order=seasonal_order,
+                                  enforce_stationarity=False,
+                                  enforce_invertibility=False).fit(disp=False)
+            else:
+                # Expanding window : previous fit state extended with the new rows (fit_kwargs only with refit)
+                fit_kwargs = {"start_params": results.params, "disp": False} if refit_folds else None
+                results = results.append(
+                    endog=y.iloc[train_end:fold_train_end],
+                    exog=X.iloc[train_end:fold_train_end],
+                    refit=refit_folds,
+                    fit_kwargs=fit_kwargs,
+                )
+            train_end = fold_train_end
+
+            predictions = results.forecast(steps=fold_val_end - fold_train_end, exog=X.iloc[fold_train_end:fold_val_end]) # type: ignore
+            rmses.append(rmse(y.iloc[fold_train_end:fold_val_end], predictions))
+
+    except Exception as e:
+        logging.info(f"Echec de l'entrainement du modèle {order}{seasonal_order} : {e}")
+        logging.debug("Détails complets :\n%s", traceback.format_exc())
+        return params, inf
+
+    return params, float(np.mean(rmses))
+
+def train_sarimax_grid(
+        X: pd.DataFrame, 
+        y: pd.Series, 
+        nb_cv_splits: int,
+        n_workers: Optional[int] = None,
+        refit_folds: bool = True,
+        seasonal_period: int = 24,
+        thread_budget: Optional[ThreadBudget] = None,
+    ) -> Tuple[float, Dict[str, int]]:
+    """
+    Exhaustive search over the 2^6 (p, d, q, P, D, Q) orders in a process pool (one candidate per task).
+    Returns (best_rmse, best_params) as train_sarimax.
+    """
+
+    folds = TimeSeriesSplit(n_splits=nb_cv_splits)
+    fold_bounds = [(int(train_idx[-1]) + 1, int(val_idx[-1]) + 1) for train_idx, val_idx in folds.split(X)]
+    grid = [
+        dict(zip(("p", "d", "q", "P", "D", "Q"), values)) 
+        for values in itertools.product((0, 1), repeat=6)
+    ]
+
+    budget = thread_budget or ThreadBudget.from_settings(settings)
+    n_workers = n_workers or budget.total_threads
+    threads = budget.allocate("process_pool", n_workers=n_workers)
+    logging.info(f"SARIMAX grid : {len(grid)} candidates, {n_workers} workers x {threads.blas_threads} threads")
+
+    scores = []
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_sarimax_worker,
+        initargs=(X, y, threads),
+    ) as executor:
+        futures = [
+            executor.submit(_score_sarimax_candidate, params, fold_bounds, seasonal_period, refit_folds) 
+            for params in grid
+        ]
+        for future in as_completed(futures):
+            scores.append(future.result())
+
+    best_params, best_rmse = min(scores, key=lambda score: score[1])
+    if best_rmse == inf:
+        raise RuntimeError("SARIMAX grid : every candidate failed.")
+
+    return best_rmse, best_params
+
+def train_sarimax(
+        X: pd.DataFrame, 
+        y: pd.Series,  
+        nb_cv_splits: int, 
+        num_trials: Optional[int|None], 
+        search_mode: str = "optuna",
+        **grid_kwargs
+    ) -> tuple:
     
     """Entrainement d'un modèle SARIMAX avec nombre d'essais pour optimisation.
     Retourne la quantification de son erreur (best_rmse) et ses hyperparamètres 
@@ -42,7 +164,12 @@ def train_sarimax(X: pd.DataFrame, y: pd.Series,  nb_cv_splits: int, num_trials:
     Returns:
         best_rmse (float), dict_best_params (Dict) : Erreur (best_rmse) 
         et ses hyperparamètres optimaux (dict_best_params)
+        
+    search_mode="grid" : recherche exhaustive parallèle avec réutilisation d'état entre folds (train_sarimax_grid)
     """
+    if search_mode == "grid":
+        return train_sarimax_grid(X, y, nb_cv_splits, **grid_kwargs)
+    
     # Initialisation
     folds = TimeSeriesSplit(n_splits=nb_cv_splits)
 
@@ -123,7 +250,10 @@ def train_lightgbm(X: pd.DataFrame,
                    meteo_features: List[str],
                    nb_cv_splits: int,
                    num_trials: Optional[int|None],
-                   selector_parameters: Dict[str, Any]
+                   selector_parameters: Dict[str, Any],
+                   max_boost_rounds: int = 1000,
+                   early_stopping_rounds: int = 50,
+                   threads: Optional[ThreadAllocation] = None,
                    ) -> Tuple[float, Dict[Any, Any]]:
     
     """Entrainement d'un modèle LightGBM avec nombre d'essais pour optimisation.
@@ -143,6 +273,13 @@ def train_lightgbm(X: pd.DataFrame,
 
     # Folds
     tscv = TimeSeriesSplit(gap=0, n_splits=nb_cv_splits)
+
+    # Threads : concurrent trials x LightGBM threads within the node budget
+    threads = threads or ThreadBudget.from_settings(settings).allocate("sequential")
+    selector_parameters = {
+        **selector_parameters,
+        "lgbm_params": {**selector_parameters["lgbm_params"], "n_jobs": threads.lgbm_n_jobs}
+    }
     
     # Selector fit
     final_processor = processors.SolarDataProcessor(meteo_features=meteo_features)
@@ -168,14 +305,16 @@ def train_lightgbm(X: pd.DataFrame,
             "num_leaves" : trial.suggest_int("num_leaves", 10, 100),
             "learning_rate" : trial.suggest_float("learning_rate", 0.005, 0.2, log=True),
             "max_depth" : trial.suggest_int("max_depth", 1, 30),
-            "n_estimators" : trial.suggest_int("n_estimators", 100, 1000),
+            "n_estimators" : max_boost_rounds, # Borne haute, le nombre d'arbres est choisi par early stopping
             "min_child_samples" : trial.suggest_int("min_child_samples", 10, 50),
             "verbosity" : -1,
-            "random_state": 42
+            "random_state": 42,
+            "n_jobs": threads.lgbm_n_jobs,
         }
         scores = []
+        best_iterations = []
 
-        for train_idx, val_idx in tscv.split(X):
+        for step, (train_idx, val_idx) in enumerate(tscv.split(X)):
             X_train, X_val = X.iloc[train_idx], X.iloc[val_idx]
             y_train, y_val = y.iloc[train_idx], y.iloc[val_idx]
 
@@ -186,10 +325,17 @@ def train_lightgbm(X: pd.DataFrame,
             X_train_scaled = final_processor.transform(X=X_train)
             y_train_scaled = final_processor.transform_y(y=y_train)
 
-            # 2 - Model fit on selected_features
+            # 2 - Model fit on selected_features, early stopping on the validation slice
             final_model = lgb.LGBMRegressor(**params)
             X_train_final = selector.transform(X_train_scaled)
-            final_model.fit(X_train_final, y_train_scaled)
+            X_val_final = selector.transform(final_processor.transform(X=X_val))
+            final_model.fit(
+                X_train_final, 
+                y_train_scaled,
+                eval_set=[(X_val_final, final_processor.transform_y(y=y_val))],
+                callbacks=[lgb.early_stopping(early_stopping_rounds, verbose=False)]
+            )
+            best_iterations.append(final_model.best_iteration_)
             
             # 3 - Pipeline already fitted
             pipeline = Pipeline([
@@ -206,6 +352,14 @@ def train_lightgbm(X: pd.DataFrame,
             
             scores.append(rmse(y_true=y_val, y_pred=y_pred))
 
+            # RMSE cumulé des folds pour le pruner
+            trial.report(float(np.mean(scores)), step=step)
+            if trial.should_prune():
+                if checkpoint_path is not None:
+                    checkpoint_path.unlink(missing_ok=True)
+                raise optuna.TrialPruned()
+
+        trial.set_user_attr("n_estimators", int(np.mean(best_iterations)))
         return np.mean(scores) # type: ignore
     
     # Recherche des HP et prédiction
@@ -213,12 +367,14 @@ def train_lightgbm(X: pd.DataFrame,
     study = optuna.create_study(direction="minimize",
                                 pruner=MedianPruner(
                                     n_startup_trials=5, 
-                                    n_warmup_steps=3)
+                                    n_warmup_steps=1)
                                 )
     
-    study.optimize(objective_lightgbm, n_trials=num_trials, n_jobs=-1)
+    with threads.apply():
+        study.optimize(objective_lightgbm, n_trials=num_trials, n_jobs=threads.optuna_n_jobs)
+    best_params = {**study.best_params, "n_estimators": study.best_trial.user_attrs["n_estimators"]}
 
-    return study.best_value, study.best_params
+    return study.best_value, best_params
 
 def fit_best_model(
         X: pd.DataFrame, 
@@ -278,19 +434,102 @@ class EarlyStopping:
     best_loss:   float = field(default=float("inf"), init=False)
     counter:     int   = field(default=0,            init=False)
     should_stop: bool  = field(default=False,        init=False)
+    best_epoch:  int   = field(default=-1,           init=False)
+    best_state:  Optional[Dict[str, torch.Tensor]] = field(default=None, init=False, repr=False)
 
-    def step(self, val_loss: float) -> bool:
-        """Retourne True if val_loss is stagnating"""
+    def step(self, val_loss: float, model: Optional[torch.nn.Module] = None, epoch: int = -1) -> bool:
+        """Retourne True if val_loss is stagnating. Snapshot of the model weights (CPU copy) at each improvement"""
         if val_loss < self.best_loss - self.min_delta:
-            self.best_loss = val_loss
-            self.counter   = 0
+            self.best_loss  = val_loss
+            self.best_epoch = epoch
+            self.counter    = 0
+            if model is not None:
+                self.best_state = {k: v.detach().to("cpu", copy=True) for k, v in model.state_dict().items()}
         else:
             self.counter += 1
             if self.counter >= self.patience:
                 self.should_stop = True
 
         return self.should_stop
+
+    def restore_best(self, model: torch.nn.Module) -> bool:
+        """Load the best validation weights into model. Return False without snapshot"""
+        if self.best_state is None:
+            return False
+
+        model.load_state_dict(self.best_state)
+        return True
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in ("best_loss", "counter", "should_stop", "best_epoch", "best_state")}
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        for k, v in state.items():
+            setattr(self, k, v)
+
+def _save_checkpoint(path: Path, checkpoint: Dict[str, Any]) -> None:
+    """Atomic checkpoint write (an interrupted save never corrupts the previous checkpoint)"""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    torch.save(checkpoint, tmp_path)
+    os.replace(tmp_path, path)
+
+def _checkpoint_fingerprint(model: torch.nn.Module, 
+                            optimizer, 
+                            train_dataloader: DataLoader, 
+                            val_dataloader: DataLoader, 
+                            **config: Any) -> Dict[str, Any]:
+    """Identity of a training run (architecture, optimizer, data, config) : a checkpoint is only resumed by the same run"""
+
+    def _data_digest(dataset) -> str:
+        digest = hashlib.sha256(str(len(dataset)).encode())
+        for index in {0, len(dataset) - 1}:
+            for tensor in dataset[index]:
+                digest.update(torch.as_tensor(tensor).detach().cpu().numpy().tobytes())
+        return digest.hexdigest()
+
+    return {
+        "model": [(name, tuple(param.shape)) for name, param in model.state_dict().items()],
+        "optimizer": type(optimizer).__name__,
+        "train_data": _data_digest(train_dataloader.dataset),
+        "val_data": _data_digest(val_dataloader.dataset),
+        **config,
+    }
     
+def _bf16_autocast_supported(device: torch.device) -> bool:
+    """Native bf16 kernels : CUDA capability, or AVX512-BF16 / AMX flags on CPU (emulated bf16 is slower than fp32)"""
+
+    if device.type == "cuda":
+        return torch.cuda.is_bf16_supported()
+    try:
+        with open("/proc/cpuinfo") as f:
+            flags = f.read()
+    except OSError:
+        return False
+
+    return torch.backends.mkldnn.is_available() and ("avx512_bf16" in flags or "amx_bf16" in flags)
+
+def _optimize_seq2seq(model: torch.nn.Module, compile_mode: Optional[str]) -> torch.nn.Module:
+    """
+    Compiled view of the model for the training loop ("compile" : torch.compile, "script" : TorchScript).
+    Parameters are shared with the eager model, which stays the one logged. Falls back to eager on failure.
+    """
+
+    if compile_mode is None:
+        return model
+    try:
+        if compile_mode == "compile":
+            return torch.compile(model)
+        if compile_mode == "script":
+            return torch.jit.script(model)
+        raise ValueError(f"Unknown compile_mode '{compile_mode}', expected 'compile' or 'script'")
+    except ValueError:
+        raise
+    except Exception as e:
+        logging.warning(f"Seq2seq {compile_mode} failed, eager mode kept : {e}")
+        return model
+
 def train_seq2seq(model, 
                        train_dataloader: DataLoader, 
                        val_dataloader: DataLoader,
@@ -298,9 +537,16 @@ def train_seq2seq(model,
                        optimizer, 
                        device,
                        num_epochs: int,
-                       patience: int= 10) -> Tuple[List[float], List[float]]:
+                       patience: int= 10,
+                       compile_mode: Optional[str] = None,
+                       use_bf16: bool = False,
+                       num_threads: Optional[int] = None,
+                       validate_every: int = 1,
+                       trial: Optional[optuna.Trial] = None,
+                       checkpoint_path: Optional[str | Path] = None,
+                       checkpoint_every: int = 1) -> Tuple[List[float], List[float]]:
     """
-    Trains a seq2seq model and evaluates it on a validation set each epoch.
+    Trains a seq2seq model and evaluates it on a validation set every validate_every epochs.
 
     Args:
         model (torch.nn.Module): Seq2seq model.
@@ -310,66 +556,314 @@ def train_seq2seq(model,
         optimizer: Optimization algorithm.
         device (torch.device): CPU or GPU device.
         num_epochs (int): Number of training epochs.
+        compile_mode (str, optional): None (eager), "compile" (torch.compile) or "script" (TorchScript).
+        use_bf16 (bool): bf16 autocast, only if the device has native bf16 kernels.
+        num_threads (int, optional): torch intra-op threads (unchanged if None).
+        validate_every (int): Validation period in epochs (early stopping counts validations).
+        trial (optuna.Trial, optional): Validation RMSE reported at each validation, TrialPruned raised if pruned.
+        checkpoint_path (str | Path, optional): Checkpoint (model, optimizer, epoch, losses, early stopping)
+            written every checkpoint_every epochs. An unfinished checkpoint of the same run (model, data, config)
+            is resumed, the checkpoint is removed once the training ends.
+
+    The best validation weights are restored into model at the end (early stop or last epoch).
+
+    Losses are accumulated on device : one host sync per epoch and per validation.
 
     Returns:
-        tuple: (train_losses, val_losses), lists of RMSE per epoch.
+        tuple: (train_losses, val_losses), lists of RMSE per epoch (per validation for val_losses).
     """
     
     #Init 
     early_stopping = EarlyStopping(patience=patience)
     train_losses = []
     val_losses = []
-
-    logging.info(f"Début de l'entrainement sur {num_epochs} sur {device}")
+    start_epoch = 0
+
+    # Reprise depuis le dernier checkpoint
+    checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+    fingerprint = _checkpoint_fingerprint(
+        model, optimizer, train_dataloader, val_dataloader, 
+        num_epochs=num_epochs, patience=patience, validate_every=validate_every
+    ) if checkpoint_path is not None else None
+    checkpoint = None
+    if checkpoint_path is not None and checkpoint_path.exists():
+        checkpoint = torch.load(checkpoint_path, map_location=device, weights_only=False)
+        if checkpoint.get("fingerprint") != fingerprint:
+            logging.warning(f"[CHECKPOINT] {checkpoint_path} belongs to another training run, fresh training")
+            checkpoint = None
+    if checkpoint is not None:
+        model.load_state_dict(checkpoint["model"])
+        optimizer.load_state_dict(checkpoint["optimizer"])
+        early_stopping.load_state_dict(checkpoint["early_stopping"])
+        train_losses, val_losses = checkpoint["train_losses"], checkpoint["val_losses"]
+        start_epoch = checkpoint["epoch"] + 1
+        logging.info(f"[CHECKPOINT] Resumed from epoch {start_epoch} ({checkpoint_path})")
+
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    if use_bf16 and not _bf16_autocast_supported(device):
+        logging.warning(f"bf16 autocast not natively supported on {device}, fp32 kept")
+        use_bf16 = False
+    train_model = _optimize_seq2seq(model, compile_mode)
+
+    def _checkpoint(epoch: int, force: bool = False) -> None:
+        if checkpoint_path is None or not (force or (epoch + 1) % checkpoint_every == 0 or epoch + 1 == num_epochs):
+            return
+        _save_checkpoint(checkpoint_path, {
+            "epoch": epoch,
+            "model": model.state_dict(),
+            "optimizer": optimizer.state_dict(),
+            "early_stopping": early_stopping.state_dict(),
+            "train_losses": train_losses,
+            "val_losses": val_losses,
+            "fingerprint": fingerprint,
+        })
+
+    logging.info(
+        f"Début de l'entrainement sur {num_epochs} epochs sur {device} "
+        f"(compile={compile_mode}, bf16={use_bf16}, threads={torch.get_num_threads()})"
+    )
     
-    for epoch in range(num_epochs):
+    for epoch in range(start_epoch, num_epochs):
+        if early_stopping.should_stop:
+            break
         
         # Training
 
-        model.train()
-        running_loss = 0.0
+        train_model.train()
+        running_loss = torch.zeros((), device=device)
+        n_batches, n_samples = 0, 0
+        epoch_start = time.perf_counter()
 
         for X_past, X_future, Y_target in train_dataloader:
             X_past, X_future, Y_target = X_past.to(device), X_future.to(device), Y_target.to(device)
 
             #Mise à zéro gradient
-            optimizer.zero_grad()
+            optimizer.zero_grad(set_to_none=True)
 
             # Forward et perte
-            Y_pred = model(X_past, X_future)
-            loss = criterion(Y_pred, Y_target)
+            with torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=use_bf16):
+                Y_pred = train_model(X_past, X_future)
+            loss = criterion(Y_pred.float(), Y_target)
 
             # Rétropropagation et optimisation
             loss.backward()
             optimizer.step()
 
-            running_loss += loss.item()
+            running_loss += loss.detach()
+            n_batches += 1
+            n_samples += Y_target.shape[0]
         
-        # Statistiques
-        avg_train_loss = running_loss / len(train_dataloader)
+        # Statistiques (une seule synchronisation par epoch)
+        avg_train_loss = running_loss.item() / max(n_batches, 1)
         train_losses.append(np.sqrt(avg_train_loss))
+        samples_per_sec = n_samples / (time.perf_counter() - epoch_start)
+
+        if (epoch + 1) % validate_every != 0 and epoch + 1 != num_epochs:
+            logging.info(f"Epoch [{epoch+1}/{num_epochs}] | Train RMSE: {np.sqrt(avg_train_loss):.6f} | {samples_per_sec:.0f} samples/s")
+            _checkpoint(epoch)
+            continue
         
         # Eval et validation dataset
 
-        model.eval()
-        validation_loss = 0.0
+        train_model.eval()
+        validation_loss = torch.zeros((), device=device)
+        n_val_batches = 0
 
-        with torch.no_grad():
+        with torch.no_grad(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=use_bf16):
             for X_past_val, X_future_val, Y_target_val in val_dataloader:
                 X_past_val, X_future_val, Y_target_val = X_past_val.to(device), X_future_val.to(device), Y_target_val.to(device)
                 
-                Y_pred_val = model(X_past_val, X_future_val)
-                loss_val = criterion(Y_pred_val, Y_target_val)
-
-                validation_loss += loss_val.item()
+                Y_pred_val = train_model(X_past_val, X_future_val)
+                validation_loss += criterion(Y_pred_val.float(), Y_target_val)
+                n_val_batches += 1
                 
-        avg_val_loss = validation_loss / len(val_dataloader) # type: ignore
+        avg_val_loss = validation_loss.item() / max(n_val_batches, 1)
         val_losses.append(np.sqrt(avg_val_loss))
 
-        print(f"Epoch [{epoch+1}/{num_epochs}] | Train RMSE: {np.sqrt(avg_train_loss):.6f} | Val RMSE: {np.sqrt(avg_val_loss):.6f}")
+        logging.info(
+            f"Epoch [{epoch+1}/{num_epochs}] | Train RMSE: {np.sqrt(avg_train_loss):.6f} | "
+            f"Val RMSE: {np.sqrt(avg_val_loss):.6f} | {samples_per_sec:.0f} samples/s"
+        )
+
+        if trial is not None:
+            trial.report(float(np.sqrt(avg_val_loss)), step=epoch)
+            if trial.should_prune():
+                if checkpoint_path is not None:
+                    checkpoint_path.unlink(missing_ok=True)
+                raise optuna.TrialPruned()
 
-        if early_stopping.step(avg_val_loss):
+        stop = early_stopping.step(avg_val_loss, model=model, epoch=epoch)
+        _checkpoint(epoch, force=stop)
+        if stop:
             logging.info(f"Early stopping à l'epoch {epoch+1} — best val loss : {early_stopping.best_loss:.6f}")
             break
+
+    # Poids de la meilleure validation
+    if early_stopping.restore_best(model):
+        logging.info(f"Best weights restored (epoch {early_stopping.best_epoch+1}, val RMSE {np.sqrt(early_stopping.best_loss):.6f})")
+
+    # Entrainement terminé : le prochain run repart de zéro
+    if checkpoint_path is not None:
+        checkpoint_path.unlink(missing_ok=True)
         
-    return train_losses, val_losses
\ No newline at end of file
+    return train_losses, val_losses
+
+_LSTM_STATE: Dict[str, Any] = {}
+
+def _init_lstm_worker(
+        X: pd.DataFrame, 
+        y: pd.Series, 
+        features: Dict[str, List[str]], 
+        threads: ThreadAllocation
+    ) -> None:
+    _LSTM_STATE.update({"X": X, "y": y, "features": features, "threads": threads, "limits": threads.apply()})
+
+def _suggest_lstm_params(trial: optuna.Trial) -> Dict[str, Any]:
+    num_layers = trial.suggest_int("num_layers", 1, 3)
+    return {
+        "hidden_size": trial.suggest_categorical("hidden_size", [32, 64, 128, 256]),
+        "num_layers": num_layers,
+        # Dropout inter-couches : sans effet sur une seule couche LSTM
+        "dropout": trial.suggest_float("dropout", 0.0, 0.5) if num_layers > 1 else 0.0,
+        "learning_rate": trial.suggest_float("learning_rate", 1e-4, 1e-2, log=True),
+        "seq_length": trial.suggest_categorical("seq_length", [24, 48, 72, 168]),
+    }
+
+def _seq2seq_val_rmse(model: torch.nn.Module, val_dataloader: DataLoader, processor, val_index: pd.Index) -> float:
+    """Validation RMSE in MWh : scaled predictions of every window inverse transformed with the processor denominators"""
+
+    model.eval()
+    y_pred, y_true = [], []
+    with torch.no_grad():
+        for X_past, X_future, Y_target in val_dataloader:
+            y_pred.append(model(X_past, X_future).reshape(-1))
+            y_true.append(Y_target.reshape(-1))
+
+    dataset = val_dataloader.dataset
+    rows = (dataset.starts.unsqueeze(-1) + dataset.future_offsets).reshape(-1).numpy()
+    index = val_index[rows]
+
+    return float(rmse(
+        processor.inverse_transform_y(torch.cat(y_true).numpy(), index),
+        processor.inverse_transform_y(torch.cat(y_pred).numpy(), index),
+    ))
+
+def _run_lstm_trials(storage_path: str, study_name: str, n_trials: int, base_params: Dict[str, Any]) -> int:
+    """Worker : n_trials sequential trials of the shared study (journal storage), return the number run"""
+
+    X, y, features = _LSTM_STATE["X"], _LSTM_STATE["y"], _LSTM_STATE["features"]
+    threads = _LSTM_STATE["threads"]
+    device = torch.device("cpu")
+
+    def objective_lstm(trial) -> float:
+        params = {**base_params, **_suggest_lstm_params(trial)}
+        train_dl, val_dl, processor, _, _ = data_preparation.prepare_lstm_data(
+            X=X,
+            y=y,
+            meteo_features=features["meteo_features"],
+            encoder_features=features["encoder_features"],
+            decoder_features=features["decoder_features"],
+            seq_length=params["seq_length"],
+            output_len=params["output_len"],
+            batch_size=params["batch_size"],
+            stride=params["stride"],
+        )
+        model = architectures.Seq2seq(
+            past_features_length=len(features["encoder_features"]) + 1,
+            future_features_length=len(features["decoder_features"]),
+            hidden_size=params["hidden_size"],
+            num_layers=params["num_layers"],
+            output_len=params["output_len"],
+            dropout=params["dropout"],
+            architecture=params.get("architecture", "lstm"),
+        )
+        _, val_losses = train_seq2seq(
+            model=model,
+            train_dataloader=train_dl,
+            val_dataloader=val_dl,
+            criterion=torch.nn.MSELoss(),
+            optimizer=torch.optim.Adam(model.parameters(), lr=params["learning_rate"], weight_decay=1e-4),
+            device=device,
+            num_epochs=params["num_epochs"],
+            num_threads=threads.torch_threads,
+            validate_every=params.get("validate_every", 1),
+            trial=trial,
+        )
+        # Pruning on the scaled validation RMSE, objective in MWh (comparable with train_lightgbm)
+        trial.set_user_attr("val_rmse_scaled", float(min(val_losses)))
+        val_index = X.index[-len(val_dl.dataset.values):]
+        return _seq2seq_val_rmse(model, val_dl, processor, val_index)
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=JournalStorage(JournalFileBackend(storage_path)),
+        pruner=MedianPruner(n_startup_trials=5, n_warmup_steps=3),
+    )
+    study.optimize(objective_lstm, n_trials=n_trials)
+
+    return n_trials
+
+def train_lstm(
+        X: pd.DataFrame,
+        y: pd.Series,
+        meteo_features: List[str],
+        encoder_features: List[str],
+        decoder_features: List[str],
+        base_params: Dict[str, Any],
+        num_trials: int,
+        n_workers: Optional[int] = None,
+        thread_budget: Optional[ThreadBudget] = None,
+        storage_dir: Optional[str] = None,
+    ) -> Tuple[float, Dict[str, Any]]:
+    """
+    Optuna search over hidden_size, num_layers, dropout, learning_rate and seq_length (CPU).
+    Trials run in n_workers spawned processes sharing one journal study, each capped by the thread budget.
+    Validation RMSE is reported every validation epoch : the MedianPruner stops hopeless trials early.
+    base_params : fixed lstm_params (output_len, batch_size, stride, num_epochs).
+    storage_dir : journal directory kept after the search (temporary directory removed at the end if None).
+    Returns (best_rmse, best_params) as train_lightgbm (validation RMSE in MWh).
+    """
+
+    budget = thread_budget or ThreadBudget.from_settings(settings)
+    n_workers = max(1, min(n_workers or budget.optuna_workers, num_trials))
+    threads = budget.allocate("process_pool", n_workers=n_workers)
+
+    # Journal storage : trials (and pruning statistics) shared by the worker processes
+    features = {
+        "meteo_features": meteo_features,
+        "encoder_features": encoder_features,
+        "decoder_features": decoder_features,
+    }
+    trials_per_worker = [num_trials // n_workers + (i < num_trials % n_workers) for i in range(n_workers)]
+    storage_context = tempfile.TemporaryDirectory(prefix="lstm_optuna_") if storage_dir is None else contextlib.nullcontext(storage_dir)
+    with storage_context as journal_dir:
+        storage_path = str(Path(journal_dir) / "optuna_journal.log")
+        study_name = f"lstm_seq2seq_{int(time.time())}"
+        study = optuna.create_study(
+            study_name=study_name,
+            direction="minimize",
+            storage=JournalStorage(JournalFileBackend(storage_path)),
+        )
+        logging.info(f"LSTM search : {num_trials} trials, {n_workers} workers x {threads.torch_threads} threads")
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_lstm_worker,
+            initargs=(X, y, features, threads),
+        ) as executor:
+            futures = [
+                executor.submit(_run_lstm_trials, storage_path, study_name, n_trials, base_params)
+                for n_trials in trials_per_worker
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        n_pruned = len(study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.PRUNED,)))
+        best_value, best_trial_params = study.best_value, study.best_params
+    logging.info(f"LSTM search : best val RMSE {best_value:.2f} MWh ({n_pruned}/{num_trials} trials pruned)")
+
+    best_params = {"dropout": 0.0, **best_trial_params}
+    return best_value, best_params
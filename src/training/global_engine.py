@@ -0,0 +1,148 @@
+# Global multi-horizon LightGBM engine
+# All the horizons of a group are stacked in one long-format dataset (features at t + horizon feature,
+# target at t+h) and fitted by a single booster, instead of one pipeline per horizon
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+
+from src.etl import processors, horizons as horizon_alignment
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+HORIZON_FEATURE = "horizon"
+
+class HorizonGroupModel:
+    """
+    Processor, selector and booster shared by a group of horizons.
+    Targets are scaled by the denominator at t (inference scaling unchanged : normalized outputs).
+    """
+
+    def __init__(
+            self,
+            processor: processors.SolarDataProcessor,
+            selector: processors.LGBMFeatureSelector,
+            model: lgb.LGBMRegressor,
+            horizons: List[int],
+        ):
+        self.processor = processor
+        self.selector = selector
+        self.model = model
+        self.horizons = horizons
+
+    def _stacked_input(self, X_selected: pd.DataFrame) -> pd.DataFrame:
+        """(n x len(horizons)) rows : every input row once per horizon"""
+        n_rows = len(X_selected)
+        stacked = pd.DataFrame(
+            np.tile(X_selected.to_numpy(dtype=np.float32), (len(self.horizons), 1)),
+            columns=X_selected.columns
+        )
+        stacked[HORIZON_FEATURE] = np.repeat(np.asarray(self.horizons, dtype=np.float32), n_rows)
+
+        return stacked
+
+    def predict(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Normalized predictions, one '+{h}h' column per horizon of the group"""
+
+        X_selected = self.selector.transform(self.processor.transform(X))
+        predictions = self.model.predict(self._stacked_input(X_selected))
+
+        return pd.DataFrame(
+            predictions.reshape(len(self.horizons), len(X)).T,
+            index=X.index,
+            columns=[f'+{h}h' for h in self.horizons]
+        )
+
+def stack_horizons(
+        X_selected: pd.DataFrame,
+        y_scaled_matrix: np.ndarray,
+        horizons: List[int],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Long-format training arrays : features (float32) with the horizon column, target and row time position t.
+    Rows with a missing target y[t+h] are dropped.
+    """
+
+    n_rows, n_features = X_selected.shape
+    values = X_selected.to_numpy(dtype=np.float32)
+
+    blocks, targets, positions = [], [], []
+    for h in horizons:
+        target = y_scaled_matrix[:n_rows - h, h - 1]
+        known = np.flatnonzero(~np.isnan(target))
+
+        block = np.empty((len(known), n_features + 1), dtype=np.float32)
+        block[:, :n_features] = values[known]
+        block[:, n_features] = h
+        blocks.append(block)
+        targets.append(target[known])
+        positions.append(known)
+
+    return np.concatenate(blocks), np.concatenate(targets), np.concatenate(positions)
+
+def fit_horizon_group(
+        X: pd.DataFrame,
+        y: pd.Series,
+        horizons: List[int],
+        meteo_features: List[str],
+        selector_parameters: Dict[str, Any],
+        params: Dict[str, Any],
+        val_fraction: float = 0.1,
+        early_stopping_rounds: int = 50,
+        n_jobs: Optional[int] = None,
+        random_state: int = 42,
+    ) -> Tuple[HorizonGroupModel, float]:
+    """
+    Fit one booster on the stacked horizons. n_estimators is chosen by early stopping on the
+    last val_fraction of the time axis (every horizon), the deployed booster is then refitted on all rows.
+    Return the group model and its validation RMSE (MWh).
+    """
+
+    # 1 - Processor on the unshifted target (denominator at t), selector on the group horizons
+    processor = processors.SolarDataProcessor(meteo_features=meteo_features)
+    processor.fit(X, y)
+    X_scaled = processor.transform(X)
+    y_scaled = processor.transform_y(y)
+
+    selector = processors.LGBMFeatureSelector(**{**selector_parameters, "horizons": horizons})
+    selector.fit(X_scaled, y_scaled)
+    X_selected = selector.transform(X_scaled)
+
+    # 2 - Long format : y[t+h] / denominator[t]
+    denominators = processor.denominator_series_.reindex(X.index).fillna(processor.last_denominator_).to_numpy()
+    target_matrix = horizon_alignment.horizon_target_matrix(y, max(horizons)) / denominators[:, None]
+    values, target, positions = stack_horizons(X_selected, target_matrix, horizons)
+    columns = [*X_selected.columns, HORIZON_FEATURE]
+
+    # 3 - Temporal validation split (same cut for every horizon)
+    split = int(len(X) * (1 - val_fraction))
+    is_train = positions < split
+
+    model = lgb.LGBMRegressor(**params, verbosity=-1, random_state=random_state, n_jobs=n_jobs)
+    categorical_feature = [HORIZON_FEATURE] if len(horizons) > 1 else "auto"
+    model.fit(
+        pd.DataFrame(values[is_train], columns=columns),
+        target[is_train],
+        eval_set=[(pd.DataFrame(values[~is_train], columns=columns), target[~is_train])],
+        callbacks=[lgb.early_stopping(early_stopping_rounds, verbose=False)],
+        categorical_feature=categorical_feature,
+    )
+
+    # 4 - Validation RMSE in MWh
+    y_pred = model.predict(pd.DataFrame(values[~is_train], columns=columns), num_iteration=model.best_iteration_)
+    val_denominators = denominators[positions[~is_train]]
+    val_rmse = float(metrics.rmse(target[~is_train] * val_denominators, y_pred * val_denominators))
+    logger.info(f"Global group {horizons[0]}-{horizons[-1]}h : {len(target)} stacked rows, validation RMSE {val_rmse:.2f}")
+
+    # 5 - Final booster on all rows (most recent history included), early stopped number of trees
+    final_model = lgb.LGBMRegressor(**{
+        **params, 
+        "n_estimators": max(model.best_iteration_, 1)
+    }, verbosity=-1, random_state=random_state, n_jobs=n_jobs)
+    final_model.fit(pd.DataFrame(values, columns=columns), target, categorical_feature=categorical_feature)
+
+    return HorizonGroupModel(processor, selector, final_model, horizons), val_rmse
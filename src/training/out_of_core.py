@@ -0,0 +1,242 @@
+# Out-of-core LightGBM training from partitioned parquet
+# Row groups are streamed into LightGBM (lgb.Sequence) and scaled chunk by chunk :
+# training memory is bounded by the binned Dataset, not by the raw float frame
+
+import copy
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence as SequenceType, Tuple
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+import pyarrow.parquet as pq
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.pipeline import Pipeline
+
+from src.etl import processors
+
+logger = logging.getLogger(__name__)
+
+class ParquetPartitions:
+    """
+    Chronologically ordered parquet files read by row group. Rows are addressed by global position
+    (the horizon alignment is positional, as y.shift(-h) on an hourly sorted index).
+    """
+
+    def __init__(self, paths: SequenceType[str | Path], target: str = "solaire", timezone: str = "Europe/Paris"):
+        self.paths = [Path(p) for p in sorted(paths)]
+        self.target = target
+        self.timezone = timezone
+
+        # Row group table : (file, row group, first global row, n rows)
+        self._row_groups: List[Tuple[int, int, int, int]] = []
+        n_rows = 0
+        for file_idx, path in enumerate(self.paths):
+            metadata = pq.ParquetFile(path).metadata
+            for rg_idx in range(metadata.num_row_groups):
+                rg_rows = metadata.row_group(rg_idx).num_rows
+                self._row_groups.append((file_idx, rg_idx, n_rows, rg_rows))
+                n_rows += rg_rows
+        self.n_rows = n_rows
+
+        self.columns = [c for c in pq.ParquetFile(self.paths[0]).schema_arrow.names if not c.startswith("__index")]
+        self.feature_columns = [c for c in self.columns if c != self.target]
+
+    @property
+    def max_row_group_rows(self) -> int:
+        return max(n for *_, n in self._row_groups)
+
+    def _to_frame(self, table) -> pd.DataFrame:
+        df = table.to_pandas()
+        df.index = pd.to_datetime(df.index, utc=True).tz_convert(self.timezone)
+        return df
+
+    def read_row_group(self, rg_pos: int, columns: List[str]) -> pd.DataFrame:
+        file_idx, rg_idx, _, _ = self._row_groups[rg_pos]
+        table = pq.ParquetFile(self.paths[file_idx]).read_row_group(rg_idx, columns=columns, use_pandas_metadata=True)
+        return self._to_frame(table)
+
+    def iter_row_groups(self, columns: List[str]):
+        """Yield (first global row, DataFrame) for each row group"""
+        for rg_pos, (_, _, start, _) in enumerate(self._row_groups):
+            yield start, self.read_row_group(rg_pos, columns)
+
+    def row_group_of(self, row: int) -> int:
+        """Position of the row group holding a global row"""
+        starts = [start for _, _, start, _ in self._row_groups]
+        return int(np.searchsorted(starts, row, side="right") - 1)
+
+    def row_group_bounds(self, rg_pos: int) -> Tuple[int, int]:
+        _, _, start, n = self._row_groups[rg_pos]
+        return start, start + n
+
+    def read_rows(self, start: int, stop: int, columns: List[str]) -> pd.DataFrame:
+        """Contiguous global rows [start, stop), only the needed row groups are read"""
+        frames = []
+        for rg_pos in range(self.row_group_of(start), self.row_group_of(stop - 1) + 1):
+            rg_start, _ = self.row_group_bounds(rg_pos)
+            chunk = self.read_row_group(rg_pos, columns)
+            frames.append(chunk.iloc[max(start - rg_start, 0):stop - rg_start])
+
+        return pd.concat(frames)
+
+    def read_target(self) -> pd.Series:
+        """Target column only (one float per row, the index is restored from the pandas metadata)"""
+        frames = [
+            self._to_frame(pq.read_table(path, columns=[self.target], use_pandas_metadata=True))
+            for path in self.paths
+        ]
+        return pd.concat(frames)[self.target]
+
+class ScaledRowGroupSequence(lgb.Sequence):
+    """
+    lgb.Sequence over the rows [0, n_rows) of the partitions : each requested row group is read,
+    scaled by the fitted processor and reduced to the selected features (one row group kept in cache)
+    """
+
+    def __init__(
+            self,
+            partitions: ParquetPartitions,
+            processor: processors.SolarDataProcessor,
+            features: List[str],
+            n_rows: int
+        ):
+        self.partitions = partitions
+        self.processor = processor
+        self.features = features
+        self.n_rows = n_rows
+        self.batch_size = partitions.max_row_group_rows
+
+        # The processor needs all its meteo columns to apply the MinMax scaler
+        self._read_columns = list(dict.fromkeys([*features, *processor.effective_meteo_features_]))
+        self._cached: Tuple[int, Optional[np.ndarray]] = (-1, None)
+
+    def _scaled_row_group(self, rg_pos: int) -> np.ndarray:
+        if self._cached[0] != rg_pos:
+            chunk = self.partitions.read_row_group(rg_pos, self._read_columns)
+            values = self.processor.transform(chunk)[self.features].to_numpy(dtype=np.float64)
+            self._cached = (rg_pos, values)
+
+        return self._cached[1] # type: ignore
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            if idx < 0:
+                idx += self.n_rows
+            rg_pos = self.partitions.row_group_of(int(idx))
+            rg_start, _ = self.partitions.row_group_bounds(rg_pos)
+            return self._scaled_row_group(rg_pos)[int(idx) - rg_start]
+
+        start, stop, _ = idx.indices(self.n_rows)
+        blocks = []
+        for rg_pos in range(self.partitions.row_group_of(start), self.partitions.row_group_of(stop - 1) + 1):
+            rg_start, _ = self.partitions.row_group_bounds(rg_pos)
+            values = self._scaled_row_group(rg_pos)
+            blocks.append(values[max(start - rg_start, 0):stop - rg_start])
+
+        return np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+class LGBMBoosterRegressor(BaseEstimator, RegressorMixin):
+    """
+    Pipeline final step around a Booster trained with the native API (predict on the selected features).
+    Trained out-of-core on a streamed Dataset by train_horizon_out_of_core, or in memory by fit (same params).
+    """
+
+    def __init__(self, params: Optional[Dict[str, Any]] = None, num_boost_round: int = 500):
+        self.params = params
+        self.num_boost_round = num_boost_round
+
+    def _train_params(self) -> Dict[str, Any]:
+        return {**(self.params or {}), "objective": "regression"}
+
+    def fit_dataset(self, train_set: lgb.Dataset):
+        """Native training on an already constructed Dataset (streamed Sequence or in-memory frame)"""
+        self.booster_ = lgb.train(self._train_params(), train_set, num_boost_round=self.num_boost_round)
+        return self
+
+    def fit(self, X: pd.DataFrame, y, sample_weight=None):
+        train_set = lgb.Dataset(X, label=np.asarray(y, dtype=np.float64), weight=sample_weight, params=self._train_params())
+        return self.fit_dataset(train_set)
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        return self.booster_.predict(X)
+
+def fit_processor_streaming(partitions: ParquetPartitions, meteo_features: List[str]) -> processors.SolarDataProcessor:
+    """MinMax scaler fitted row group by row group (partial_fit). Target scaling is set per horizon"""
+
+    processor = processors.SolarDataProcessor(meteo_features=meteo_features)
+    meteo_columns = [f for f in meteo_features if f in partitions.feature_columns]
+    for _, chunk in partitions.iter_row_groups(meteo_columns):
+        processor.partial_fit(chunk)
+
+    return processor
+
+def train_horizon_out_of_core(
+        partitions: ParquetPartitions,
+        meteo_processor: processors.SolarDataProcessor,
+        y: pd.Series,
+        horizon: int,
+        selector_parameters: Dict[str, Any],
+        params: Dict[str, Any],
+        dataset_params: Dict[str, Any],
+        sample_rows: int = 200_000,
+        n_holdout: int = 24 * 30,
+    ) -> Tuple[Pipeline, pd.DataFrame, pd.Series]:
+    """
+    Train one horizon pipeline from the partitions (y : full target, positionally aligned with the partitions).
+    The selector is fitted on the most recent sample_rows training rows (in memory), the booster on every
+    training row through the Sequence. The last n_holdout aligned rows are kept out of training and
+    returned (raw features, MWh target at t+h) for scoring.
+    """
+
+    n_aligned = partitions.n_rows - horizon
+    n_train = n_aligned - n_holdout
+
+    # 1 - Target scaling of the horizon (same as an in-memory processor fitted on y.shift(-h))
+    y_h = y.shift(-horizon).iloc[:n_aligned]
+    processor = copy.deepcopy(meteo_processor).update_target_scaling(y_h.dropna())
+    y_scaled = processor.transform_y(y_h).to_numpy(dtype=np.float64)
+
+    # 2 - Selector on a recent in-memory sample
+    sample_start = max(0, n_train - sample_rows)
+    X_sample = partitions.read_rows(sample_start, n_aligned, partitions.feature_columns)
+    X_selector = processor.transform(X_sample.iloc[:n_train - sample_start])
+    y_selector = pd.Series(y_scaled[sample_start:n_train], index=X_selector.index)
+    valid = y_selector.notna()
+
+    selector = processors.LGBMFeatureSelector(**selector_parameters)
+    selector.fit(X_selector.loc[valid], y_selector.loc[valid])
+
+    # 3 - Streamed Dataset : rows t in [0, n_train), labels y(t + h), NaN targets weighted out
+    labels = y_scaled[:n_train]
+    sequence = ScaledRowGroupSequence(partitions, processor, selector.final_selected_features_, n_rows=n_train)
+    train_set = lgb.Dataset(
+        sequence,
+        label=np.nan_to_num(labels),
+        weight=np.isfinite(labels).astype(np.float64),
+        params=dataset_params,
+        free_raw_data=True
+    ).construct()
+    logger.info(f"[OUT-OF-CORE] +{horizon}h Dataset constructed : {n_train} rows, {len(sequence.features)} features")
+
+    # 4 - Native training
+    model = LGBMBoosterRegressor(
+        params={**dataset_params, **{k: v for k, v in params.items() if k != "n_estimators"}},
+        num_boost_round=int(params.get("n_estimators", 500)),
+    ).fit_dataset(train_set)
+
+    pipeline = Pipeline([
+        ('processor', processor),
+        ('selector', selector),
+        ('model', model)
+    ])
+
+    # 5 - Holdout (raw features, MWh target)
+    y_holdout = y_h.iloc[n_train:].dropna()
+    X_holdout = X_sample.loc[y_holdout.index]
+
+    return pipeline, X_holdout, y_holdout
@@ -10,11 +10,13 @@ import mlflow
 from typing import Optional, List, Dict, Any
 
 # Functions
-from src.etl import data_preparation
+from src.etl import data_preparation, horizons
 from src.training import engine
 from src.models import contracts
-from models import architectures
+from src.models import architectures
 from src.utils import logging_utils
+from src.utils.threads import ThreadBudget
+from src.utils.config import settings
 
 def training_multioutput_lgbm_model(
         X: pd.DataFrame, 
@@ -37,13 +39,15 @@ def training_multioutput_lgbm_model(
     """
 
     models_dict = {}
+    target_matrix = horizons.horizon_target_matrix(y, n_horizons) # Built once, sliced per horizon
     for horizon in range(1, n_horizons+1):
         logging.info(f'--- Training horizon t+{horizon} ---')
         
         X_h, y_h = data_preparation.prepare_horizon_data(
             X=X, 
             y=y, 
-            horizon=horizon
+            horizon=horizon,
+            target_matrix=target_matrix
         )
         
         # Features horizon group
@@ -71,7 +75,7 @@ def training_multioutput_lgbm_model(
 
         # MLFlow
         logging.info(f'Best model fitted on {set_name}- Data contract loading')
-        result = contracts.HorizonRunResult(
+        result = contracts.HorizonRunResult.from_training_data(
             horizon=horizon,
             set_name=set_name,
             best_rmse=best_rmse,
@@ -92,12 +96,28 @@ def run_lstm_pipeline(
     encoder_features: List[str],
     decoder_features: List[str],
     lstm_params: Dict[str, Any],
+    thread_budget: Optional[ThreadBudget] = None,
+    num_trials: Optional[int] = None,
 ) -> None:
     
     """Complete pipeline LSTM : DataLoaders → training → MLflow.
  
     Call train_seq2seq() then log on MLflow server.
+    num_trials : Optuna search (engine.train_lstm) first, its best parameters override lstm_params.
     """
+    if num_trials:
+        _, best_params = engine.train_lstm(
+            X=X_train,
+            y=y_train,
+            meteo_features=meteo_features,
+            encoder_features=encoder_features,
+            decoder_features=decoder_features,
+            base_params=lstm_params,
+            num_trials=num_trials,
+            thread_budget=thread_budget,
+        )
+        lstm_params = {**lstm_params, **best_params}
+
     seq_length = lstm_params["seq_length"]
     output_len = lstm_params["output_len"]
     batch_size = lstm_params["batch_size"]
@@ -129,21 +149,28 @@ def run_lstm_pipeline(
         num_layers=lstm_params["num_layers"],
         output_len=output_len,
         dropout=lstm_params["dropout"],
+        architecture=lstm_params.get("architecture", "lstm"), # "lstm", "gru" ou "tcn"
     ).to(device)
  
     criterion = nn.MSELoss()
-    optimizer = torch.optim.Adam(model.parameters(), lr=1e-3, weight_decay=1e-4)
+    optimizer = torch.optim.Adam(model.parameters(), lr=lstm_params.get("learning_rate", 1e-3), weight_decay=1e-4)
  
-    # 3. Training (déjà dans le notebook)
-    train_losses, val_losses = engine.train_seq2seq(
-        model=model,
-        train_dataloader=train_dl,
-        val_dataloader=val_dl,
-        criterion=criterion,
-        optimizer=optimizer,
-        device=device,
-        num_epochs=num_epochs,
-    )
+    # 3. Training (déjà dans le notebook), torch and BLAS threads from the node budget (restored on failure too)
+    with (thread_budget or ThreadBudget.from_settings(settings)).allocate("torch").apply():
+        train_losses, val_losses = engine.train_seq2seq(
+            model=model,
+            train_dataloader=train_dl,
+            val_dataloader=val_dl,
+            criterion=criterion,
+            optimizer=optimizer,
+            device=device,
+            num_epochs=num_epochs,
+            compile_mode=lstm_params.get("compile_mode"),
+            use_bf16=lstm_params.get("use_bf16", False),
+            validate_every=lstm_params.get("validate_every", 1),
+            checkpoint_path=lstm_params.get("checkpoint_path"), # Reprise automatique d'un run interrompu
+            checkpoint_every=lstm_params.get("checkpoint_every", 1),
+        )
     best_rmse = min(val_losses)
  
     # 4. Data contract
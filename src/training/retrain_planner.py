@@ -0,0 +1,113 @@
+# Drift-gated retraining plan : which champion horizons must be retrained
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class HorizonDriftReport:
+    horizon: int
+    max_psi: float
+    drifted_features: List[str]
+    recent_rmse: float
+    champion_rmse: Optional[float]
+    retrain: bool
+
+    @property
+    def rmse_ratio(self) -> Optional[float]:
+        if not self.champion_rmse:
+            return None
+        return self.recent_rmse / self.champion_rmse
+
+class RetrainPlanner:
+    """
+    Per-horizon retraining decision against the champion :
+    - input drift : PSI of each feature selected by the horizon pipeline, reference = champion training period
+    - error drift : recent RMSE (MWh) / champion validation RMSE (best_rmse of the horizon child run)
+    A horizon is retrained when one of the two crosses its threshold.
+    """
+
+    def __init__(self, psi_threshold: float = 0.25, rmse_ratio_threshold: float = 1.2, n_bins: int = 10):
+        self.psi_threshold = psi_threshold
+        self.rmse_ratio_threshold = rmse_ratio_threshold
+        self.n_bins = n_bins
+
+    def evaluate_horizon(
+            self,
+            horizon: int,
+            pipeline: Pipeline,
+            X_reference: pd.DataFrame,
+            X_recent: pd.DataFrame,
+            y_recent: pd.Series,
+            champion_rmse: Optional[float],
+        ) -> HorizonDriftReport:
+        """Drift report of one horizon. X_recent / y_recent are aligned on t+horizon"""
+
+        # 1 - Input drift on the features the horizon model actually uses
+        features = pipeline.named_steps['selector'].final_selected_features_
+        psi_by_feature = {
+            f: metrics.psi(X_reference[f], X_recent[f], n_bins=self.n_bins) 
+            for f in features
+        }
+        drifted = [f for f, value in psi_by_feature.items() if value > self.psi_threshold]
+        max_psi = max(psi_by_feature.values(), default=0.0)
+
+        # 2 - Error drift
+        norm_pred = pipeline.predict(X_recent)
+        y_pred = pipeline.named_steps['processor'].inverse_transform_y(norm_pred, X_recent.index)
+        recent_rmse = metrics.rmse(y_recent, y_pred)
+
+        report = HorizonDriftReport(
+            horizon=horizon,
+            max_psi=max_psi,
+            drifted_features=drifted,
+            recent_rmse=recent_rmse,
+            champion_rmse=champion_rmse,
+            retrain=False,
+        )
+        ratio = report.rmse_ratio
+        report.retrain = bool(drifted) or (ratio is not None and ratio > self.rmse_ratio_threshold)
+
+        return report
+
+    def plan(
+            self,
+            champion_models: Dict[str, Pipeline],
+            champion_runs: Dict[int, Dict[str, Any]],
+            horizon_data: Dict[int, Dict[str, Any]],
+        ) -> Dict[int, HorizonDriftReport]:
+        """
+        Reports for every horizon. horizon_data : {h: {"X_reference", "X_recent", "y_recent"}}.
+        A horizon missing from the champion is always retrained.
+        """
+
+        reports = {}
+        for horizon, data in horizon_data.items():
+            key = f'+{horizon}h'
+            if key not in champion_models:
+                logger.warning(f"[DRIFT] {key} missing from the champion, retrained")
+                reports[horizon] = HorizonDriftReport(horizon, np.nan, [], np.nan, None, retrain=True)
+                continue
+
+            reports[horizon] = self.evaluate_horizon(
+                horizon=horizon,
+                pipeline=champion_models[key],
+                champion_rmse=champion_runs.get(horizon, {}).get("best_rmse"),
+                **data,
+            )
+            report = reports[horizon]
+            logger.info(
+                f"[DRIFT] {key} : max PSI {report.max_psi:.3f} ({len(report.drifted_features)} drifted features), "
+                f"RMSE ratio {report.rmse_ratio if report.rmse_ratio is not None else float('nan'):.2f}"
+                f" -> {'retrain' if report.retrain else 'keep'}"
+            )
+
+        return reports
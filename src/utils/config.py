@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from pydantic import Field, computed_field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class SolarSettings(BaseSettings):
     """Settings for inference and training pipeline"""
@@ -40,6 +40,9 @@ class SolarSettings(BaseSettings):
     len_prev: int = 48 # Longueur des features prévisions (pour lags futurs)
     central_scenario: int = 13 # Scénario barycentrique de toute la capacité solaire régionale
     region_code: int = Field(default=76, gt=0) # Occitanie
+    barycentre_latitude: float = Field(default=43.6, ge=-90, le=90) # Barycentre de la puissance solaire installée
+    barycentre_longitude: float = Field(default=2.6, ge=-180, le=180)
+    daylight_min_elevation: float = -1.0 # Elévation solaire (°) sous laquelle la production est considérée nulle
 
     # FEATURE ENGINEERING
     # - PAST
@@ -55,6 +58,10 @@ class SolarSettings(BaseSettings):
     # PARAMETRES API
     api_weather_variables: List[str] = Field(min_length=1)
 
+    # TRAINING THREADS (budget shared by Optuna, LightGBM, torch and BLAS, see utils.threads)
+    training_total_threads: Optional[int] = Field(default=None, gt=0) # None : all the cores of the node
+    training_optuna_workers: int = Field(default=4, gt=0) # Concurrent trials in sequential mode
+
     # DYNAMIC VARIABLES
     @computed_field
     @property
@@ -1,5 +1,14 @@
 import mlflow
 import os
+import queue
+import atexit
+import logging
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking import MlflowClient
 from src.models import contracts
 from src.models import model_wrappers
 import mlflow.lightgbm as lightgbm
@@ -14,6 +23,111 @@ def init_mlflow(config: dict, experiment_name: str) -> None:
     mlflow.set_tracking_uri(config["MLFLOW_TRACKING_URI"])
     mlflow.set_experiment(experiment_name=experiment_name)
 
+### ASYNC LOGGING ###
+class AsyncMlflowLogger:
+    """
+    Background MLflow logging : child runs (tags, params, metrics through log_batch) and model uploads
+    are queued and sent by a worker thread while training continues.
+    - backpressure : the queue is bounded, submit blocks when max_pending jobs are waiting
+    - flush() waits for every queued job (called before closing the parent run) and re-raises failures
+    - close() is registered atexit : queued jobs are sent before the interpreter exits
+    Runs are addressed by id with MlflowClient (the fluent active run is thread local).
+    """
+
+    _MAX_PARAMS_PER_BATCH = 100 # MLflow log_batch limit
+
+    def __init__(self, max_pending: int = 4):
+        self._queue: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue(maxsize=max_pending)
+        self._errors: List[BaseException] = []
+        self._client = MlflowClient()
+        self._closed = False
+        self._thread = threading.Thread(target=self._worker, name="mlflow-async-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                job()
+            except Exception as e:
+                logging.error(f"[ERROR] Async MLflow logging failed : {e}")
+                self._errors.append(e)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue a logging job (blocks while the queue is full)"""
+        if self._closed:
+            raise RuntimeError("AsyncMlflowLogger is closed.")
+        self._queue.put(job)
+
+    def log_child_run(
+            self,
+            parent_run_id: str,
+            run_name: str,
+            tags: Dict[str, str],
+            params: Dict[str, Any],
+            metrics: Dict[str, float],
+            sk_model: Any = None,
+            signature: Any = None,
+            input_example: Any = None,
+            on_logged: Optional[Callable[[], None]] = None,
+        ) -> None:
+        """Queue a nested run with its params, metrics and sklearn model. on_logged runs once everything is sent"""
+
+        experiment_id = self._client.get_run(parent_run_id).info.experiment_id
+
+        def job() -> None:
+            run = self._client.create_run(
+                experiment_id=experiment_id,
+                run_name=run_name,
+                tags={**tags, "mlflow.parentRunId": parent_run_id},
+            )
+            run_id = run.info.run_id
+            timestamp = int(time.time() * 1000)
+            all_params = [Param(key, str(value)) for key, value in params.items()]
+
+            for i in range(0, max(len(all_params), 1), self._MAX_PARAMS_PER_BATCH):
+                self._client.log_batch(
+                    run_id=run_id,
+                    metrics=[Metric(key, float(value), timestamp, 0) for key, value in metrics.items()] if i == 0 else [],
+                    params=all_params[i:i + self._MAX_PARAMS_PER_BATCH],
+                    tags=[RunTag("mlflow.runName", run_name)] if i == 0 else [],
+                )
+
+            # Model saved locally then uploaded as run artifacts (no fluent active run in this thread)
+            if sk_model is not None:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    model_dir = os.path.join(tmp_dir, "model")
+                    mlflow.sklearn.save_model(sk_model, model_dir, signature=signature, input_example=input_example) # type: ignore
+                    self._client.log_artifacts(run_id, model_dir, artifact_path="model")
+
+            self._client.set_terminated(run_id)
+            if on_logged is not None:
+                on_logged()
+
+        self.submit(job)
+
+    def flush(self) -> None:
+        """Wait for the queued jobs, raise if any of them failed"""
+        self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise RuntimeError(f"{len(errors)} async MLflow logging job(s) failed, first : {errors[0]}")
+
+    def close(self) -> None:
+        """Send the remaining jobs and stop the worker (idempotent, registered atexit)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        for e in self._errors:
+            logging.error(f"[ERROR] Async MLflow job lost : {e}")
+
 ### LGBM ###
 def log_horizon_run(result: contracts.HorizonRunResult) -> None:
     """MLflow logs and artifact"""
@@ -26,7 +140,7 @@ def log_horizon_run(result: contracts.HorizonRunResult) -> None:
         result.model,
         name="model",
         signature=result.signature,
-        input_example=result.X_train.iloc[:3]
+        input_example=result.input_example
     )
 
 def log_lstm_run(result: contracts.LSTMRunResult) -> None:
@@ -7,4 +7,22 @@ def rmse(y_true, y_pred):
     return np.sqrt(mean_squared_error(y_true, y_pred))
 
 def mape(y_true, y_pred):
-    return np.mean(np.abs((y_true - y_pred) / (y_true + 1e-6))) * 100
\ No newline at end of file
+    return np.mean(np.abs((y_true - y_pred) / (y_true + 1e-6))) * 100
+
+def psi(reference, current, n_bins=10, eps=1e-4):
+    """Population Stability Index of current vs reference, bins on the reference quantiles"""
+    reference, current = np.asarray(reference, dtype=float), np.asarray(current, dtype=float)
+    reference, current = reference[~np.isnan(reference)], current[~np.isnan(current)]
+
+    if len(reference) == 0 or len(current) == 0:
+        return 0.0
+
+    edges = np.unique(np.quantile(reference, np.linspace(0, 1, n_bins + 1)))
+    if len(edges) < 2: # Constant feature
+        return 0.0
+    edges[0], edges[-1] = -np.inf, np.inf
+
+    ref_share = np.clip(np.histogram(reference, edges)[0] / len(reference), eps, None)
+    cur_share = np.clip(np.histogram(current, edges)[0] / len(current), eps, None)
+
+    return float(np.sum((cur_share - ref_share) * np.log(cur_share / ref_share)))
\ No newline at end of file
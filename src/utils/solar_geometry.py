@@ -0,0 +1,51 @@
+# Solar geometry : vectorized sun elevation (NOAA approximation, ~0.5° accuracy) and daylight masks
+
+import numpy as np
+import pandas as pd
+
+def solar_elevation(index: pd.DatetimeIndex, latitude: float, longitude: float) -> np.ndarray:
+    """Sun elevation (degrees) at the given timestamps (tz-aware, or naive UTC) and coordinates"""
+
+    times = index.tz_convert("UTC") if index.tz is not None else index
+    day_of_year = times.dayofyear.to_numpy()
+    hours = (times.hour + times.minute / 60 + times.second / 3600).to_numpy()
+
+    # Fractional year (radians)
+    gamma = 2 * np.pi / 365 * (day_of_year - 1 + (hours - 12) / 24)
+
+    # Equation of time (minutes) and declination (radians)
+    eq_time = 229.18 * (
+        0.000075 + 0.001868 * np.cos(gamma) - 0.032077 * np.sin(gamma)
+        - 0.014615 * np.cos(2 * gamma) - 0.040849 * np.sin(2 * gamma)
+    )
+    declination = (
+        0.006918 - 0.399912 * np.cos(gamma) + 0.070257 * np.sin(gamma)
+        - 0.006758 * np.cos(2 * gamma) + 0.000907 * np.sin(2 * gamma)
+        - 0.002697 * np.cos(3 * gamma) + 0.00148 * np.sin(3 * gamma)
+    )
+
+    # Hour angle (radians) from the true solar time
+    true_solar_minutes = hours * 60 + eq_time + 4 * longitude
+    hour_angle = np.deg2rad(true_solar_minutes / 4 - 180)
+
+    lat = np.deg2rad(latitude)
+    sin_elevation = np.sin(lat) * np.sin(declination) + np.cos(lat) * np.cos(declination) * np.cos(hour_angle)
+
+    return np.rad2deg(np.arcsin(np.clip(sin_elevation, -1, 1)))
+
+def daylight_mask(
+        index: pd.DatetimeIndex,
+        latitude: float,
+        longitude: float,
+        min_elevation: float = 0.0,
+        half_width: pd.Timedelta = pd.Timedelta(minutes=30),
+    ) -> np.ndarray:
+    """
+    True when the sun is above min_elevation at some point of the hour around each timestamp
+    (both half-hour edges tested : hourly production is an average, dawn hours are kept)
+    """
+
+    before = solar_elevation(index - half_width, latitude, longitude)
+    after = solar_elevation(index + half_width, latitude, longitude)
+
+    return np.maximum(before, after) > min_elevation
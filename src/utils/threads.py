@@ -0,0 +1,73 @@
+# Thread budget shared by the training stack (Optuna, LightGBM, PyTorch, BLAS/OpenMP pools)
+# Nested parallelism is given one budget : parallel levels multiply, so each level gets a share
+
+import os
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from threadpoolctl import threadpool_limits
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ThreadAllocation:
+    """Thread counts of one process"""
+    optuna_n_jobs: int # Concurrent Optuna trials
+    lgbm_n_jobs:   int # LightGBM num_threads per fit (selector boosters included)
+    torch_threads: int # torch.set_num_threads
+    blas_threads:  int # OpenMP / BLAS pools (threadpoolctl)
+
+    def apply(self):
+        """
+        Cap torch and the native thread pools of the current process.
+        Return the threadpool_limits object (keep a reference while the limits must hold).
+        """
+        # Original pool sizes recorded before torch resizes its OpenMP pool (restored on exit)
+        limits = threadpool_limits(limits=self.blas_threads)
+        try:
+            import torch
+            torch.set_num_threads(self.torch_threads)
+        except ImportError:
+            pass
+
+        return limits
+
+class ThreadBudget:
+    """
+    Hands out the thread counts of a node according to the parallel mode :
+    - "sequential" : one process, optuna_workers concurrent trials sharing the LightGBM threads
+    - "process_pool" / "distributed" : n_workers processes on the node, sequential trials in each
+    - "torch" : one PyTorch training process
+    """
+
+    MODES = ("sequential", "process_pool", "distributed", "torch")
+
+    def __init__(self, total_threads: Optional[int] = None, optuna_workers: int = 4):
+        self.total_threads = max(1, total_threads or os.cpu_count() or 1)
+        self.optuna_workers = max(1, optuna_workers)
+
+    @classmethod
+    def from_settings(cls, settings) -> "ThreadBudget":
+        return cls(total_threads=settings.training_total_threads, optuna_workers=settings.training_optuna_workers)
+
+    def allocate(self, mode: str = "sequential", n_workers: int = 1) -> ThreadAllocation:
+        """Per-process allocation for a parallel mode (n_workers processes for the pool modes)"""
+
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown parallel mode '{mode}', expected one of {self.MODES}")
+
+        if mode == "sequential":
+            optuna_n_jobs = min(self.optuna_workers, self.total_threads)
+            per_fit = max(1, self.total_threads // optuna_n_jobs)
+            allocation = ThreadAllocation(optuna_n_jobs, per_fit, per_fit, per_fit)
+
+        elif mode in ("process_pool", "distributed"):
+            per_process = max(1, self.total_threads // max(1, n_workers))
+            allocation = ThreadAllocation(1, per_process, per_process, per_process)
+
+        else:
+            allocation = ThreadAllocation(1, self.total_threads, self.total_threads, self.total_threads)
+
+        logger.info(f"Thread budget ({mode}, {n_workers} process(es), {self.total_threads} threads) : {allocation}")
+        return allocation
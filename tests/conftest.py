@@ -1,7 +1,37 @@
+import os
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock
 
+# Settings modules are instantiated at import time : placeholders if no .env
+for key, value in {
+    "SUPABASE_API_URL": "http://localhost",
+    "SUPABASE_API_KEY": "test",
+    "PROJECT_NAME": "solar_prediction",
+    "VERSION": "test",
+    "API_SOLAR_KEY": "test",
+    "API_HSOLAR_KEY": "test",
+    "API_WEATHER_KEY": "test",
+    "API_FORECAST_WEATHER_KEY": "test",
+    "API_HIST_FORECAST_WEATHER_KEY": "test",
+    "SUPABASE_URL": "http://localhost",
+    "SUPABASE_KEY": "test",
+    "COORD_TABLE": "test",
+    "INFERENCE_BUCKET_NAME": "test",
+    "TRAINING_BUCKET_NAME": "test",
+    "MLFLOW_TRACKING_URI": "file:///tmp/mlruns",
+    "MLFLOW_TRACKING_USERNAME": "test",
+    "MLFLOW_TRACKING_PASSWORD": "test",
+    "MLFLOW_ALLOW_FILE_STORE": "true", # Local file-store tracking in the training tests
+    "PAST_FEATURE_LIST": '["solaire"]',
+    "TIMEFRAME_DICT": '{"hour": 24}',
+    "API_WEATHER_VARIABLES": '["shortwave_radiation"]',
+}.items():
+    os.environ.setdefault(key, value)
+
+import numpy as np
+import pandas as pd
+
 from app.main import app
 from app.dependencies import get_supabase_service
 
@@ -15,9 +45,128 @@ def client(mock_supabase):
     Client test API to test supabase.
     """
     app.dependency_overrides[get_supabase_service] = lambda: mock_supabase
-    
+
     with TestClient(app) as c:
         yield c
-        
+
     # Clearing
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+# --- Training fixtures ---
+
+METEO_FEATURES = ["shortwave_radiation", "cloud_cover"]
+
+SELECTOR_PARAMETERS = {
+    "lgbm_params": {
+        "num_leaves": 7,
+        "n_estimators": 20,
+        "learning_rate": 0.1,
+        "min_child_samples": 5,
+        "verbosity": -1,
+        "random_state": 42,
+        "importance_type": "gain",
+        "n_jobs": 1,
+    },
+    "threshold": 0.95,
+}
+
+def make_solar_frame(n_hours: int = 24 * 40, start: str = "2025-04-01", seed: int = 0):
+    """Synthetic hourly features (meteo + target lags) and solar production"""
+
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=n_hours, freq="h")
+    daylight = np.clip(np.sin((index.hour.to_numpy() - 6) / 12 * np.pi), 0, None)
+    radiation = 800 * daylight * rng.uniform(0.5, 1.0, n_hours)
+    cloud_cover = rng.uniform(0, 100, n_hours)
+    y = pd.Series(2 * radiation * (1 - cloud_cover / 200) + rng.normal(0, 5, n_hours), index=index, name="solaire").clip(lower=0)
+
+    X = pd.DataFrame({
+        "shortwave_radiation": radiation,
+        "cloud_cover": cloud_cover,
+        "hour_sin": np.sin(2 * np.pi * index.hour / 24),
+        "hour_cos": np.cos(2 * np.pi * index.hour / 24),
+        "solaire_lag_24": y.shift(24).bfill(),
+    }, index=index)
+
+    return X, y
+
+@pytest.fixture
+def solar_frame():
+    return make_solar_frame()
+
+@pytest.fixture
+def solar_settings(tmp_path):
+    """Settings with a local file-store MLflow tracking URI"""
+    from src.utils.config import SolarSettings
+
+    return SolarSettings(
+        mlflow_tracking_uri=f"file://{tmp_path / 'mlruns'}",
+        training_total_threads=2,
+        training_optuna_workers=1,
+    ) # type: ignore
+
+@pytest.fixture
+def orchestrator_factory(solar_settings):
+    """Small SolarTrainingOrchestrator (2 horizons, 2 folds, 2 trials, no champion lookup)"""
+    from src.pipelines.training_pipeline import SolarTrainingOrchestrator
+
+    def factory(**kwargs):
+        params = dict(
+            config=solar_settings,
+            meteo_features=METEO_FEATURES,
+            selector_parameters=SELECTOR_PARAMETERS,
+            experiment_name="tests",
+            n_horizons=2,
+            n_cv_splits=2,
+            num_trials=2,
+            max_boost_rounds=30,
+            early_stopping_rounds=5,
+            warm_start=False,
+        )
+        params.update(kwargs)
+        return SolarTrainingOrchestrator(**params)
+
+    return factory
+
+@pytest.fixture
+def champion(orchestrator_factory):
+    """Registered champion meta model trained on the first 30 days (orchestrator, X, y on 40 days)"""
+
+    X, y = make_solar_frame()
+    n_train = 24 * 30
+    orchestrator = orchestrator_factory(async_logging=False)
+    orchestrator.run_training_pipeline(X.iloc[:n_train], y.iloc[:n_train])
+    orchestrator.package_and_log_meta_model(X_sample=X.iloc[:3])
+
+    return orchestrator, X, y
+
+# --- Seq2seq fixtures ---
+
+ENCODER_FEATURES = ["solaire_lag_24", "hour_sin", "hour_cos"]
+DECODER_FEATURES = ["shortwave_radiation", "cloud_cover", "hour_sin", "hour_cos"]
+
+def make_seq2seq_loaders(n_hours: int = 24 * 15, seq_length: int = 24, output_len: int = 6):
+    """Small train / validation DataLoaders of scaled seq2seq windows"""
+    from src.etl import data_preparation
+
+    X, y = make_solar_frame(n_hours=n_hours)
+    train_dl, val_dl, *_ = data_preparation.prepare_lstm_data(
+        X, y, METEO_FEATURES, ENCODER_FEATURES, DECODER_FEATURES,
+        seq_length=seq_length, output_len=output_len, batch_size=32, stride=6,
+    )
+    return train_dl, val_dl
+
+def make_seq2seq(architecture: str = "lstm", output_len: int = 6, seed: int = 0):
+    import torch
+    from src.models import architectures
+
+    torch.manual_seed(seed)
+    return architectures.Seq2seq(
+        past_features_length=len(ENCODER_FEATURES) + 1,
+        future_features_length=len(DECODER_FEATURES),
+        hidden_size=8,
+        num_layers=2,
+        output_len=output_len,
+        dropout=0.0,
+        architecture=architecture,
+    )
@@ -0,0 +1,34 @@
+import pytest
+import torch
+
+from src.models import architectures
+from tests.conftest import DECODER_FEATURES, ENCODER_FEATURES, make_seq2seq
+
+@pytest.mark.parametrize("architecture", architectures.ARCHITECTURES)
+def test_seq2seq_output_shape(architecture):
+    model = make_seq2seq(architecture, output_len=6)
+    X_past = torch.randn(5, 48, len(ENCODER_FEATURES) + 1)
+    X_future = torch.randn(5, 6, len(DECODER_FEATURES))
+
+    output = model(X_past, X_future)
+
+    assert output.shape == (5, 6, 1)
+    output.sum().backward() # Trainable end to end
+    assert all(p.grad is not None for p in model.parameters() if p.requires_grad)
+
+def test_tcn_encoder_is_causal():
+    network = make_seq2seq("tcn").encoder.network.eval()
+    X_past = torch.randn(1, len(ENCODER_FEATURES) + 1, 48)
+    changed = X_past.clone()
+    changed[:, :, 30] += 10
+
+    with torch.no_grad():
+        reference, perturbed = network(X_past), network(changed)
+
+    # No look-ahead : steps before the change are untouched
+    torch.testing.assert_close(reference[:, :, :30], perturbed[:, :, :30])
+    assert not torch.allclose(reference[:, :, 30:], perturbed[:, :, 30:])
+
+def test_unknown_architecture_rejected():
+    with pytest.raises(ValueError, match="architecture"):
+        make_seq2seq("transformer")
@@ -0,0 +1,43 @@
+import optuna
+from optuna.storages import InMemoryStorage
+
+from src.training import champion as champion_lookup
+
+def test_champion_horizon_runs_and_models(champion):
+    orchestrator, X, _ = champion
+
+    assert champion_lookup.champion_training_run_id(orchestrator.model_name) == orchestrator._training_run_id
+
+    runs = champion_lookup.load_champion_horizon_runs(orchestrator.model_name)
+    assert sorted(runs) == [1, 2]
+    assert runs[1]["best_rmse"] > 0
+    assert orchestrator._cast_search_params(runs[1]["params"]) == orchestrator._cast_search_params(orchestrator._best_params_by_horizon[1])
+
+    models = champion_lookup.load_champion_models(orchestrator.model_name)
+    assert list(models) == ["+1h", "+2h"]
+    assert models["+1h"].predict(X.iloc[:2]).shape == (2,)
+
+def test_no_champion_gives_empty_runs(orchestrator_factory):
+    orchestrator_factory() # Tracking URI of the test
+    assert champion_lookup.load_champion_horizon_runs("Unknown_Model") == {}
+
+def test_warm_start_enqueues_previous_horizon_and_champion_params(champion, orchestrator_factory):
+    trained, X, y = champion
+    orchestrator = orchestrator_factory(warm_start=True, warm_num_trials=1)
+    orchestrator._load_champion_runs()
+    orchestrator._best_params_by_horizon[1] = {
+        "num_leaves": 42, "learning_rate": 0.05, "max_depth": 7, "min_child_samples": 12, "n_estimators": 20
+    }
+
+    seeds = orchestrator._warm_start_params_for(2)
+    assert seeds[0] == {"num_leaves": 42, "learning_rate": 0.05, "max_depth": 7, "min_child_samples": 12}
+    assert seeds[1] == orchestrator._cast_search_params(trained._best_params_by_horizon[2])
+
+    # Seeds are the first trials, the budget is warm_num_trials
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=2)
+    _, selector_parameters = orchestrator._selector_parameters_for(2)
+    storage = InMemoryStorage()
+    orchestrator._optimize_hyperparameters(X_h, y_h, selector_parameters, study_name="h2", storage=storage, warm_start_params=seeds)
+
+    trials = optuna.load_study(study_name="h2", storage=storage).trials
+    assert trials[0].params == seeds[0]
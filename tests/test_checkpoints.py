@@ -0,0 +1,72 @@
+import optuna
+import pytest
+from optuna.storages import InMemoryStorage
+from optuna.trial import TrialState
+
+from src.training.checkpoints import TrainingCheckpointStore
+from tests.conftest import make_solar_frame
+
+def test_fail_stale_trials_marks_running_trials_failed(tmp_path):
+    store = TrainingCheckpointStore(tmp_path)
+    study = optuna.create_study(study_name=store.study_name(1), storage=store.storage)
+    study.ask()  # Left RUNNING by a crashed process
+    study.tell(study.ask(), 1.0)
+
+    store.fail_stale_trials()
+
+    states = [trial.state for trial in optuna.load_study(study_name=store.study_name(1), storage=store.storage).trials]
+    assert states == [TrialState.FAIL, TrialState.COMPLETE]
+
+def test_failed_trials_not_counted_in_the_budget(orchestrator_factory):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    orchestrator = orchestrator_factory(num_trials=2)
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=1)
+    _, selector_parameters = orchestrator._selector_parameters_for(1)
+
+    storage = InMemoryStorage()
+    study = optuna.create_study(study_name="h1", storage=storage)
+    study.tell(study.ask(), state=TrialState.FAIL)
+
+    orchestrator._optimize_hyperparameters(X_h, y_h, selector_parameters, study_name="h1", storage=storage)
+
+    study = optuna.load_study(study_name="h1", storage=storage)
+    assert len(study.get_trials(states=(TrialState.COMPLETE, TrialState.PRUNED))) == 2
+
+def test_resume_skips_checkpointed_horizons(orchestrator_factory, tmp_path):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    checkpoint_dir = str(tmp_path / "checkpoints")
+
+    # 1 - Crash on the second horizon
+    crashed = orchestrator_factory(async_logging=False, checkpoint_dir=checkpoint_dir)
+    fit_single_horizon = crashed._fit_single_horizon
+
+    def crash_on_second(X_train, y_train, horizon):
+        if horizon == 2:
+            raise RuntimeError("node lost")
+        return fit_single_horizon(X_train, y_train, horizon)
+
+    crashed._fit_single_horizon = crash_on_second
+    with pytest.raises(RuntimeError, match="node lost"):
+        crashed.run_training_pipeline(X, y)
+
+    # 2 - Resume : horizon 1 restored, only horizon 2 trained, same parent run
+    resumed = orchestrator_factory(async_logging=False, checkpoint_dir=checkpoint_dir)
+    trained = []
+    fit_resumed = resumed._fit_single_horizon
+
+    def record(X_train, y_train, horizon):
+        trained.append(horizon)
+        return fit_resumed(X_train, y_train, horizon)
+
+    resumed._fit_single_horizon = record
+    models = resumed.run_training_pipeline(X, y, resume=True)
+
+    assert trained == [2]
+    assert list(models) == ["+1h", "+2h"]
+    assert resumed._training_run_id == crashed._training_run_id
+
+def test_resume_requires_checkpoint_dir(orchestrator_factory):
+    X, y = make_solar_frame(n_hours=24 * 30)
+
+    with pytest.raises(ValueError, match="checkpoint_dir"):
+        orchestrator_factory().run_training_pipeline(X, y, resume=True)
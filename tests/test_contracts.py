@@ -0,0 +1,48 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from src.models import contracts
+from tests.conftest import make_solar_frame
+
+@pytest.fixture
+def horizon_result(orchestrator_factory):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    orchestrator = orchestrator_factory(n_horizons=1)
+    return orchestrator._fit_single_horizon(X, y, horizon=1), orchestrator, X
+
+def test_result_keeps_only_example_rows_and_schema(horizon_result):
+    result, _, X = horizon_result
+
+    assert len(result.input_example) == 3
+    assert result.input_schema == {col: "float64" for col in X.columns}
+    assert len(pickle.dumps(result.input_example)) < len(pickle.dumps(X))
+    assert result.signature.inputs.input_names() == list(X.columns)
+
+def test_validate_input_rejects_missing_columns(horizon_result):
+    result, _, X = horizon_result
+
+    result.validate_input(X.assign(extra=1.0)) # Extra columns allowed
+    result.validate_input(X.astype({"cloud_cover": "float32"})) # Other dtypes cast at inference
+    with pytest.raises(ValueError, match="Missing input columns"):
+        result.validate_input(X.drop(columns="cloud_cover"))
+
+def test_meta_model_checks_the_training_schema(orchestrator_factory):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    orchestrator = orchestrator_factory(n_horizons=1, async_logging=False)
+    orchestrator.run_training_pipeline(X, y)
+    meta_model = orchestrator._build_meta_model()
+
+    predictions = meta_model.predict(X.iloc[:5])
+    assert list(predictions.columns) == ["+1h"]
+    pd.testing.assert_frame_equal(meta_model.predict(X.iloc[:5].astype("float32")), predictions) # Cast to the training dtypes
+    with pytest.raises(ValueError, match="Missing input columns"):
+        meta_model.predict(X.drop(columns="solaire_lag_24").iloc[:5])
+
+def test_validate_input_schema_function():
+    X, _ = make_solar_frame(n_hours=10)
+
+    contracts.validate_input_schema(X, X.dtypes.astype(str).to_dict())
+    with pytest.raises(ValueError):
+        contracts.validate_input_schema(X[["cloud_cover"]], {"cloud_cover": "float64", "hour_sin": "float64"})
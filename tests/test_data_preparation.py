@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+import torch
+
+from src.etl import data_preparation
+from tests.conftest import METEO_FEATURES, make_solar_frame
+
+ENCODER = ["solaire_lag_24", "hour_sin"]
+DECODER = ["shortwave_radiation", "hour_sin", "hour_cos"]
+
+def eager_windows(X, y, seq_length, output_len, stride):
+    """Reference : every window materialized with numpy fancy indexing"""
+    starts = np.arange(0, len(X) - seq_length - output_len + 1, stride)
+    past = starts[:, None] + np.arange(seq_length)
+    future = starts[:, None] + np.arange(seq_length, seq_length + output_len)
+    encoder = np.column_stack([X[ENCODER].to_numpy(), y.to_numpy()])
+
+    return (
+        torch.tensor(encoder[past], dtype=torch.float32),
+        torch.tensor(X[DECODER].to_numpy()[future], dtype=torch.float32),
+        torch.tensor(y.to_numpy()[future], dtype=torch.float32).unsqueeze(-1),
+    )
+
+def test_lazy_batches_match_eager_windows():
+    X, y = make_solar_frame(n_hours=200)
+    loader = data_preparation.to_dataloader(X, ENCODER, DECODER, y, seq_length=24, seq_future_length=6, batch_size=16, stride=5)
+
+    batches = [torch.cat(parts) for parts in zip(*loader)]
+    for lazy, eager in zip(batches, eager_windows(X, y, 24, 6, 5)):
+        assert lazy.shape == eager.shape
+        torch.testing.assert_close(lazy, eager)
+
+def test_single_window_item():
+    X, y = make_solar_frame(n_hours=200)
+    dataset = data_preparation.SlidingWindowDataset(X, y, ENCODER, DECODER, seq_length=24, seq_future_length=6, stride=5)
+    X_past, X_future, y_target = dataset[3]
+
+    assert X_past.shape == (24, len(ENCODER) + 1)
+    assert X_future.shape == (6, len(DECODER))
+    assert y_target.shape == (6, 1)
+    assert X_past[0, -1].item() == pytest.approx(float(y.iloc[15]))
+
+def test_missing_features_raise():
+    X, y = make_solar_frame(n_hours=200)
+
+    with pytest.raises(ValueError, match="missing from the training frame"):
+        data_preparation.to_dataloader(X.drop(columns="hour_cos"), ENCODER, DECODER, y, 24, 6, 16, 5)
+    with pytest.raises(ValueError, match="row aligned"):
+        data_preparation.to_dataloader(X, ENCODER, DECODER, y.iloc[:100], 24, 6, 16, 5)
+
+def test_prepare_lstm_data_splits_and_scales():
+    X, y = make_solar_frame(n_hours=24 * 20)
+
+    train_dl, val_dl, processor, X_example, y_past_example = data_preparation.prepare_lstm_data(
+        X, y, METEO_FEATURES, ENCODER, DECODER, seq_length=24, output_len=6, batch_size=16, stride=6
+    )
+
+    assert len(train_dl.dataset) > len(val_dl.dataset) > 0
+    assert len(X_example) == 30 and len(y_past_example) == 24
+    X_past, _, _ = next(iter(train_dl))
+    assert X_past[..., -1].max() <= 1.5 # Target scaled by its rolling quantile
+    assert processor.last_denominator_ > 0
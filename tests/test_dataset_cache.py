@@ -0,0 +1,85 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.training.dataset_cache import LGBMDatasetCache
+
+DATASET_PARAMS = {"max_bin": 63, "verbosity": -1, "seed": 42}
+
+def make_fold(n_rows: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n_rows, 3)), columns=["a", "b", "c"])
+    y = pd.Series(rng.normal(size=n_rows), name="y")
+    return X, y
+
+def test_dataset_saved_then_reloaded_from_disk(tmp_path):
+    X, y = make_fold()
+
+    first = LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS)
+    built = first.get_or_build("short", 0, X, y)
+
+    files = list(tmp_path.glob("*.bin"))
+    assert len(files) == 1
+    assert files[0].name.startswith("short_fold0_")
+
+    # New run : same content, loaded from the binary file
+    second = LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS)
+    loaded = second.get_or_build("short", 0, X, y)
+
+    assert loaded.num_data() == built.num_data() == len(X)
+    assert loaded.num_feature() == built.num_feature() == 3
+    np.testing.assert_allclose(loaded.get_label(), y.to_numpy())
+
+def test_memory_hit_returns_same_dataset():
+    X, y = make_fold()
+    cache = LGBMDatasetCache(cache_dir=None, dataset_params=DATASET_PARAMS)
+
+    assert cache.get_or_build("short", 0, X, y) is cache.get_or_build("short", 0, X, y)
+
+    cache.clear_memory()
+    assert cache._memory == {}
+
+def test_hash_changes_with_data_columns_and_params():
+    X, y = make_fold()
+    cache = LGBMDatasetCache(cache_dir=None, dataset_params=DATASET_PARAMS)
+    reference = cache.dataset_hash(X, y)
+
+    assert cache.dataset_hash(X, y) == reference
+    assert cache.dataset_hash(X.rename(columns={"a": "z"}), y) != reference
+    assert cache.dataset_hash(X, y + 1) != reference
+    assert LGBMDatasetCache(cache_dir=None, dataset_params={**DATASET_PARAMS, "max_bin": 255}).dataset_hash(X, y) != reference
+
+def test_unreadable_file_is_rebuilt(tmp_path):
+    X, y = make_fold()
+    cache = LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS)
+    cache.get_or_build("short", 0, X, y)
+
+    path = next(tmp_path.glob("*.bin"))
+    path.write_bytes(b"corrupted")
+
+    rebuilt = LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS).get_or_build("short", 0, X, y)
+    assert rebuilt.num_data() == len(X)
+
+def test_least_recently_used_files_evicted(tmp_path):
+    cache = LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS, max_entries=2, max_age_days=None)
+    for fold in range(3):
+        cache.get_or_build("short", fold, *make_fold(seed=fold))
+        path = next(tmp_path.glob(f"short_fold{fold}_*.bin"))
+        os.utime(path, (1e9 + fold, 1e9 + fold)) # Deterministic use order
+
+    cache.get_or_build("short", 3, *make_fold(seed=3))
+
+    assert sorted(path.name.split("_")[1] for path in tmp_path.glob("*.bin")) == ["fold2", "fold3"]
+
+def test_expired_files_evicted_on_init(tmp_path):
+    X, y = make_fold()
+    LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS).get_or_build("short", 0, X, y)
+    path = next(tmp_path.glob("*.bin"))
+    old = time.time() - 31 * 86400
+    os.utime(path, (old, old))
+
+    LGBMDatasetCache(cache_dir=tmp_path, dataset_params=DATASET_PARAMS, max_age_days=30)
+
+    assert not path.exists()
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+from src.etl import processors
+from src.etl.data_processing import feature_engine
+from src.utils import solar_geometry
+from tests.conftest import METEO_FEATURES, make_solar_frame
+
+LATITUDE, LONGITUDE = 43.6, 2.6
+
+def test_solar_elevation_noon_and_midnight():
+    index = pd.DatetimeIndex(["2025-06-21 12:00", "2025-06-21 00:00", "2025-12-21 12:00"], tz="UTC")
+    elevation = solar_geometry.solar_elevation(index, LATITUDE, LONGITUDE)
+
+    # Summer solstice noon ~ 90 - 43.6 + 23.4, winter noon ~ 90 - 43.6 - 23.4
+    assert abs(elevation[0] - 69.8) < 1.5
+    assert elevation[1] < -15
+    assert abs(elevation[2] - 23.0) < 1.5
+
+def test_daylight_mask_keeps_dawn_hour():
+    index = pd.date_range("2025-06-21", periods=24, freq="h", tz="UTC")
+    mask = solar_geometry.daylight_mask(index, LATITUDE, LONGITUDE)
+    elevation = solar_geometry.solar_elevation(index, LATITUDE, LONGITUDE)
+
+    assert mask[12] and not mask[0]
+    first_day = int(np.argmax(mask))
+    assert elevation[first_day] <= 0 < solar_geometry.solar_elevation(index[[first_day]] + pd.Timedelta(minutes=30), LATITUDE, LONGITUDE)[0]
+
+def test_rolling_quantile_window_spans_days_on_daylight_rows():
+    _, y = make_solar_frame(n_hours=24 * 10)
+    is_day = solar_geometry.daylight_mask(y.index, LATITUDE, LONGITUDE)
+    processor = processors.SolarDataProcessor(meteo_features=METEO_FEATURES, window_days=2, time_window=True)
+
+    denominators = processor._rolling_quantile(y.loc[is_day])
+
+    t = denominators.index[-1]
+    window = y.loc[is_day].loc[t - pd.Timedelta(days=2):t].iloc[1:] # (t - 2 days, t]
+    assert denominators.iloc[-1] == np.float32(window.quantile(0.99))
+
+def test_rolling_quantile_unchanged_on_regular_hours():
+    _, y = make_solar_frame(n_hours=24 * 10)
+    processor = processors.SolarDataProcessor(meteo_features=METEO_FEATURES, window_days=2, time_window=True)
+
+    rows_window = y.rolling(window=48, min_periods=24).quantile(0.99).bfill().astype(np.float32)
+    pd.testing.assert_series_equal(processor._rolling_quantile(y), rows_window)
+
+def test_rolling_quantile_default_row_window_with_gaps():
+    _, y = make_solar_frame(n_hours=24 * 10)
+    y_gaps = y.drop(y.index[24 * 3:24 * 4]) # Missing day
+    processor = processors.SolarDataProcessor(meteo_features=METEO_FEATURES, window_days=2)
+
+    rows_window = y_gaps.rolling(window=48, min_periods=24).quantile(0.99).bfill().astype(np.float32)
+    pd.testing.assert_series_equal(processor._rolling_quantile(y_gaps), rows_window)
+
+def test_daylight_only_training_and_night_zeros(orchestrator_factory):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    orchestrator = orchestrator_factory(daylight_only=True, async_logging=False)
+
+    X_h, _ = orchestrator._prepare_horizon_data(X, y, horizon=2)
+    target_times = X_h.index + pd.Timedelta(hours=2)
+    assert solar_geometry.daylight_mask(target_times, LATITUDE, LONGITUDE, min_elevation=-1.0).all()
+    assert len(X_h) < len(X) - 2
+
+    orchestrator.run_training_pipeline(X, y)
+    assert orchestrator.models_dict["+1h"].named_steps["processor"].time_window
+    predictions = orchestrator._build_meta_model().predict(X.iloc[-24:])
+    night = ~solar_geometry.daylight_mask(X.index[-24:] + pd.Timedelta(hours=1), LATITUDE, LONGITUDE, min_elevation=-1.0)
+    assert (predictions.loc[night, "+1h"] == 0).all()
+
+def test_transform_pipeline_feature_set_unchanged():
+    index = pd.date_range("2025-06-21", periods=48, freq="h", tz="Europe/Paris")
+    df = pd.DataFrame({"shortwave_radiation": np.arange(48.0)}, index=index)
+
+    transformed = feature_engine.transform_pipeline(df, timeframe_dict={"hour": 24})
+
+    assert "sun_elevation" not in transformed.columns
@@ -0,0 +1,73 @@
+import optuna
+from optuna.distributions import FloatDistribution, IntDistribution
+from optuna.trial import create_trial
+
+from src.training.distributed import SharedTrainingWorkspace
+from tests.conftest import make_solar_frame
+
+SEARCH_DISTRIBUTIONS = {
+    "num_leaves": IntDistribution(10, 100),
+    "learning_rate": FloatDistribution(0.005, 0.2, log=True),
+    "max_depth": IntDistribution(1, 30),
+    "min_child_samples": IntDistribution(10, 50),
+}
+
+def fill_study(workspace: SharedTrainingWorkspace, horizon: int, n_trials: int) -> None:
+    """Completed trials added by other workers"""
+    study = optuna.create_study(study_name=workspace.study_name(horizon), storage=workspace.storage, load_if_exists=True)
+    for i in range(n_trials):
+        study.add_trial(create_trial(
+            params={"num_leaves": 15 + i, "learning_rate": 0.1, "max_depth": 5, "min_child_samples": 10},
+            distributions=SEARCH_DISTRIBUTIONS,
+            value=100.0 - i,
+            user_attrs={"n_estimators": 10},
+        ))
+
+def test_worker_fits_horizons_of_a_full_study_without_search(orchestrator_factory, tmp_path, monkeypatch):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(num_trials=5, warm_start=True, warm_num_trials=2)
+    workspace = SharedTrainingWorkspace(tmp_path / "workspace")
+
+    # +1h : num_trials done. +2h : warm started by +1h best params, warm_num_trials done
+    fill_study(workspace, horizon=1, n_trials=5)
+    fill_study(workspace, horizon=2, n_trials=2)
+
+    def no_search(*args, **kwargs):
+        raise AssertionError("budget already reached, no search expected")
+    prepared = []
+    prepare = orchestrator._prepare_horizon_data
+    monkeypatch.setattr(orchestrator, "_optimize_hyperparameters", no_search)
+    monkeypatch.setattr(orchestrator, "_load_champion_runs", lambda: None)
+    monkeypatch.setattr(orchestrator, "_prepare_horizon_data", lambda X, y, horizon: prepared.append(horizon) or prepare(X, y, horizon))
+
+    orchestrator.run_worker(X, y, workspace_dir=str(tmp_path / "workspace"))
+
+    # Data prepared once per claimed final fit only
+    assert prepared == [1, 2]
+    assert workspace.completed_horizons(2) == [1, 2]
+    assert workspace.load_result(1).best_params["num_leaves"] == 19 # Best trial of the filled study
+
+def test_late_worker_skips_claimed_horizons_without_preparing_data(orchestrator_factory, tmp_path, monkeypatch):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(num_trials=2)
+    workspace = SharedTrainingWorkspace(tmp_path / "workspace")
+    for horizon in (1, 2):
+        fill_study(workspace, horizon=horizon, n_trials=2)
+        assert workspace.try_claim(f"fit_{workspace.study_name(horizon)}") # Owned by another worker
+
+    def no_preparation(*args, **kwargs):
+        raise AssertionError("nothing left to do, no data preparation expected")
+    monkeypatch.setattr(orchestrator, "_prepare_horizon_data", no_preparation)
+
+    orchestrator.run_worker(X, y, workspace_dir=str(tmp_path / "workspace"))
+
+    assert workspace.completed_horizons(2) == []
+
+def test_try_claim_is_exclusive(tmp_path):
+    workspace = SharedTrainingWorkspace(tmp_path)
+
+    assert workspace.try_claim("fit_horizon_01")
+    assert not workspace.try_claim("fit_horizon_01")
+
+    workspace.release("fit_horizon_01")
+    assert workspace.try_claim("fit_horizon_01")
@@ -0,0 +1,50 @@
+from src.training import champion as champion_lookup
+from tests.conftest import make_solar_frame
+
+def test_fast_retrain_keeps_champion_params_within_tolerance(champion, orchestrator_factory, monkeypatch):
+    trained, X, y = champion
+    orchestrator = orchestrator_factory(async_logging=False)
+
+    def no_search(*args, **kwargs):
+        raise AssertionError("Optuna search launched")
+
+    monkeypatch.setattr(orchestrator, "_optimize_hyperparameters", no_search)
+    models = orchestrator.run_fast_retrain_pipeline(X, y, rmse_tolerance=10.0)
+
+    assert list(models) == ["+1h", "+2h"]
+    champion_params = trained._cast_search_params(trained._best_params_by_horizon[1])
+    assert orchestrator._cast_search_params(orchestrator._best_params_by_horizon[1]) == champion_params
+    assert 1 <= orchestrator._best_params_by_horizon[1]["n_estimators"] <= orchestrator.max_boost_rounds
+
+def test_fast_retrain_searches_degraded_horizons(champion, orchestrator_factory, monkeypatch):
+    _, X, y = champion
+    orchestrator = orchestrator_factory(async_logging=False)
+    optimize = orchestrator._optimize_hyperparameters
+    searched = []
+
+    def record_search(*args, **kwargs):
+        searched.append(kwargs["set_name"])
+        assert kwargs["folds_data"] is not None # Folds of the champion check reused
+        return optimize(*args, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "_optimize_hyperparameters", record_search)
+    orchestrator.run_fast_retrain_pipeline(X, y, rmse_tolerance=-1.0) # Every CV RMSE exceeds a negative bound
+
+    assert len(searched) == 2
+
+def test_fast_retrain_without_champion_runs_full_search(orchestrator_factory, monkeypatch):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    orchestrator = orchestrator_factory(async_logging=False)
+    orchestrator.model_name = "No_Champion_Model"
+    trained = []
+    fit_single_horizon = orchestrator._fit_single_horizon
+
+    def record(X_train, y_train, horizon):
+        trained.append(horizon)
+        return fit_single_horizon(X_train, y_train, horizon)
+
+    monkeypatch.setattr(orchestrator, "_fit_single_horizon", record)
+    orchestrator.run_fast_retrain_pipeline(X, y)
+
+    assert trained == [1, 2]
+    assert champion_lookup.load_champion_horizon_runs("No_Champion_Model") == {}
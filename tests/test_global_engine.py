@@ -0,0 +1,77 @@
+import numpy as np
+import lightgbm as lgb
+import pytest
+
+from src.etl import horizons
+from src.pipelines.global_training_pipeline import SolarGlobalTrainingOrchestrator
+from src.training import global_engine
+from tests.conftest import METEO_FEATURES, SELECTOR_PARAMETERS, make_solar_frame
+
+def test_stack_horizons_long_format():
+    X, y = make_solar_frame(n_hours=50)
+    y.iloc[10] = np.nan
+    matrix = horizons.horizon_target_matrix(y, 3)
+
+    values, target, positions = global_engine.stack_horizons(X, matrix, [1, 3])
+
+    # y[t+1] known for t < 49 except t = 9, y[t+3] for t < 47 except t = 7
+    assert len(target) == 48 + 46
+    assert values.dtype == np.float32
+    assert set(values[:, -1]) == {1.0, 3.0}
+    for row in (0, 60):
+        h, t = int(values[row, -1]), positions[row]
+        assert target[row] == y.iloc[t + h]
+        np.testing.assert_allclose(values[row, :-1], X.iloc[t].to_numpy(dtype=np.float32))
+
+def test_fit_horizon_group_predicts_every_horizon(monkeypatch):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    fitted_rows = []
+    fit = lgb.LGBMRegressor.fit
+    monkeypatch.setattr(lgb.LGBMRegressor, "fit", lambda self, X, y, **kwargs: fitted_rows.append(len(X)) or fit(self, X, y, **kwargs))
+
+    group, val_rmse = global_engine.fit_horizon_group(
+        X, y,
+        horizons=[1, 2, 3],
+        meteo_features=METEO_FEATURES,
+        selector_parameters=SELECTOR_PARAMETERS,
+        params={"num_leaves": 7, "learning_rate": 0.1, "n_estimators": 30, "min_child_samples": 5},
+        early_stopping_rounds=5,
+        n_jobs=1,
+    )
+
+    predictions = group.predict(X.iloc[-5:])
+    assert val_rmse > 0
+    assert list(predictions.columns) == ["+1h", "+2h", "+3h"]
+    assert predictions.index.equals(X.index[-5:])
+    # Deployed booster : early stopped number of trees, refitted on every stacked row (validation period included)
+    assert group.model.booster_.current_iteration() == group.model.n_estimators <= 30
+    assert fitted_rows[-1] > fitted_rows[-2]
+
+@pytest.mark.parametrize("group_mode, n_boosters", [("groups", 2), ("single", 1)])
+def test_global_orchestrator_meta_model(solar_settings, group_mode, n_boosters):
+    X, y = make_solar_frame(n_hours=24 * 30)
+    orchestrator = SolarGlobalTrainingOrchestrator(
+        config=solar_settings,
+        meteo_features=METEO_FEATURES,
+        selector_parameters=SELECTOR_PARAMETERS,
+        experiment_name="tests",
+        n_horizons=4, # short (1-3) and mid (4) feature sets
+        max_boost_rounds=30,
+        early_stopping_rounds=5,
+        warm_start=False,
+        group_mode=group_mode,
+    )
+
+    group_models = orchestrator.run_training_pipeline(X, y)
+    predictions = orchestrator._build_meta_model().predict(X.iloc[:5])
+
+    assert len(group_models) == n_boosters
+    assert list(predictions.columns) == ["+1h", "+2h", "+3h", "+4h"]
+    assert (predictions >= 0).all().all()
+
+def test_unknown_group_mode_rejected(solar_settings):
+    with pytest.raises(ValueError, match="group_mode"):
+        SolarGlobalTrainingOrchestrator(
+            config=solar_settings, meteo_features=METEO_FEATURES, selector_parameters=SELECTOR_PARAMETERS,
+            experiment_name="tests", warm_start=False, group_mode="clusters",
+        )
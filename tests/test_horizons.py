@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.etl import horizons
+from tests.conftest import make_solar_frame
+
+def test_target_matrix_is_shifted_target():
+    _, y = make_solar_frame(n_hours=100)
+    matrix = horizons.horizon_target_matrix(y, n_horizons=3)
+
+    assert matrix.shape == (100, 3)
+    assert not matrix.flags.writeable
+    for h in (1, 2, 3):
+        np.testing.assert_array_equal(matrix[:, h - 1], y.shift(-h).to_numpy())
+
+@pytest.mark.parametrize("horizon", [1, 5])
+def test_align_horizon_matches_shift_and_dropna(horizon):
+    X, y = make_solar_frame(n_hours=100)
+    y.iloc[[10, 40]] = np.nan
+    matrix = horizons.horizon_target_matrix(y, n_horizons=5)
+
+    X_h, y_h = horizons.align_horizon(X, y, horizon, target_matrix=matrix)
+
+    expected_y = y.shift(-horizon).dropna()
+    pd.testing.assert_series_equal(y_h, expected_y, check_freq=False)
+    pd.testing.assert_frame_equal(X_h, X.loc[expected_y.index], check_freq=False)
+
+def test_align_horizon_without_missing_targets_keeps_leading_rows():
+    X, y = make_solar_frame(n_hours=100)
+
+    X_h, y_h = horizons.align_horizon(X, y, horizon=2)
+
+    assert len(X_h) == len(y_h) == 98
+    assert (y_h.index == X.index[:98]).all()
+    np.testing.assert_array_equal(y_h.to_numpy(), y.to_numpy()[2:])
+
+def test_align_horizon_requires_row_aligned_inputs():
+    X, y = make_solar_frame(n_hours=100)
+
+    with pytest.raises(ValueError, match="row aligned"):
+        horizons.align_horizon(X.iloc[:50], y, horizon=1)
@@ -0,0 +1,43 @@
+import optuna
+from optuna.storages import InMemoryStorage
+from optuna.trial import TrialState
+
+from src.training import engine
+from tests.conftest import METEO_FEATURES, SELECTOR_PARAMETERS, make_solar_frame
+
+def test_orchestrator_search_reports_each_fold(orchestrator_factory):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(n_cv_splits=3, num_trials=3)
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=1)
+    _, selector_parameters = orchestrator._selector_parameters_for(1)
+
+    storage = InMemoryStorage()
+    best_rmse, best_params = orchestrator._optimize_hyperparameters(
+        X_h, y_h, selector_parameters, study_name="h1", storage=storage
+    )
+    study = optuna.load_study(study_name="h1", storage=storage)
+
+    # Cumulative fold RMSE reported after every fold of the completed trials
+    for trial in study.get_trials(states=(TrialState.COMPLETE,)):
+        assert sorted(trial.intermediate_values) == [0, 1, 2]
+
+    # n_estimators from early stopping, bounded by max_boost_rounds
+    assert 1 <= best_params["n_estimators"] <= orchestrator.max_boost_rounds
+    assert best_rmse == study.best_value
+
+def test_train_lightgbm_returns_early_stopped_n_estimators():
+    X, y = make_solar_frame(n_hours=24 * 30)
+
+    best_rmse, best_params = engine.train_lightgbm(
+        X, y,
+        meteo_features=METEO_FEATURES,
+        nb_cv_splits=2,
+        num_trials=2,
+        selector_parameters={**SELECTOR_PARAMETERS, "horizons": [1]},
+        max_boost_rounds=40,
+        early_stopping_rounds=5,
+    )
+
+    assert best_rmse > 0
+    assert 1 <= best_params["n_estimators"] <= 40
+    assert {"num_leaves", "learning_rate", "max_depth", "min_child_samples"} <= set(best_params)
@@ -0,0 +1,63 @@
+import tempfile
+
+import optuna
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
+from optuna.trial import TrialState
+
+from src.training import engine
+from src.utils.threads import ThreadBudget
+from tests.conftest import DECODER_FEATURES, ENCODER_FEATURES, METEO_FEATURES, make_solar_frame
+
+BASE_PARAMS = {"output_len": 6, "batch_size": 64, "stride": 12, "num_epochs": 2}
+
+def test_train_lstm_process_parallel_search(tmp_path):
+    X, y = make_solar_frame(n_hours=24 * 30)
+
+    best_rmse, best_params = engine.train_lstm(
+        X, y,
+        meteo_features=METEO_FEATURES,
+        encoder_features=ENCODER_FEATURES,
+        decoder_features=DECODER_FEATURES,
+        base_params=BASE_PARAMS,
+        num_trials=3,
+        n_workers=2,
+        thread_budget=ThreadBudget(total_threads=2),
+        storage_dir=str(tmp_path),
+    )
+
+    # One shared journal study : every trial of both workers, validation RMSE reported per epoch
+    storage = JournalStorage(JournalFileBackend(str(tmp_path / "optuna_journal.log")))
+    study = optuna.load_study(study_name=optuna.get_all_study_names(storage)[0], storage=storage)
+    completed = study.get_trials(states=(TrialState.COMPLETE,))
+
+    assert len(study.trials) == 3
+    assert best_rmse == study.best_value
+    for trial in completed:
+        assert sorted(trial.intermediate_values) == [0, 1]
+        assert trial.value > trial.user_attrs["val_rmse_scaled"] # Objective in MWh, pruning on the scaled target
+    assert set(best_params) == {"hidden_size", "num_layers", "dropout", "learning_rate", "seq_length"}
+
+def test_single_layer_trials_have_no_dropout():
+    study = optuna.create_study()
+    for _ in range(20):
+        params = engine._suggest_lstm_params(study.ask())
+        if params["num_layers"] == 1:
+            assert params["dropout"] == 0.0
+
+def test_train_lstm_removes_its_temporary_journal(tmp_path, monkeypatch):
+    X, y = make_solar_frame(n_hours=24 * 20)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    engine.train_lstm(
+        X, y,
+        meteo_features=METEO_FEATURES,
+        encoder_features=ENCODER_FEATURES,
+        decoder_features=DECODER_FEATURES,
+        base_params={**BASE_PARAMS, "num_epochs": 1},
+        num_trials=1,
+        n_workers=1,
+        thread_budget=ThreadBudget(total_threads=1),
+    )
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from src.etl import processors
+from src.models import model_wrappers
+from tests.conftest import DECODER_FEATURES, ENCODER_FEATURES, METEO_FEATURES, make_seq2seq, make_solar_frame
+
+SEQ_LENGTH, OUTPUT_LEN = 24, 6
+
+@pytest.fixture
+def wrapper():
+    X, y = make_solar_frame(n_hours=24 * 10)
+    processor = processors.SolarDataProcessor(meteo_features=METEO_FEATURES).fit(X, y)
+    wrapper = model_wrappers.SolarLSTMWrapper(
+        processor=processor,
+        model=make_seq2seq(output_len=OUTPUT_LEN),
+        encoder_features=ENCODER_FEATURES,
+        decoder_features=DECODER_FEATURES,
+        seq_length=SEQ_LENGTH,
+        output_len=OUTPUT_LEN,
+    )
+    return wrapper, X.assign(solar_mw=y)
+
+def test_batch_matches_single_window_predictions(wrapper):
+    wrapper, model_input = wrapper
+    frame = model_input.iloc[:60]
+
+    batch = wrapper.predict_batch(frame, stride=5)
+
+    assert list(batch.columns) == [f"+{h}h" for h in range(1, OUTPUT_LEN + 1)]
+    for i, issue_time in enumerate(batch.index):
+        start = frame.index.get_loc(issue_time) - SEQ_LENGTH + 1
+        single = wrapper.predict(frame.iloc[start:start + SEQ_LENGTH + OUTPUT_LEN])
+        np.testing.assert_allclose(batch.iloc[i].to_numpy(), single, rtol=1e-5, atol=1e-6)
+
+def test_issue_times_select_windows(wrapper):
+    wrapper, model_input = wrapper
+    issue_times = model_input.index[[30, 50]]
+
+    batch = wrapper.predict_batch(model_input, issue_times=issue_times)
+
+    assert batch.index.equals(issue_times)
+    assert (batch.to_numpy() >= 0).all()
+
+def test_windows_outside_the_input_rejected(wrapper):
+    wrapper, model_input = wrapper
+
+    with pytest.raises(ValueError, match="without a full window"):
+        wrapper.predict_batch(model_input, issue_times=model_input.index[[5]]) # Not enough past rows
+    with pytest.raises(ValueError, match="at least"):
+        wrapper.predict_batch(model_input.iloc[:10])
+    with pytest.raises(ValueError, match="rows"):
+        wrapper.predict(model_input.iloc[:40])
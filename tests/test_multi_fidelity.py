@@ -0,0 +1,49 @@
+import optuna
+import pytest
+from optuna.storages import InMemoryStorage
+from optuna.trial import TrialState
+
+from tests.conftest import make_solar_frame
+
+def test_unknown_search_mode_rejected(orchestrator_factory):
+    with pytest.raises(ValueError, match="search_mode"):
+        orchestrator_factory(search_mode="grid")
+
+def test_fidelity_sets_hold_the_most_recent_rows(orchestrator_factory):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(search_mode="multi_fidelity", fidelity_rungs=[(0.25, 1, 10), (0.5, 2, 20)])
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=1)
+    _, selector_parameters = orchestrator._selector_parameters_for(1)
+
+    folds = orchestrator._build_cv_folds(X_h, y_h, selector_parameters, set_name="short")
+
+    for fold in folds:
+        full_train, _ = fold["fidelity_sets"][1.0]
+        n_rows = full_train.num_data()
+        assert sorted(fold["fidelity_sets"]) == [0.25, 0.5, 1.0]
+        for fraction in (0.25, 0.5):
+            subset, _ = fold["fidelity_sets"][fraction]
+            assert subset.num_data() == n_rows - int(n_rows * (1 - fraction))
+            assert list(subset.get_label()) == list(full_train.get_label()[-subset.num_data():])
+
+def test_multi_fidelity_reports_one_step_per_rung(orchestrator_factory):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(
+        search_mode="multi_fidelity",
+        fidelity_rungs=[(0.25, 1, 10), (0.5, 2, 20)],
+        num_trials=4,
+    )
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=1)
+    _, selector_parameters = orchestrator._selector_parameters_for(1)
+
+    storage = InMemoryStorage()
+    best_rmse, best_params = orchestrator._optimize_hyperparameters(
+        X_h, y_h, selector_parameters, study_name="h1", storage=storage
+    )
+    study = optuna.load_study(study_name="h1", storage=storage)
+
+    # Completed trials went through every low fidelity rung
+    for trial in study.get_trials(states=(TrialState.COMPLETE,)):
+        assert sorted(trial.intermediate_values) == [1, 2]
+    assert best_rmse == study.best_value
+    assert 1 <= best_params["n_estimators"] <= orchestrator.max_boost_rounds
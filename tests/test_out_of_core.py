@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import clone
+
+from src.etl import processors
+from src.training import out_of_core
+from tests.conftest import METEO_FEATURES, SELECTOR_PARAMETERS, make_solar_frame
+from tests.test_training_pipeline import child_runs
+
+NATIVE_PARAMS = {"num_leaves": 7, "learning_rate": 0.1, "min_data_in_leaf": 5, "verbosity": -1, "num_threads": 1}
+
+@pytest.fixture
+def partitions(tmp_path):
+    """Solar frame written as 2 parquet files of 100-row row groups"""
+    X, y = make_solar_frame(n_hours=24 * 30)
+    frame = X.assign(solaire=y)
+    frame.index = frame.index.tz_localize("Europe/Paris")
+
+    paths = []
+    for i, part in enumerate(np.array_split(np.arange(len(frame)), 2)):
+        path = tmp_path / f"part_{i}.parquet"
+        frame.iloc[part].to_parquet(path, row_group_size=100)
+        paths.append(str(path))
+
+    return out_of_core.ParquetPartitions(paths), frame
+
+def test_partitions_read_rows_across_row_groups(partitions):
+    parts, frame = partitions
+
+    assert parts.n_rows == len(frame)
+    pd.testing.assert_frame_equal(parts.read_rows(90, 410, ["cloud_cover"]), frame.iloc[90:410][["cloud_cover"]], check_freq=False)
+    np.testing.assert_allclose(parts.read_target().to_numpy(), frame["solaire"].to_numpy())
+
+def test_sequence_matches_in_memory_transform(partitions):
+    parts, frame = partitions
+    processor = out_of_core.fit_processor_streaming(parts, METEO_FEATURES).update_target_scaling(frame["solaire"])
+    features = ["shortwave_radiation", "solaire_lag_24"]
+
+    sequence = out_of_core.ScaledRowGroupSequence(parts, processor, features, n_rows=500)
+    expected = processor.transform(frame.drop(columns="solaire")).iloc[:500][features].to_numpy()
+
+    assert len(sequence) == 500
+    np.testing.assert_allclose(sequence[150:350], expected[150:350])
+    np.testing.assert_allclose(sequence[-1], expected[-1])
+
+def test_train_horizon_out_of_core(partitions):
+    parts, frame = partitions
+    processor = out_of_core.fit_processor_streaming(parts, METEO_FEATURES)
+
+    pipeline, X_holdout, y_holdout = out_of_core.train_horizon_out_of_core(
+        partitions=parts,
+        meteo_processor=processor,
+        y=parts.read_target(),
+        horizon=2,
+        selector_parameters={**SELECTOR_PARAMETERS, "horizons": [2]},
+        params={**NATIVE_PARAMS, "n_estimators": 15},
+        dataset_params={"max_bin": 63, "feature_pre_filter": False, "verbosity": -1},
+        sample_rows=300,
+        n_holdout=48,
+    )
+
+    assert len(X_holdout) == len(y_holdout) == 48
+    assert pipeline.named_steps["model"].booster_.current_iteration() == 15
+    assert pipeline.predict(X_holdout).shape == (48,)
+
+    # Target scaling of the horizon, as an in-memory processor fitted on y.shift(-h)
+    reference = processors.SolarDataProcessor(meteo_features=METEO_FEATURES).fit(frame, frame["solaire"].shift(-2).iloc[:-2])
+    assert pipeline.named_steps["processor"].last_denominator_ == reference.last_denominator_
+
+def test_booster_regressor_fits_in_memory():
+    X, y = make_solar_frame(n_hours=24 * 20)
+    model = out_of_core.LGBMBoosterRegressor(params=NATIVE_PARAMS, num_boost_round=10)
+
+    # Refittable by clone (sklearn fit contract), same booster as the Dataset path
+    refitted = clone(model).fit(X, y)
+    streamed = clone(model).fit_dataset(out_of_core.lgb.Dataset(X, label=y.to_numpy(), params={**NATIVE_PARAMS, "objective": "regression"}))
+
+    assert refitted.booster_.current_iteration() == 10
+    np.testing.assert_allclose(refitted.predict(X), streamed.predict(X))
+
+def test_out_of_core_training_pipeline(partitions, orchestrator_factory):
+    parts, _ = partitions
+    orchestrator = orchestrator_factory(async_logging=False)
+
+    models = orchestrator.run_out_of_core_training_pipeline([str(p) for p in parts.paths], sample_rows=300, n_holdout=48)
+
+    assert list(models) == ["+1h", "+2h"]
+    assert isinstance(models["+1h"].named_steps["model"], out_of_core.LGBMBoosterRegressor)
+
+def test_out_of_core_pipeline_logs_every_horizon_after_a_checkpointed_run(partitions, orchestrator_factory, tmp_path):
+    parts, _ = partitions
+    orchestrator = orchestrator_factory(async_logging=False, checkpoint_dir=str(tmp_path / "checkpoints"))
+    for horizon in (1, 2):
+        orchestrator._checkpoints.mark_logged(horizon) # Markers of a previous training
+
+    orchestrator.run_out_of_core_training_pipeline(parts.paths, sample_rows=300, n_holdout=48)
+
+    assert len(child_runs(orchestrator._training_run_id)) == 2
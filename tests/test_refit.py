@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from src.etl import processors
+from src.training import champion as champion_lookup
+from tests.conftest import METEO_FEATURES, make_solar_frame
+
+def test_update_target_scaling_matches_fit_and_keeps_meteo_scale():
+    X, y = make_solar_frame()
+    processor = processors.SolarDataProcessor(meteo_features=METEO_FEATURES).fit(X.iloc[:24 * 20], y.iloc[:24 * 20])
+    data_max = processor.meteo_scaler.data_max_.copy()
+
+    processor.update_target_scaling(y)
+    reference = processors.SolarDataProcessor(meteo_features=METEO_FEATURES).fit(X, y)
+
+    pd.testing.assert_series_equal(processor.denominator_series_, reference.denominator_series_)
+    assert processor.last_denominator_ == reference.last_denominator_
+    assert (processor.meteo_scaler.data_max_ == data_max).all()
+
+def test_refit_horizon_continues_the_champion_booster(champion):
+    orchestrator, X, y = champion
+    champion_pipeline = champion_lookup.load_champion_models(orchestrator.model_name)["+1h"]
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=1)
+    new_rows = X_h.index > champion_pipeline.named_steps["processor"].denominator_series_.index.max()
+
+    candidate = orchestrator._refit_horizon(
+        champion_pipeline, X_h.loc[new_rows], y_h.loc[new_rows], y_history=y_h, n_new_estimators=5
+    )
+
+    n_champion = champion_pipeline.named_steps["model"].booster_.current_iteration()
+    assert candidate.named_steps["model"].booster_.current_iteration() == n_champion + 5
+    assert candidate.named_steps["selector"] is champion_pipeline.named_steps["selector"]
+    assert candidate.named_steps["processor"].denominator_series_.index.max() == y_h.index.max()
+    assert candidate.predict(X_h.iloc[-3:]).shape == (3,)
+
+def test_refit_pipeline_publishes_or_rejects(champion):
+    orchestrator, X, y = champion
+    n_train = 24 * 35
+    champion_run_id = champion_lookup.champion_training_run_id(orchestrator.model_name)
+
+    accepted = orchestrator.run_refit_pipeline(X.iloc[:n_train], y.iloc[:n_train], X.iloc[n_train:], y.iloc[n_train:], n_new_estimators=5)
+
+    # A new champion version only if the holdout RMSE didn't regress
+    assert (champion_lookup.champion_training_run_id(orchestrator.model_name) != champion_run_id) is accepted
+
+def test_refit_without_new_rows_raises(champion):
+    orchestrator, X, y = champion
+    n_train = 24 * 30
+
+    with pytest.raises(ValueError, match="No new rows"):
+        orchestrator.run_refit_pipeline(X.iloc[:n_train], y.iloc[:n_train], X.iloc[n_train:], y.iloc[n_train:])
+
+def test_refit_after_checkpointed_training_logs_horizon_runs(orchestrator_factory, tmp_path):
+    X, y = make_solar_frame()
+    n_train = 24 * 30
+    orchestrator = orchestrator_factory(async_logging=False, checkpoint_dir=str(tmp_path / "checkpoints"))
+    orchestrator.run_training_pipeline(X.iloc[:n_train], y.iloc[:n_train])
+    orchestrator.package_and_log_meta_model(X_sample=X.iloc[:3])
+    orchestrator._evaluate_pipeline = lambda pipeline, X_h, y_h: 1.0 # Candidate always accepted
+
+    assert orchestrator.run_refit_pipeline(X.iloc[:24 * 35], y.iloc[:24 * 35], X.iloc[24 * 35:], y.iloc[24 * 35:], n_new_estimators=5)
+
+    # The markers of the first training don't hide the refit horizons
+    assert sorted(champion_lookup.load_champion_horizon_runs(orchestrator.model_name)) == [1, 2]
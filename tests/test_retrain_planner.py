@@ -0,0 +1,53 @@
+import numpy as np
+
+from src.training import champion as champion_lookup
+from src.training.retrain_planner import RetrainPlanner
+from src.utils import metrics
+
+def test_psi_zero_on_same_distribution_and_high_on_shift():
+    rng = np.random.default_rng(0)
+    reference = rng.normal(size=5000)
+
+    assert metrics.psi(reference, reference) == 0.0
+    assert metrics.psi(reference, rng.normal(size=5000)) < 0.05
+    assert metrics.psi(reference, rng.normal(loc=2, size=5000)) > 1
+    assert metrics.psi(np.ones(100), reference) == 0.0 # Constant feature
+
+def test_planner_keeps_champion_without_drift(champion):
+    orchestrator, X, y = champion
+    n_train = 24 * 30
+
+    planner = RetrainPlanner(psi_threshold=np.inf, rmse_ratio_threshold=np.inf)
+    retrained = orchestrator.run_drift_retrain_pipeline(X.iloc[:n_train], y.iloc[:n_train], X.iloc[n_train:], y.iloc[n_train:], planner=planner)
+
+    assert retrained == []
+
+def test_planner_retrains_drifted_horizons(champion):
+    orchestrator, X, y = champion
+    n_train = 24 * 30
+    champion_run_id = champion_lookup.champion_training_run_id(orchestrator.model_name)
+
+    # Every positive PSI counts as drift
+    planner = RetrainPlanner(psi_threshold=0.0, rmse_ratio_threshold=np.inf)
+    retrained = orchestrator.run_drift_retrain_pipeline(X, y, X.iloc[n_train:], y.iloc[n_train:], planner=planner)
+
+    assert retrained == [1, 2]
+    assert champion_lookup.champion_training_run_id(orchestrator.model_name) != champion_run_id
+
+def test_missing_champion_horizon_always_retrained(champion):
+    orchestrator, X, y = champion
+    models = champion_lookup.load_champion_models(orchestrator.model_name)
+    X_h, y_h = orchestrator._prepare_horizon_data(X, y, horizon=1)
+
+    reports = RetrainPlanner(psi_threshold=np.inf, rmse_ratio_threshold=np.inf).plan(
+        champion_models={"+1h": models["+1h"]},
+        champion_runs={1: {"best_rmse": 1.0}},
+        horizon_data={
+            1: {"X_reference": X_h.iloc[:500], "X_recent": X_h.iloc[500:], "y_recent": y_h.iloc[500:]},
+            3: {"X_reference": X_h.iloc[:500], "X_recent": X_h.iloc[500:], "y_recent": y_h.iloc[500:]},
+        },
+    )
+
+    assert reports[3].retrain
+    assert not reports[1].retrain
+    assert reports[1].rmse_ratio == reports[1].recent_rmse
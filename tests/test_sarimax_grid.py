@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.training import engine
+from src.utils.threads import ThreadBudget
+
+PARAMS = {"p": 1, "d": 0, "q": 0, "P": 0, "D": 0, "Q": 0}
+
+def make_series(n_rows: int = 120, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2025-06-01", periods=n_rows, freq="h")
+    X = pd.DataFrame({"shortwave_radiation": np.clip(np.sin(np.arange(n_rows) / 24 * 2 * np.pi), 0, None)}, index=index)
+    y = pd.Series(3 * X["shortwave_radiation"].to_numpy() + rng.normal(0, 0.1, n_rows), index=index, name="solaire")
+    return X, y
+
+@pytest.fixture
+def sarimax_worker():
+    X, y = make_series()
+    engine._init_sarimax_worker(X, y, ThreadBudget(total_threads=1).allocate("process_pool"))
+    yield X, y
+    engine._SARIMAX_STATE["limits"].restore_original_limits()
+    engine._SARIMAX_STATE.clear()
+
+@pytest.mark.parametrize("refit_folds", [True, False])
+def test_candidate_scored_on_expanding_folds(sarimax_worker, refit_folds):
+    params, score = engine._score_sarimax_candidate(PARAMS, [(60, 80), (80, 100), (100, 120)], seasonal_period=4, refit_folds=refit_folds)
+
+    assert params == PARAMS
+    assert np.isfinite(score) and score < 1
+
+def test_grid_returns_best_candidate():
+    X, y = make_series()
+
+    best_rmse, best_params = engine.train_sarimax_grid(
+        X, y, nb_cv_splits=2, n_workers=2, refit_folds=False, seasonal_period=4,
+        thread_budget=ThreadBudget(total_threads=2),
+    )
+
+    assert np.isfinite(best_rmse)
+    assert set(best_params) == {"p", "d", "q", "P", "D", "Q"}
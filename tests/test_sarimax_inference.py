@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.sarimax_inference_pipeline import SarimaxInferenceJob
+
+BEST_PARAMS = {"p": 1, "d": 0, "q": 0, "P": 0, "D": 0, "Q": 0}
+
+def make_dataset(n_rows: int = 24 * 8, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2025-06-01", periods=n_rows, freq="h")
+    radiation = np.clip(np.sin((index.hour.to_numpy() - 6) / 12 * np.pi), 0, None)
+    return pd.DataFrame({
+        "solaire": 3 * radiation + rng.normal(0, 0.1, n_rows),
+        "shortwave_radiation": radiation,
+    }, index=index)
+
+@pytest.fixture
+def job(tmp_path):
+    dataset = make_dataset()
+    train = dataset.iloc[:24 * 5]
+    return SarimaxInferenceJob.from_training(
+        tmp_path / "sarimax.joblib",
+        X=train[["shortwave_radiation"]],
+        y=train["solaire"],
+        best_params=BEST_PARAMS,
+        n_horizons=6,
+        refit_every=48,
+    ), dataset
+
+def test_hourly_update_keeps_parameters(job):
+    job, dataset = job
+    params = job._results.params.copy()
+
+    predictions = job.run(dataset.iloc[:24 * 5 + 3], exog_future=dataset[["shortwave_radiation"]].iloc[24 * 5 + 3:])
+
+    assert job.last_timestamp == dataset.index[24 * 5 + 2]
+    pd.testing.assert_series_equal(job._results.params, params)
+    assert list(predictions.columns) == [f"+{h}h" for h in range(1, 7)]
+    assert predictions.index[0] == job.last_timestamp
+
+def test_state_reloaded_by_a_new_job(job):
+    job, dataset = job
+    job.run(dataset.iloc[:24 * 5 + 1], exog_future=dataset[["shortwave_radiation"]].iloc[24 * 5 + 1:])
+
+    reloaded = SarimaxInferenceJob(job.state_path, n_horizons=6, refit_every=48).load()
+
+    assert reloaded.last_timestamp == job.last_timestamp
+    assert reloaded._hours_since_refit == 1
+
+def test_scheduled_reestimation(job):
+    job, dataset = job
+    params = job._results.params.copy()
+
+    job.update(dataset.iloc[:24 * 7]) # 48 new hours = refit_every
+
+    assert job._hours_since_refit == 0
+    assert not job._results.params.equals(params)
+    assert job._results.nobs == 24 * 7
+
+def test_update_errors(job):
+    job, dataset = job
+
+    assert job.update(dataset.iloc[:24 * 5]) == 0 # Nothing new
+    with pytest.raises(ValueError, match="new rows start"):
+        job.update(dataset.iloc[24 * 5 + 2:])
+    with pytest.raises(ValueError, match="missing exogenous"):
+        job.update(dataset.iloc[:24 * 5 + 2].assign(shortwave_radiation=np.nan))
+    with pytest.raises(ValueError, match="future exogenous"):
+        job.forecast(exog_future=None)
+
+def test_late_targets_are_backfilled(job):
+    job, dataset = job
+    n_train = 24 * 5
+    params = job._results.params.copy()
+
+    job.update(dataset.iloc[:n_train + 3].assign(solaire=lambda df: df["solaire"].where(df.index < df.index[n_train]))) # Not yet published
+    assert job._history["solaire"].isna().sum() == 3
+
+    assert job.update(dataset.iloc[:n_train + 4]) == 1 # Published one hour later
+
+    assert job._history["solaire"].notna().all()
+    assert not np.isnan(job._results.model.endog).any()
+    pd.testing.assert_series_equal(job._results.params, params)
+
+    on_time = SarimaxInferenceJob.from_training(
+        job.state_path.with_name("on_time.joblib"),
+        X=dataset[["shortwave_radiation"]].iloc[:n_train],
+        y=dataset["solaire"].iloc[:n_train],
+        best_params=BEST_PARAMS,
+        n_horizons=6,
+        refit_every=48,
+    )
+    on_time.update(dataset.iloc[:n_train + 4])
+    exog_future = dataset[["shortwave_radiation"]].iloc[n_train + 4:]
+    pd.testing.assert_frame_equal(job.forecast(exog_future), on_time.forecast(exog_future))
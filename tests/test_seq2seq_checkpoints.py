@@ -0,0 +1,96 @@
+import pytest
+import torch
+import torch.nn as nn
+
+from src.training import engine
+from tests.conftest import make_seq2seq, make_seq2seq_loaders
+
+def train(model, num_epochs, n_hours=24 * 15, **kwargs):
+    train_dl, val_dl = make_seq2seq_loaders(n_hours=n_hours)
+    return engine.train_seq2seq(
+        model=model,
+        train_dataloader=train_dl,
+        val_dataloader=val_dl,
+        criterion=nn.MSELoss(),
+        optimizer=torch.optim.Adam(model.parameters(), lr=1e-2),
+        device=torch.device("cpu"),
+        num_epochs=num_epochs,
+        **kwargs,
+    )
+
+def crash_at_epoch(monkeypatch, crash_epoch):
+    step = engine.EarlyStopping.step
+
+    def crashing_step(self, val_loss, model=None, epoch=0):
+        if epoch == crash_epoch:
+            raise RuntimeError("node lost")
+        return step(self, val_loss, model=model, epoch=epoch)
+
+    monkeypatch.setattr(engine.EarlyStopping, "step", crashing_step)
+
+def test_interrupted_training_resumes_from_checkpoint(tmp_path, monkeypatch):
+    checkpoint_path = tmp_path / "seq2seq.pt"
+    with monkeypatch.context() as patch:
+        crash_at_epoch(patch, crash_epoch=2)
+        with pytest.raises(RuntimeError, match="node lost"):
+            train(make_seq2seq(), num_epochs=4, checkpoint_path=checkpoint_path)
+    checkpoint = torch.load(checkpoint_path, weights_only=False)
+    assert checkpoint["epoch"] == 1
+    assert list(tmp_path.iterdir()) == [checkpoint_path] # Atomic writes, no temporary file left
+
+    # New process : fresh model and optimizer, same checkpoint
+    train_losses, val_losses = train(make_seq2seq(seed=1), num_epochs=4, checkpoint_path=checkpoint_path)
+
+    assert train_losses[:2] == checkpoint["train_losses"]
+    assert len(train_losses) == len(val_losses) == 4
+    assert not checkpoint_path.exists() # Finished run : nothing left to resume
+
+def test_finished_training_is_not_resumed(tmp_path, monkeypatch):
+    checkpoint_path = tmp_path / "seq2seq.pt"
+    first_losses, _ = train(make_seq2seq(), num_epochs=2, checkpoint_path=checkpoint_path)
+
+    epochs = []
+    step = engine.EarlyStopping.step
+    monkeypatch.setattr(engine.EarlyStopping, "step", lambda self, *args, **kwargs: epochs.append(kwargs["epoch"]) or step(self, *args, **kwargs))
+    second_losses, _ = train(make_seq2seq(), num_epochs=2, checkpoint_path=checkpoint_path)
+
+    assert epochs == [0, 1] # Trained again from scratch
+    assert second_losses == first_losses # Same seed
+
+def test_checkpoint_of_another_run_is_ignored(tmp_path, monkeypatch):
+    checkpoint_path = tmp_path / "seq2seq.pt"
+    with monkeypatch.context() as patch:
+        crash_at_epoch(patch, crash_epoch=1)
+        with pytest.raises(RuntimeError, match="node lost"):
+            train(make_seq2seq(), num_epochs=3, checkpoint_path=checkpoint_path)
+
+    # Other data : the checkpoint is not resumed
+    train_losses, _ = train(make_seq2seq(), num_epochs=3, n_hours=24 * 16, checkpoint_path=checkpoint_path)
+    reference, _ = train(make_seq2seq(), num_epochs=3, n_hours=24 * 16)
+
+    assert train_losses == reference
+
+def test_best_validation_weights_restored():
+    model = nn.Linear(2, 1)
+    early_stopping = engine.EarlyStopping(patience=2)
+
+    early_stopping.step(1.0, model=model, epoch=0)
+    best_weight = model.weight.detach().clone()
+    with torch.no_grad():
+        model.weight.add_(1.0)
+    early_stopping.step(2.0, model=model, epoch=1)
+
+    assert early_stopping.best_epoch == 0
+    assert early_stopping.restore_best(model)
+    torch.testing.assert_close(model.weight, best_weight)
+
+def test_early_stopping_state_round_trip():
+    early_stopping = engine.EarlyStopping(patience=1)
+    early_stopping.step(1.0, epoch=0)
+    early_stopping.step(1.5, epoch=1)
+
+    restored = engine.EarlyStopping(patience=1)
+    restored.load_state_dict(early_stopping.state_dict())
+
+    assert restored.should_stop and restored.best_epoch == 0
+    assert not engine.EarlyStopping().restore_best(nn.Linear(2, 1)) # No snapshot yet
@@ -0,0 +1,59 @@
+import pytest
+import torch
+import torch.nn as nn
+
+from src.training import engine
+from tests.conftest import make_seq2seq, make_seq2seq_loaders
+
+def train(model, num_epochs=3, **kwargs):
+    train_dl, val_dl = make_seq2seq_loaders()
+    return engine.train_seq2seq(
+        model=model,
+        train_dataloader=train_dl,
+        val_dataloader=val_dl,
+        criterion=nn.MSELoss(),
+        optimizer=torch.optim.Adam(model.parameters(), lr=1e-2),
+        device=torch.device("cpu"),
+        num_epochs=num_epochs,
+        **kwargs,
+    )
+
+def test_eager_training_losses():
+    train_losses, val_losses = train(make_seq2seq(), num_epochs=3)
+
+    assert len(train_losses) == len(val_losses) == 3
+    assert train_losses[-1] < train_losses[0]
+
+def test_validation_period_keeps_last_epoch():
+    train_losses, val_losses = train(make_seq2seq(), num_epochs=5, validate_every=2)
+
+    # Epochs 2, 4 and the last one
+    assert len(train_losses) == 5
+    assert len(val_losses) == 3
+
+def test_script_mode_shares_the_eager_parameters():
+    model = make_seq2seq()
+    before = [p.detach().clone() for p in model.parameters()]
+
+    train(model, num_epochs=1, compile_mode="script")
+
+    assert any(not torch.equal(b, p) for b, p in zip(before, model.parameters()))
+
+def test_unknown_compile_mode_rejected():
+    with pytest.raises(ValueError, match="compile_mode"):
+        train(make_seq2seq(), num_epochs=1, compile_mode="jit")
+
+def test_bf16_falls_back_without_native_kernels(monkeypatch):
+    monkeypatch.setattr(engine, "_bf16_autocast_supported", lambda device: False)
+
+    train_losses, _ = train(make_seq2seq(), num_epochs=1, use_bf16=True)
+
+    assert len(train_losses) == 1
+
+def test_num_threads_applied():
+    previous = torch.get_num_threads()
+    try:
+        train(make_seq2seq(), num_epochs=1, num_threads=1)
+        assert torch.get_num_threads() == 1
+    finally:
+        torch.set_num_threads(previous)
@@ -0,0 +1,102 @@
+import pytest
+import torch
+from threadpoolctl import threadpool_info, threadpool_limits
+
+from src.training import engine, pipelines
+from src.utils.config import settings
+from src.utils.threads import ThreadAllocation, ThreadBudget
+from tests.conftest import METEO_FEATURES, make_solar_frame
+
+def test_allocation_by_mode():
+    budget = ThreadBudget(total_threads=8, optuna_workers=4)
+
+    sequential = budget.allocate("sequential")
+    assert (sequential.optuna_n_jobs, sequential.lgbm_n_jobs) == (4, 2)
+
+    pool = budget.allocate("process_pool", n_workers=3)
+    assert (pool.optuna_n_jobs, pool.lgbm_n_jobs, pool.blas_threads) == (1, 2, 2)
+
+    assert budget.allocate("torch").torch_threads == 8
+    with pytest.raises(ValueError, match="parallel mode"):
+        budget.allocate("gpu")
+
+def test_budget_from_settings(solar_settings):
+    budget = ThreadBudget.from_settings(solar_settings)
+
+    assert budget.total_threads == 2
+    assert budget.optuna_workers == 1
+
+def test_engine_defaults_to_the_settings_budget(monkeypatch):
+    monkeypatch.setattr(settings, "training_total_threads", 3)
+    monkeypatch.setattr(settings, "training_optuna_workers", 1)
+    allocations = []
+    allocate = ThreadBudget.allocate
+
+    def record(self, mode="sequential", n_workers=1):
+        allocations.append((self.total_threads, mode))
+        return allocate(self, mode, n_workers)
+
+    monkeypatch.setattr(ThreadBudget, "allocate", record)
+    X, y = make_solar_frame(n_hours=24 * 20)
+    engine.train_lightgbm(
+        X, y,
+        meteo_features=METEO_FEATURES,
+        nb_cv_splits=2,
+        num_trials=1,
+        selector_parameters={"lgbm_params": {"n_estimators": 10, "verbosity": -1}, "threshold": 0.95, "horizons": [1]},
+        max_boost_rounds=10,
+        early_stopping_rounds=2,
+    )
+
+    assert allocations == [(3, "sequential")]
+
+def blas_limits():
+    return sorted((pool["filepath"], pool["num_threads"]) for pool in threadpool_info())
+
+def test_lstm_pipeline_restores_thread_limits_on_failure(monkeypatch):
+    def failing_training(**kwargs):
+        assert all(n == 1 for _, n in blas_limits()) # Budget applied during training
+        raise RuntimeError("training failed")
+
+    monkeypatch.setattr(engine, "train_seq2seq", failing_training)
+    X, y = make_solar_frame(n_hours=24 * 20)
+
+    # Known process state (OpenMP limits are per thread, earlier tests may have changed them)
+    torch.set_num_threads(2)
+    with threadpool_limits(limits=2):
+        before = blas_limits()
+        with pytest.raises(RuntimeError, match="training failed"):
+            pipelines.run_lstm_pipeline(
+                X, y,
+                meteo_features=METEO_FEATURES,
+                encoder_features=["shortwave_radiation"],
+                decoder_features=["shortwave_radiation", "cloud_cover"],
+                lstm_params={
+                    "seq_length": 24, "output_len": 6, "batch_size": 16, "stride": 6, "num_epochs": 1,
+                    "hidden_size": 8, "num_layers": 1, "dropout": 0.0,
+                },
+                thread_budget=ThreadBudget(total_threads=1),
+            )
+
+        assert blas_limits() == before
+
+def test_worker_restores_thread_limits(orchestrator_factory, tmp_path, monkeypatch):
+    X, y = make_solar_frame(n_hours=24 * 20)
+    orchestrator = orchestrator_factory(num_trials=1)
+    orchestrator.threads = ThreadAllocation(1, 1, 1, 1)
+    monkeypatch.setattr(orchestrator, "_load_champion_runs", lambda: None)
+
+    applied = []
+    def crash(horizon):
+        applied.append(blas_limits())
+        raise RuntimeError("node lost")
+    monkeypatch.setattr(orchestrator, "_selector_parameters_for", crash)
+
+    torch.set_num_threads(2)
+    with threadpool_limits(limits=2):
+        before = blas_limits()
+        with pytest.raises(RuntimeError, match="node lost"):
+            orchestrator.run_worker(X, y, workspace_dir=str(tmp_path / "workspace"))
+
+        assert all(n == 1 for _, n in applied[0]) # Budget applied while the worker runs
+        assert blas_limits() == before
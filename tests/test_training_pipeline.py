@@ -0,0 +1,69 @@
+import pytest
+import mlflow
+from mlflow.tracking import MlflowClient
+
+from src.utils import logging_utils
+from tests.conftest import make_solar_frame
+
+def child_runs(parent_run_id: str):
+    return MlflowClient().search_runs(
+        [mlflow.get_experiment_by_name("tests").experiment_id],
+        filter_string=f"tags.mlflow.parentRunId = '{parent_run_id}'",
+    )
+
+def test_run_training_pipeline_async_logging_end_to_end(orchestrator_factory):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(async_logging=True)
+
+    models = orchestrator.run_training_pipeline(X, y)
+
+    assert list(models) == ["+1h", "+2h"]
+    assert mlflow.active_run() is None
+
+    # Parent closed after the queued child runs were sent
+    client = MlflowClient()
+    parent = client.get_run(orchestrator._training_run_id)
+    assert parent.info.status == "FINISHED"
+    assert parent.info.run_name == "MultiHorizon_Training_Pipeline"
+
+    children = child_runs(orchestrator._training_run_id)
+    assert sorted(run.info.run_name for run in children) == ["+1h_short", "+2h_short"]
+    for run in children:
+        assert run.info.status == "FINISHED"
+        assert "best_rmse_val" in run.data.metrics
+        assert any(artifact.path == "model" for artifact in client.list_artifacts(run.info.run_id))
+
+    # Logged horizon pipeline reloads and predicts
+    model = mlflow.sklearn.load_model(f"runs:/{children[0].info.run_id}/model")
+    assert len(model.predict(X.iloc[:5])) == 5
+
+def test_run_training_pipeline_sync_logging(orchestrator_factory):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(async_logging=False)
+
+    orchestrator.run_training_pipeline(X, y)
+
+    assert orchestrator._async_logger is None
+    assert len(child_runs(orchestrator._training_run_id)) == 2
+
+def test_async_logger_flush_raises_job_errors():
+    async_logger = logging_utils.AsyncMlflowLogger()
+
+    def failing_job():
+        raise ValueError("upload failed")
+
+    async_logger.submit(failing_job)
+    with pytest.raises(RuntimeError, match="upload failed"):
+        async_logger.flush()
+    async_logger.close()
+
+def test_parallel_horizons_logged_in_horizon_order(orchestrator_factory):
+    X, y = make_solar_frame()
+    orchestrator = orchestrator_factory(async_logging=False)
+
+    models = orchestrator.run_training_pipeline(X, y, n_workers=2)
+
+    # Horizon order kept for the meta model, every horizon logged under the parent run
+    assert list(models) == ["+1h", "+2h"]
+    assert sorted(run.info.run_name for run in child_runs(orchestrator._training_run_id)) == ["+1h_short", "+2h_short"]
+    assert models["+2h"].predict(X.iloc[:3]).shape == (3,)